@@ -21,7 +21,9 @@ wsl bash -c "rsync -avu --delete --exclude='__pycache__' --exclude='*.pyc' /mnt/
 wsl bash -c "rsync -avu --delete --exclude='__pycache__' --exclude='*.pyc' /mnt/e/Omnipet/components/ $WSLBuildDir/components/"
 wsl bash -c "rsync -avu --delete --exclude='__pycache__' --exclude='*.pyc' /mnt/e/Omnipet/scenes/ $WSLBuildDir/scenes/"
 wsl bash -c "cp /mnt/e/Omnipet/vpet.py $WSLBuildDir/vpet.py"
+wsl bash -c "cd /mnt/e/Omnipet && python3 -m core.utils.sprite_atlas"
 wsl bash -c "rsync -avu --delete /mnt/e/Omnipet/assets/ $WSLBuildDir/assets/"
+wsl bash -c "cd /mnt/e/Omnipet && python3 -m core.utils.module_cache modules"
 wsl bash -c "rsync -avu --delete /mnt/e/Omnipet/modules/ $WSLBuildDir/modules/"
 wsl bash -c "rsync -avu --delete /mnt/e/Omnipet/config/ $WSLBuildDir/config/"
 wsl bash -c "rsync -avu --delete /mnt/e/Omnipet/save/ $WSLBuildDir/save/"
@@ -189,6 +189,12 @@ Get-ChildItem "$PROJECT_ROOT" -Include "*.dll", "*.pyd", "*.so" | ForEach-Object
 
 Write-Status "Copied all compiled dependencies"
 
+# Pack pet sprite atlases for assets and modules
+Write-Status "Packing sprite atlases..."
+Push-Location $PROJECT_ROOT
+python -m core.utils.sprite_atlas
+Pop-Location
+
 # Copy additional assets and files
 Write-Status "Copying additional assets..."
 Copy-Item (Join-Path $PROJECT_ROOT "assets") "$TEMP_DIR\$BUILD_NAME\" -Recurse
@@ -211,6 +217,12 @@ try {
 Write-Status "Copying documentation..."
 Copy-Item -Recurse (Join-Path $PROJECT_ROOT "Documentation") "$TEMP_DIR\$BUILD_NAME\" -Force
 
+# Prebuild module caches so the first launch does not parse module JSON
+Write-Status "Prebuilding module caches..."
+Push-Location $PROJECT_ROOT
+python -m core.utils.module_cache modules
+Pop-Location
+
 # Copy modules
 Write-Status "Copying modules..."
 Copy-Item -Recurse (Join-Path $PROJECT_ROOT "modules") "$TEMP_DIR\$BUILD_NAME\" -Force
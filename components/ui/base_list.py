@@ -13,6 +13,7 @@ import math
 from components.ui.component import UIComponent
 from core import runtime_globals
 from core.utils.pygame_utils import blit_with_cache
+from core.utils.text_cache import text_cache
 
 
 class BaseList(UIComponent):
@@ -782,13 +783,13 @@ class BaseList(UIComponent):
             if hasattr(item, 'name'):
                 font = self.get_font("text")
                 if font:
-                    text_surface = font.render(str(item.name), True, text_color)
+                    text_surface = text_cache.render(font, str(item.name), text_color)
                     text_rect = text_surface.get_rect(center=item_rect.center)
                     blit_with_cache(surface, text_surface, text_rect.topleft)
             elif isinstance(item, (str, int, float)):
                 font = self.get_font("text")
                 if font:
-                    text_surface = font.render(str(item), True, text_color)
+                    text_surface = text_cache.render(font, str(item), text_color)
                     text_rect = text_surface.get_rect(center=item_rect.center)
                     blit_with_cache(surface, text_surface, text_rect.topleft)
                     
@@ -2,7 +2,8 @@ import pygame
 
 from components.ui.component import UIComponent
 from core import runtime_globals
-from core.utils.sprite_utils import load_pet_sprites
+from core.utils.sprite_cache import sprite_cache
+from core.utils.sprite_prefetch import PRIORITY_MARGIN, PRIORITY_VISIBLE, sprite_prefetcher
 from core.utils.module_utils import get_module
 from core.utils.pygame_utils import blit_with_cache, blit_with_shadow
 import core.constants as constants
@@ -14,7 +15,8 @@ class DigidexList(UIComponent):
 
     Responsibilities:
     - Render a scrollable vertical list of pets with sprites
-    - Manage on-demand sprite loading with LRU window
+    - Manage on-demand sprite loading with LRU window (loaded in the background,
+      visible rows first, unknown sprite as placeholder)
     - Provide navigation buttons (UP/DOWN icons, Tree, Back)
     - Support drag scrolling
     """
@@ -33,6 +35,11 @@ class DigidexList(UIComponent):
         self.scroll_offset = 0
         self.hover_index = -1  # Mouse hover tracking
         
+        # Background sprite loading
+        self._pending_sprites = set()  # Indexes showing the placeholder while their sprite loads
+        self._prefetch_scroll = 0
+        self._prefetch_generation = -1
+        
         # Drag state
         self._is_dragging = False
         self._drag_start_pos = None
@@ -40,7 +47,14 @@ class DigidexList(UIComponent):
         self._drag_accumulated = 0
 
     def set_pets(self, pets):
+        # Placeholders of the previous list would otherwise never be replaced
+        for i in self._pending_sprites:
+            if i < len(self.pets) and self.pets[i].sprite is self.unknown_sprite:
+                self.pets[i].sprite = None
+        self._pending_sprites.clear()
+        sprite_prefetcher.cancel(self)
         self.pets = pets
+        self._last_scroll = -1  # Load the new rows on the next update
         self.selected_index = min(self.selected_index, len(pets) - 1) if pets else 0
         self.needs_redraw = True
 
@@ -69,36 +83,60 @@ class DigidexList(UIComponent):
         # Cache from scroll offset minus buffer to scroll offset plus visible + buffer
         min_index = max(0, self.scroll_offset - SPRITE_BUFFER)
         max_index = min(len(self.pets), self.scroll_offset + max_visible + SPRITE_BUFFER)
+        visible_end = self.scroll_offset + max_visible
+
+        # Re-queue from scratch when the window moved; rows that left it are dropped
+        scroll_direction = self.scroll_offset - self._prefetch_scroll
+        if scroll_direction:
+            sprite_prefetcher.cancel(self)
+            self._prefetch_scroll = self.scroll_offset
 
         for i, pet in enumerate(self.pets):
             if i < min_index or i >= max_index:
                 # Don't unload sprites for unknown pets (they use unknown_sprite)
                 if pet.sprite and pet.sprite != self.unknown_sprite:
                     pet.sprite = None
-            else:
-                if not pet.sprite:
-                    if pet.known:
-                        # Load actual sprite for known pets
-                        try:
-                            module = get_module(pet.module)
-                            module_path = f"modules/{module.name}"
-                            sprites_dict = load_pet_sprites(
-                                pet.name,
-                                module_path,
-                                module.name_format,
-                                module_high_definition_sprites=module.high_definition_sprites,
-                                size=(self.sprite_size, self.sprite_size),
-                            )
-                            if "0" in sprites_dict:
-                                pet.sprite = sprites_dict["0"]
-                            else:
-                                pet.sprite = self.unknown_sprite
-                        except Exception as e:
-                            runtime_globals.game_console.log(f"[DigidexList] Failed to load sprite {pet.name}: {e}")
-                    else:
-                        # Unknown pet - set unknown sprite
-                        pet.sprite = self.unknown_sprite
-                        pet.sprite = self.unknown_sprite
+                if i in self._pending_sprites:
+                    self._pending_sprites.discard(i)
+                    pet.sprite = None
+            elif pet.known:
+                # Known pets showing the placeholder may still be loading (here or in the tree view)
+                if pet.sprite and pet.sprite is not self.unknown_sprite:
+                    continue
+                # Visible rows first, then the margin in the scroll direction, then the other side
+                if self.scroll_offset <= i < visible_end:
+                    priority = PRIORITY_VISIBLE
+                elif i >= visible_end:
+                    priority = PRIORITY_MARGIN + i - visible_end + (0 if scroll_direction >= 0 else SPRITE_BUFFER)
+                else:
+                    priority = PRIORITY_MARGIN + self.scroll_offset - 1 - i + (0 if scroll_direction < 0 else SPRITE_BUFFER)
+                try:
+                    module = get_module(pet.module)
+                    module_path = f"modules/{module.name}"
+                    # Only frame 0 is decoded; the shared sprite cache makes scrolling back free
+                    sprites = sprite_prefetcher.request(
+                        pet.name,
+                        module_path,
+                        module.name_format,
+                        module_high_definition_sprites=module.high_definition_sprites,
+                        size=(self.sprite_size, self.sprite_size),
+                        frames=("0",),
+                        priority=priority,
+                        owner=self,
+                    )
+                except Exception as e:
+                    runtime_globals.game_console.log(f"[DigidexList] Failed to load sprite {pet.name}: {e}")
+                    sprites = {}
+                if sprites is None:
+                    # Still loading - show the placeholder
+                    pet.sprite = self.unknown_sprite
+                    self._pending_sprites.add(i)
+                else:
+                    pet.sprite = sprites.get("0") or self.unknown_sprite
+                    self._pending_sprites.discard(i)
+            elif not pet.sprite:
+                # Unknown pet - set unknown sprite
+                pet.sprite = self.unknown_sprite
 
     def update(self):
         super().update()
@@ -120,6 +158,13 @@ class DigidexList(UIComponent):
             self._last_scroll = self.scroll_offset
             # Only update sprite cache when selection or scroll changes
             self.update_sprite_cache()
+        elif self._pending_sprites:
+            # Pick up sprites finished by the background loader
+            sprite_prefetcher.poll()
+            if sprite_prefetcher.generation != self._prefetch_generation:
+                self._prefetch_generation = sprite_prefetcher.generation
+                self.update_sprite_cache()
+                self.needs_redraw = True
 
     def handle_mouse_hover(self):
         """Handle mouse hover for highlighting list items (separate from keyboard focus)"""
@@ -458,7 +503,7 @@ class DigidexList(UIComponent):
             
             # Draw sprite
             if pet.sprite:
-                scaled_sprite = pygame.transform.scale(pet.sprite, (icon_size, icon_size))
+                scaled_sprite = sprite_cache.get_scaled(pet.sprite, (icon_size, icon_size))
                 blit_with_cache(surface, scaled_sprite, (list_x + left_padding, y_pos + int(5 * ui_scale)))
             
             # Draw name and info with shadow
@@ -4,7 +4,7 @@ import pygame
 from components.ui.component import UIComponent
 from core import runtime_globals
 from core.utils.pygame_utils import blit_with_shadow, get_font
-from core.utils.sprite_utils import load_pet_sprites
+from core.utils.sprite_prefetch import sprite_prefetcher
 from core.utils.module_utils import get_module
 import core.constants as constants
 from components.ui.ui_constants import BASE_RESOLUTION
@@ -38,6 +38,10 @@ class DigidexTree(UIComponent):
         self.tree_surface = None
         self.tree_surface_offset = (0, 0)  # Where (0,0) of tree is on the surface
         self.needs_tree_rebuild = True
+        
+        # Background sprite loading
+        self._pending_sprites = False
+        self._prefetch_generation = -1
 
     def set_pets(self, pets):
         self.pets = pets
@@ -103,28 +107,35 @@ class DigidexTree(UIComponent):
         runtime_globals.game_console.log(f"[DigidexTree] Built tree with {len(self.tree_node_pos)} nodes across {len(stages)} stages")
 
     def _load_all_tree_sprites(self):
-        """Load all sprites for the current tree (called once when tree is built)"""
+        """
+        Request sprites for every node of the current tree. Sprites still loading in the
+        background show the unknown sprite until update() rebuilds the tree surface.
+        """
         visible_names = set(self.tree_node_pos.keys() if self.tree_root else [])
+        self._pending_sprites = False
 
         for pet in self.pets:
-            if pet.name in visible_names and not pet.sprite and pet.known:
+            if pet.name in visible_names and pet.known and (not pet.sprite or pet.sprite is self.unknown_sprite):
                 try:
                     module = get_module(pet.module)
                     module_path = f"modules/{module.name}"
-                    sprites_dict = load_pet_sprites(
+                    sprites = sprite_prefetcher.request(
                         pet.name,
                         module_path,
                         module.name_format,
                         module_high_definition_sprites=module.high_definition_sprites,
                         size=(self.sprite_size, self.sprite_size),
+                        frames=("0",),
+                        owner=self,
                     )
-                    if "0" in sprites_dict:
-                        pet.sprite = sprites_dict["0"]
-                    else:
-                        pet.sprite = self.unknown_sprite
                 except Exception as e:
                     runtime_globals.game_console.log(f"[DigidexTree] Failed to load sprite {pet.name}: {e}")
+                    sprites = {}
+                if sprites is None:
+                    self._pending_sprites = True
                     pet.sprite = self.unknown_sprite
+                else:
+                    pet.sprite = sprites.get("0") or self.unknown_sprite
 
     def update(self):
         super().update()
@@ -140,6 +151,15 @@ class DigidexTree(UIComponent):
                 runtime_globals.game_console.log(f"[DigidexTree] Could not center on {getattr(self, 'selected_pet_name', 'UNKNOWN')}, defaulting to (0,0)")
                 runtime_globals.game_console.log(f"[DigidexTree] Available positions: {list(self.tree_node_pos.keys())}")
             self.needs_tree_rebuild = False
+            self._prefetch_generation = sprite_prefetcher.generation
+        elif self.tree_root and self._pending_sprites:
+            # Redraw the tree as background-loaded sprites arrive
+            sprite_prefetcher.poll()
+            if sprite_prefetcher.generation != self._prefetch_generation:
+                self._prefetch_generation = sprite_prefetcher.generation
+                self._load_all_tree_sprites()
+                self._build_tree_surface()
+                self.needs_redraw = True
 
     def handle_event(self, event):
         # Debug logging
@@ -40,13 +40,17 @@ class FreezerGrid(Grid):
                     if pet:
                         # Get pet sprite
                         sprite = None
+                        sprite_request = None
                         if pet in runtime_globals.pet_sprites:
                             sprite_list = runtime_globals.pet_sprites[pet]
                             if sprite_list:
                                 sprite = sprite_list[0]
+                        else:
+                            # Load just the thumbnail in the background
+                            sprite_request = self._thumbnail_request(pet)
                         
                         # Create grid item with pet data
-                        item = GridItem(sprite=sprite, text="", data=pet)
+                        item = GridItem(sprite=sprite, text="", data=pet, sprite_request=sprite_request)
                         items.append(item)
                     else:
                         # Empty slot
@@ -57,6 +61,20 @@ class FreezerGrid(Grid):
         
         self.set_items(items)
         
+    def _thumbnail_request(self, pet):
+        """Prefetcher arguments for frame 0 of a pet at party sprite size, or None if its module is missing."""
+        module = runtime_globals.game_modules.get(pet.module)
+        if not module:
+            return None
+        return {
+            "pet_name": pet.name,
+            "module_path": module.folder_path,
+            "name_format": module.name_format,
+            "size": (runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT),
+            "module_high_definition_sprites": module.high_definition_sprites,
+            "frames": ("0",),
+        }
+        
     def render(self):
         """Render the freezer grid with attribute-colored backgrounds"""
         from core import runtime_globals
@@ -6,14 +6,18 @@ import math
 from components.ui.component import UIComponent
 from core import runtime_globals
 from core.utils.pygame_utils import blit_with_cache
+from core.utils.sprite_prefetch import PRIORITY_MARGIN, PRIORITY_VISIBLE, sprite_prefetcher
 
 
 class GridItem:
     """Represents an item in the grid"""
-    def __init__(self, sprite=None, text="", data=None):
+    def __init__(self, sprite=None, text="", data=None, sprite_request=None):
         self.sprite = sprite
         self.text = text
         self.data = data  # Any additional data associated with this item
+        # Optional sprite_prefetcher.request() kwargs; the grid loads frame 0 in the
+        # background and replaces sprite (the placeholder) when it arrives
+        self.sprite_request = sprite_request
 
 
 class Grid(UIComponent):
@@ -48,6 +52,10 @@ class Grid(UIComponent):
         self.on_selection_change = None  # Callback when cursor moves
         self.on_page_change = None  # Callback when page changes
         
+        # Background sprite loading for items with a sprite_request
+        self._pending_sprites = False
+        self._prefetch_generation = -1
+        
     def set_items(self, items):
         """Set the items to display in the grid"""
         # Only mark redraw if items actually changed
@@ -64,6 +72,9 @@ class Grid(UIComponent):
         if items_changed:
             self.needs_redraw = True
         
+        sprite_prefetcher.cancel(self)
+        self.request_item_sprites()
+        
         # Trigger page change callback
         if self.on_page_change:
             self.on_page_change(self.current_page, self.get_total_pages())
@@ -74,6 +85,41 @@ class Grid(UIComponent):
         self.items.append(item)
         self.needs_redraw = True
         
+    def request_item_sprites(self):
+        """
+        Resolves items with a sprite_request from the sprite cache and queues the rest
+        for background loading, current page first, then the nearest pages.
+        """
+        self._pending_sprites = False
+        page_start = self.current_page * self.items_per_page
+        for index, item in enumerate(self.items):
+            if item.sprite_request is None:
+                continue
+            if page_start <= index < page_start + self.items_per_page:
+                priority = PRIORITY_VISIBLE
+            else:
+                priority = PRIORITY_MARGIN + abs(index // self.items_per_page - self.current_page)
+            try:
+                sprites = sprite_prefetcher.request(**item.sprite_request, priority=priority, owner=self)
+            except Exception as e:
+                runtime_globals.game_console.log(f"[Grid] Failed to request sprite for {item.text or item.data}: {e}")
+                sprites = {}
+            if sprites is None:
+                self._pending_sprites = True
+                continue
+            if sprites:
+                item.sprite = next(iter(sprites.values()))
+                self.needs_redraw = True
+            item.sprite_request = None
+    
+    def update(self):
+        super().update()
+        if self._pending_sprites:
+            sprite_prefetcher.poll()
+            if sprite_prefetcher.generation != self._prefetch_generation:
+                self._prefetch_generation = sprite_prefetcher.generation
+                self.request_item_sprites()
+        
     def get_total_pages(self):
         """Get the total number of pages"""
         if not self.items:
@@ -153,6 +199,11 @@ class Grid(UIComponent):
         if new_page != self.current_page:
             self.current_page = new_page
             
+            if self._pending_sprites:
+                # Load the new page first
+                sprite_prefetcher.cancel(self)
+                self.request_item_sprites()
+            
             # Check if the globally selected item is on this page
             if self.selected_item_index >= 0:
                 # Calculate which page the selected item is on
@@ -5,6 +5,7 @@ import pygame
 from components.ui.component import UIComponent
 from core import runtime_globals
 from core.utils.pygame_utils import blit_with_cache, blit_with_shadow
+from core.utils.text_cache import text_cache
 
 class Label(UIComponent):
     def __init__(self, x, y, text, is_title=False, color_override=None, align_right=False, fixed_width=None, tooltip_text=None, scroll_text=False, shadow_mode="disabled", custom_size=None):
@@ -79,8 +80,7 @@ class Label(UIComponent):
                     else:
                         font = self.get_font("text")
                 
-                text_surface = font.render(self.text, True, (255, 255, 255))  # Color doesn't matter for width
-                text_width = text_surface.get_width()
+                text_width = font.size(self.text)[0]
                 display_width = self.manager.scale_value(self.fixed_width)
                 
                 # Only scroll if text is wider than display area
@@ -134,7 +134,7 @@ class Label(UIComponent):
             color = colors["fg"]
             
         # Render text at proper scale
-        text_surface = font.render(self.text, True, color)
+        text_surface = text_cache.render(font, self.text, color)
         
         # Handle scrolling text
         if self.scroll_text and self.fixed_width:
@@ -6,6 +6,7 @@ import pygame
 from components.ui.component import UIComponent
 from core import runtime_globals
 from core.utils.pygame_utils import blit_with_cache
+from core.utils.text_cache import text_cache
 from components.ui.ui_constants import PURPLE_LIGHT, PURPLE, PURPLE_DARK, PURPLE_DARK_LINE
 import core.constants as constants
 from core.utils.asset_utils import image_load
@@ -454,7 +455,7 @@ class StatusCarousel(UIComponent):
             text_y = int(8 * (self.manager.ui_scale if self.manager else 1.0))
             
         # Draw value text
-        text_surface = font.render(box['value'], True, PURPLE_LIGHT if is_focused else PURPLE)
+        text_surface = text_cache.render(font, box['value'], PURPLE_LIGHT if is_focused else PURPLE)
         text_x = (self.box_width - text_surface.get_width()) // 2
         text_margin = int(2 * (self.manager.ui_scale if self.manager else 1.0))
         text_y = max(text_y, self.box_height - text_surface.get_height() - text_margin)
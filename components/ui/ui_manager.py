@@ -10,8 +10,13 @@ from components.ui.background import Background
 from core.utils.asset_utils import image_load
 
 DEBUG_SCALE = False  # Set to True to enable detailed scaling debug logs
+SHADOW_MARGIN = 2  # Extra pixels a component shadow covers right and below (blit_with_shadow offset)
+FULL_REBUILD_RATIO = 0.5  # Repaint the whole master surface when dirty regions cover more than this
 
 class UIManager:
+    # Static components repainted into the master surface during the last drawn frame (debug overlay)
+    last_components_repainted = 0
+
     def __init__(self, theme="PURPLE"):
         # Use runtime globals for screen size so UI manager honors
         # the configured/internal resolution (especially on Android)
@@ -27,6 +32,11 @@ class UIManager:
         # Master UI cache - single surface for entire UI to reduce blits
         self.master_ui_surface = None
         self.master_ui_dirty = True  # Track if master surface needs rebuild
+        self.master_ui_full_rebuild = True  # Next rebuild repaints everything instead of the dirty regions
+        self._painted_rects = {}  # Static component -> area it covers on the master surface
+        self._pending_clear = []  # Areas of removed components still painted on the master surface
+        self.components_repainted = 0  # Static components repainted this frame
+        self._repainted_dirty = []  # Components that were dirty in the last partial rebuild
         
         # Shadow system configuration
         # Global shadow mode: None (disabled), "component", "background", "full"
@@ -179,6 +189,7 @@ class UIManager:
         # Mark all components for redraw
         for component in self.components:
             component.needs_redraw = True
+        self.invalidate_master_ui()  # Border colors change too
         
     def get_theme_colors(self):
         """Return background, foreground, and highlight colors for current theme"""
@@ -262,6 +273,7 @@ class UIManager:
             # Mark all components for redraw
             for component in self.components:
                 component.needs_redraw = True
+            self.invalidate_master_ui()  # Border colors change too
         
         # Check if animation should end (after exactly 1 second based on frame rate)
         if self.color_animation_frame_counter >= self.color_animation_total_frames:
@@ -345,6 +357,7 @@ class UIManager:
         # Mark all components for redraw
         for component in self.components:
             component.needs_redraw = True
+        self.invalidate_master_ui()  # Shadows change every component
     
     def get_shadow_mode_for_component(self, component):
         """Get the effective shadow mode for a specific component
@@ -448,6 +461,10 @@ class UIManager:
                 if was_focused or self.focused_index >= len(self.focusable_components):
                     self.focused_index = -1
                     
+            painted = self._painted_rects.pop(component, None)
+            if painted is not None:
+                self._pending_clear.append(painted)
+                self.master_ui_dirty = True
             component.manager = None
             if DEBUG_SCALE:
                 runtime_globals.game_console.log(f"[UIManager] Removed {component.__class__.__name__}")
@@ -1206,10 +1223,10 @@ class UIManager:
             component.update()
             # Only mark master surface dirty if a static component needs redraw
             # Dynamic components render separately and don't affect the cached master surface
-            if not component.is_dynamic and (component.needs_redraw or component.cached_surface is None):
+            if not component.is_dynamic and self._is_component_dirty(component):
                 static_needs_redraw = True
                 # Include reason in component name
-                reason = "needs_redraw" if component.needs_redraw else "cached_surface_None"
+                reason = "needs_redraw" if component.needs_redraw else "cached_surface_None" if component.cached_surface is None else "moved"
                 redraw_components.append(f"{component.__class__.__name__}({reason})")
         
         # Log once per second to avoid spam
@@ -1230,9 +1247,11 @@ class UIManager:
     def draw(self, surface):
         """Draw all components using master UI cache for static elements and direct rendering for dynamic elements"""
         # Rebuild master UI surface only if static components changed
+        self.components_repainted = 0
         if self.master_ui_dirty or self.master_ui_surface is None:
             self._rebuild_master_ui_surface()
             self.master_ui_dirty = False
+        UIManager.last_components_repainted = self.components_repainted
         
         # Single blit of entire static UI from cached master surface
         if self.master_ui_surface:
@@ -1271,46 +1290,129 @@ class UIManager:
         if self.active_tooltip:
             self.active_tooltip.draw(surface)
     
+    def _is_component_dirty(self, component):
+        """True if a static component has to be repainted into the master surface."""
+        if component.needs_redraw or component.cached_surface is None:
+            return True
+        painted = self._painted_rects.get(component)
+        if not component.visible:
+            return painted is not None
+        return painted is None or painted != self._component_bounds(component)
+
+    def _component_bounds(self, component):
+        """Area a visible static component covers on the master surface (UI-local coordinates)."""
+        width, height = component.rect.size
+        if component.cached_surface is not None:
+            width = max(width, component.cached_surface.get_width())
+            height = max(height, component.cached_surface.get_height())
+        if self.should_render_shadow(component, "component"):
+            width += SHADOW_MARGIN
+            height += SHADOW_MARGIN
+        bounds = pygame.Rect(component.rect.x - self.ui_offset_x, component.rect.y - self.ui_offset_y, width, height)
+        return bounds.clip(pygame.Rect(0, 0, self.ui_width, self.ui_height))
+
+    def invalidate_master_ui(self):
+        """Repaint every static component into the master surface on the next draw."""
+        self.master_ui_dirty = True
+        self.master_ui_full_rebuild = True
+
     def _rebuild_master_ui_surface(self):
-        """Rebuild the master UI surface by rendering all static components to it."""
+        """
+        Bring the master UI surface up to date with the static components.
+
+        Only the regions of components that changed (their old and new area)
+        are cleared; every static component overlapping such a region is then
+        repainted in z-order (list order) with the surface clipped to it. The
+        whole surface is repainted on the first build, after invalidate_master_ui(),
+        or when the dirty regions cover most of it anyway.
+        """
         # Create master surface if needed
         if self.master_ui_surface is None:
             self.master_ui_surface = pygame.Surface((self.ui_width, self.ui_height), pygame.SRCALPHA)
-        
-        # Clear the master surface
-        self.master_ui_surface.fill((0, 0, 0, 0))
-        
+            self.master_ui_full_rebuild = True
+
+        regions = None if self.master_ui_full_rebuild else self._collect_dirty_regions()
+        if regions is not None and sum(r.width * r.height for r in regions) > FULL_REBUILD_RATIO * self.ui_width * self.ui_height:
+            regions = None
+
+        if regions is None:
+            self._repaint_master_region(None)
+        else:
+            for region in regions:
+                self._repaint_master_region(region)
+            # A component that rendered larger than expected may have been cut by the clip
+            painted = [self._painted_rects[c] for c in self._repainted_dirty if c in self._painted_rects]
+            if any(bounds.width and bounds.height and not any(region.contains(bounds) for region in regions) for bounds in painted):
+                self._repaint_master_region(None)
+
+        self._pending_clear = []
+        self.master_ui_full_rebuild = False
+        # Mark as clean
+        self.master_ui_dirty = False
+
+    def _collect_dirty_regions(self):
+        """Non-overlapping list of master surface areas to repaint (old and new area of each changed component)."""
+        rects = list(self._pending_clear)
+        self._repainted_dirty = []
+        for component in self.components:
+            if component.is_dynamic or not self._is_component_dirty(component):
+                continue
+            self._repainted_dirty.append(component)
+            painted = self._painted_rects.get(component)
+            if painted is not None:
+                rects.append(painted)
+            if component.visible:
+                rects.append(self._component_bounds(component))
+
+        # Merge overlapping rects so no area is cleared and repainted twice
+        regions = []
+        for rect in rects:
+            rect = rect.clip(pygame.Rect(0, 0, self.ui_width, self.ui_height))
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+            overlapping = rect.collidelist(regions)
+            while overlapping != -1:
+                rect = rect.union(regions.pop(overlapping))
+                overlapping = rect.collidelist(regions)
+            regions.append(rect)
+        return regions
+
+    def _repaint_master_region(self, region):
+        """Clear a region of the master surface (None: all of it) and repaint the static components over it."""
+        surface = self.master_ui_surface
+        surface.set_clip(region)
+        surface.fill((0, 0, 0, 0), region)
+
         # Draw only static (non-dynamic) visible components to the master surface
         # Dynamic components will be drawn separately on top
         for component in self.components:
-            if component.visible and not component.is_dynamic:
-                component.draw(self.master_ui_surface, ui_local=True)
-            elif not component.is_dynamic:
+            if component.is_dynamic:
+                continue
+            if component.visible:
+                bounds = self._painted_rects.get(component)
+                if region is not None and bounds is not None and not self._is_component_dirty(component) and not bounds.colliderect(region):
+                    continue
+                component.draw(surface, ui_local=True)
+                self._painted_rects[component] = self._component_bounds(component)
+                self.components_repainted += 1
+            else:
                 # For invisible static components, clear flags and ensure cached_surface exists
                 # This prevents redraw loops when components toggle visibility
                 if component.needs_redraw or component.cached_surface is None:
                     component.cached_surface = component.render()
                     component.needs_redraw = False
-        
+                self._painted_rects.pop(component, None)
+
         # Draw border on master surface if theme has it
         colors = self.get_theme_colors()
-        if self.theme != "PURPLE":
-            if "border" in colors:
-                border_color = colors["border"]
-                border_size = 2
-                border_rect = pygame.Rect(0, 0, self.ui_width, self.ui_height)
-                pygame.draw.rect(self.master_ui_surface, border_color, border_rect, width=border_size)
-        else:
-            # For PURPLE theme (default), draw purple border
-            if "fg" in colors:
-                border_color = colors["fg"]
-                border_size = 2
-                border_rect = pygame.Rect(0, 0, self.ui_width, self.ui_height)
-                pygame.draw.rect(self.master_ui_surface, border_color, border_rect, width=border_size)
-        
-        # Mark as clean
-        self.master_ui_dirty = False
-    
+        border_color = colors.get("border") if self.theme != "PURPLE" else colors.get("fg")  # PURPLE (default) uses its fg color
+        if border_color is not None:
+            border_size = 2
+            border_rect = pygame.Rect(0, 0, self.ui_width, self.ui_height)
+            pygame.draw.rect(surface, border_color, border_rect, width=border_size)
+
+        surface.set_clip(None)
+
     def set_focused_component(self, component):
         """Set focus to a specific component"""
         if component not in self.focusable_components:
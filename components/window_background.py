@@ -6,6 +6,7 @@ from core import runtime_globals, game_globals
 from core.utils.module_utils import get_module
 from core.utils.pygame_utils import blit_with_cache, sprite_load_percent
 from core.utils.asset_utils import resolve_path
+from core.utils.sprite_cache import sprite_cache
 from core import constants
 
 
@@ -90,12 +91,18 @@ class WindowBackground:
             return
 
         try:
-            # Use the new sprite loading method to cover the screen, keeping proportions
-            # Use "Fill" method for both landscape and portrait devices
-            if runtime_globals.SCREEN_WIDTH >= runtime_globals.SCREEN_HEIGHT:
-                self.image = sprite_load_percent(path, percent=100, keep_proportion=True, base_on="width", alpha=False)
-            else:
-                self.image = sprite_load_percent(path, percent=100, keep_proportion=True, base_on="height", alpha=False)
+            # Every scene has its own WindowBackground; the scaled image is shared through the sprite cache
+            key = ("background", path, runtime_globals.SCREEN_WIDTH, runtime_globals.SCREEN_HEIGHT)
+            image = sprite_cache.get(key)
+            if image is None:
+                # Use the new sprite loading method to cover the screen, keeping proportions
+                # Use "Fill" method for both landscape and portrait devices
+                if runtime_globals.SCREEN_WIDTH >= runtime_globals.SCREEN_HEIGHT:
+                    image = sprite_load_percent(path, percent=100, keep_proportion=True, base_on="width", alpha=False)
+                else:
+                    image = sprite_load_percent(path, percent=100, keep_proportion=True, base_on="height", alpha=False)
+                image = sprite_cache.put(key, image)
+            self.image = image
             self.last_background = game_globals.game_background
             self.last_module = game_globals.background_module_name
             self.last_image_path = path
@@ -0,0 +1,238 @@
+"""
+Staged warmup that runs while the boot splash is showing.
+
+SceneBoot shows the splash and controller image for a few seconds before
+switching scenes. The loading the next scene needs (monster indexes, pet
+sprites, the background, sounds, the freezer summary) is queued here as
+stages instead of running in constructors, so it overlaps with the splash:
+
+    boot_warmup.add("Sounds", load_sounds)                          # Worker thread, dropped on skip
+    boot_warmup.add("Pet sprites", load_pets, required=True, main_thread=True)
+    boot_warmup.add("Documentation", build_docs, detached=True)    # Never waited for or dropped
+    ...
+    boot_warmup.step()          # Every frame: runs main thread stages for a few ms
+    boot_warmup.finish(skip)    # Before leaving the splash
+
+Stages run in the order they were added. main_thread stages are for work
+that creates Surfaces and run inside step(); the rest run on a daemon
+thread. A stage function may be a generator: every yield is a point where a
+main thread stage gives the frame back and where a dropped stage stops.
+
+finish() waits for (or runs) every stage that is not detached. When the
+player skipped the splash, finish(skip=True) drops the optional stages that
+have not completed and only waits for the required ones; whatever they
+would have loaded is then loaded on first use as before.
+"""
+import threading
+import time
+import types
+
+from core import runtime_globals
+from core.utils import startup_report
+
+MAIN_THREAD_BUDGET_MS = 8  # Time step() may spend on main thread stages per frame
+
+# Stage states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+DROPPED = "dropped"
+
+
+class WarmupStage:
+    """One unit of warmup work and its timing."""
+
+    def __init__(self, name: str, func, required: bool, main_thread: bool, detached: bool) -> None:
+        self.name = name
+        self.func = func
+        self.required = required
+        self.main_thread = main_thread
+        self.detached = detached
+        self.state = PENDING
+        self.result = None
+        self.seconds = 0.0  # Time spent running (main thread stages: summed over frames)
+        self._steps = None  # Generator of a main thread stage that was paused
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (DONE, FAILED, DROPPED)
+
+
+class BootWarmup:
+    """Ordered warmup stages, run on a daemon thread or a few ms per frame on the main thread."""
+
+    def __init__(self) -> None:
+        self.stages = []
+        self.skipped = False  # Set by finish(skip=True); generators can check it to stop early
+        self.hurry = False  # Set by finish(); main thread generators should stop yielding
+
+        self._lock = threading.Condition()
+        self._thread = None
+
+    def add(self, name: str, func, required: bool = False, main_thread: bool = False, detached: bool = False) -> WarmupStage:
+        """Queues func as a stage. Worker stages start right away."""
+        stage = WarmupStage(name, func, required, main_thread, detached)
+        with self._lock:
+            self.stages.append(stage)
+            if not main_thread:
+                self._ensure_thread()
+                self._lock.notify_all()
+        return stage
+
+    def get(self, name: str):
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        return None
+
+    def result(self, name: str, default=None):
+        """Return value of a finished stage, or default if it did not run."""
+        stage = self.get(name)
+        return stage.result if stage is not None and stage.state == DONE else default
+
+    def is_done(self) -> bool:
+        """True once every stage that finish() would wait for is over."""
+        with self._lock:
+            return all(stage.finished for stage in self.stages if not stage.detached)
+
+    #-----------------------------------------------------------------
+    # Main thread
+    #-----------------------------------------------------------------
+
+    def step(self, budget_ms: float = MAIN_THREAD_BUDGET_MS) -> None:
+        """Runs main thread stages in order until budget_ms is used up. Call once per frame."""
+        deadline = time.perf_counter() + budget_ms / 1000
+        for stage in self.stages:
+            if not stage.main_thread or stage.finished:
+                continue
+            if not self._run_steps(stage, deadline):
+                return
+
+    def finish(self, skip: bool = False) -> None:
+        """
+        Blocks until the warmup is over, running leftover stages on the calling thread.
+        With skip, optional stages that have not completed are dropped instead.
+        """
+        started = time.perf_counter()
+        self.hurry = True
+        if skip:
+            self.skipped = True
+            for stage in self.stages:
+                if not stage.required and not stage.detached and not stage.finished:
+                    self._drop(stage)
+
+        for stage in self.stages:
+            if stage.detached or stage.finished:
+                continue
+            if stage.main_thread:
+                self._run_steps(stage, None)
+                continue
+            with self._lock:
+                claimed = stage.state == PENDING
+                if claimed:
+                    stage.state = RUNNING
+            if claimed:
+                self._run(stage)
+            else:
+                with self._lock:
+                    while not stage.finished:
+                        self._lock.wait()
+
+        waited = time.perf_counter() - started
+        runtime_globals.game_console.log(f"[BootWarmup] {'Skipped' if skip else 'Finished'}, waited {waited * 1000:.1f} ms")
+        for stage in self.stages:
+            if stage.finished:
+                runtime_globals.game_console.log(f"[BootWarmup]   {stage.name}: {stage.state} in {stage.seconds * 1000:.1f} ms")
+        startup_report.mark("Boot warmup finished", waited)
+
+    def _run_steps(self, stage: WarmupStage, deadline) -> bool:
+        """Advances a main thread stage until it ends or deadline passes (None: to the end). True if it ended."""
+        started = time.perf_counter()
+        try:
+            if stage._steps is None:
+                stage.state = RUNNING
+                result = stage.func()
+                if not isinstance(result, types.GeneratorType):
+                    stage.result = result
+                    self._complete(stage, DONE, time.perf_counter() - started)
+                    return True
+                stage._steps = result
+            while True:
+                next(stage._steps)
+                if deadline is not None and time.perf_counter() >= deadline:
+                    stage.seconds += time.perf_counter() - started
+                    return False
+        except StopIteration as stop:
+            stage.result = stop.value
+            self._complete(stage, DONE, time.perf_counter() - started)
+        except Exception as e:
+            runtime_globals.game_console.log(f"[BootWarmup] Stage '{stage.name}' failed: {e}")
+            self._complete(stage, FAILED, time.perf_counter() - started)
+        return True
+
+    #-----------------------------------------------------------------
+    # Worker
+    #-----------------------------------------------------------------
+
+    def _ensure_thread(self) -> None:
+        """Starts the worker thread on first use. Caller holds the lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._worker, name="BootWarmup", daemon=True)
+            self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                stage = next((s for s in self.stages if not s.main_thread and s.state == PENDING), None)
+                while stage is None:
+                    self._lock.wait()
+                    stage = next((s for s in self.stages if not s.main_thread and s.state == PENDING), None)
+                stage.state = RUNNING
+            self._run(stage)
+
+    def _run(self, stage: WarmupStage) -> None:
+        """Runs a worker stage to the end on the calling thread, stopping at a yield if it is dropped."""
+        started = time.perf_counter()
+        state = DONE
+        try:
+            result = stage.func()
+            if isinstance(result, types.GeneratorType):
+                try:
+                    while stage.state != DROPPED:
+                        next(result)
+                    result.close()
+                    result = None
+                except StopIteration as stop:
+                    result = stop.value
+            stage.result = result
+        except Exception as e:
+            runtime_globals.game_console.log(f"[BootWarmup] Stage '{stage.name}' failed: {e}")
+            state = FAILED
+        self._complete(stage, DROPPED if stage.state == DROPPED else state, time.perf_counter() - started)
+
+    #-----------------------------------------------------------------
+    # Shared
+    #-----------------------------------------------------------------
+
+    def _drop(self, stage: WarmupStage) -> None:
+        """Marks a stage dropped. A worker stage that is running stops at its next yield."""
+        if stage._steps is not None:
+            stage._steps.close()  # Paused main thread stage
+            stage._steps = None
+        with self._lock:
+            stage.state = DROPPED
+            self._lock.notify_all()
+
+    def _complete(self, stage: WarmupStage, state: str, seconds: float) -> None:
+        with self._lock:
+            stage.state = state
+            stage.seconds += seconds
+            stage._steps = None
+            self._lock.notify_all()
+        if state != DROPPED:
+            startup_report.mark(f"Warmup stage '{stage.name}' {state}", stage.seconds)
+
+
+# Filled by SceneBoot (and main.py for the documentation build)
+boot_warmup = BootWarmup()
@@ -18,6 +18,7 @@ from components.ui.label_value import LabelValue
 from components.ui import ui_constants
 from core import game_globals, runtime_globals
 from core.animation import PetFrame
+from core.combat.battle_timeline import BattleTimeline
 from core.combat.game_battle import GameBattle
 from core.combat.sim.models import Digimon
 from core.game_module import sprite_load
@@ -55,6 +56,8 @@ class BattleEncounter:
         # Load module-specific attack sprites for pets and enemies
         self.pvp_mode = pvp_mode
         self.module_attack_sprites = {}
+        self._battle_timeline = None  # Playback index of global_battle_log (see battle_timeline)
+        self._battle_timeline_source = None
         self.module = get_module(module)
         self.set_initial_state(area, round, version)
 
@@ -369,6 +372,15 @@ class BattleEncounter:
         if constants.DEBUG_MODE:
             self.init_debug_battle_logs()
 
+    @property
+    def battle_timeline(self) -> BattleTimeline:
+        """Playback index of global_battle_log, rebuilt whenever the log is replaced (e.g. by the PvP scene)."""
+        log = getattr(self, 'global_battle_log', None)
+        if self._battle_timeline is None or self._battle_timeline_source is not log:
+            self._battle_timeline = BattleTimeline(log)
+            self._battle_timeline_source = log
+        return self._battle_timeline
+
     def init_debug_battle_logs(self):
         """Initialize debug battle log entries for each pet position."""
         if not constants.DEBUG_MODE:
@@ -419,70 +431,30 @@ class BattleEncounter:
 
     def get_last_hit_result(self, pet_index, attacker_type):
         """Get the last hit result for display in debug logs."""
-        if not hasattr(self, 'global_battle_log') or not self.global_battle_log:
+        if not getattr(self, 'global_battle_log', None):
             return ""
             
         try:
             # Predict the upcoming attack for the current turn (show before it lands)
-            turn = self.battle_player.turns[pet_index]
-            turn_idx = max(0, int(turn) - 1)  # use current turn (0-based)
-            if turn_idx < len(self.global_battle_log.battle_log):
-                turn_log = self.global_battle_log.battle_log[turn_idx]
-
-                # Support both dataclass objects and dict shapes
-                attacks = None
-                if hasattr(turn_log, 'attacks'):
-                    attacks = turn_log.attacks
-                elif isinstance(turn_log, dict):
-                    attacks = turn_log.get('attacks', [])
-                else:
-                    attacks = []
-
-                for attack in attacks:
-                    # extract fields generically
-                    if isinstance(attack, dict):
-                        dev = attack.get('device')
-                        attacker = attack.get('attacker')
-                        defender = attack.get('defender')
-                        hit = attack.get('hit')
-                        damage = attack.get('damage', 0)
-                    else:
-                        dev = getattr(attack, 'device', None)
-                        attacker = getattr(attack, 'attacker', None)
-                        defender = getattr(attack, 'defender', None)
-                        hit = getattr(attack, 'hit', None)
-                        damage = getattr(attack, 'damage', 0)
-
-                    try:
-                        attacker = int(attacker) if attacker is not None else None
-                    except Exception:
-                        attacker = None
-                    try:
-                        defender = int(defender) if defender is not None else None
-                    except Exception:
-                        defender = None
-
-                    if attacker_type == 'pet' and dev == 'device1' and attacker == pet_index:
-                        if not hit:
-                            return 'Miss!'
-                        if damage <= 2:
-                            return 'Hit!'
-                        if damage == 3:
-                            return 'SuperHit!'
-                        if damage >= 4:
-                            return 'MegaHit!'
-                        return 'Hit!'
-
-                    if attacker_type == 'enemy' and dev == 'device2' and defender == pet_index:
-                        if not hit:
-                            return 'Miss!'
-                        if damage <= 2:
-                            return 'Hit!'
-                        if damage == 3:
-                            return 'SuperHit!'
-                        if damage >= 4:
-                            return 'MegaHit!'
-                        return 'Hit!'
+            turn = max(1, int(self.battle_player.turns[pet_index]))
+            if attacker_type == 'pet':
+                attack = self.battle_timeline.attack("device1", pet_index, turn)
+            elif attacker_type == 'enemy':
+                hits = self.battle_timeline.hits_on("device2", pet_index, turn)
+                attack = hits[0] if hits else None
+            else:
+                attack = None
+
+            if attack is not None:
+                if not attack.hit:
+                    return 'Miss!'
+                if attack.damage <= 2:
+                    return 'Hit!'
+                if attack.damage == 3:
+                    return 'SuperHit!'
+                if attack.damage >= 4:
+                    return 'MegaHit!'
+                return 'Hit!'
         except:
             pass
             
@@ -953,7 +925,6 @@ class BattleEncounter:
         if turn - 1 >= len(self.global_battle_log.battle_log):
             runtime_globals.game_console.log(f"[BattleEncounter] Invalid turn {turn} for pet {pet_index}, log length is {len(self.global_battle_log.battle_log)}")
             return
-        turn_log = self.global_battle_log.battle_log[turn - 1]
 
         # For PvP, determine which device this pet belongs to from the perspective of the battle log
         # Both devices use the same battle log and same visual team arrangement:
@@ -966,10 +937,8 @@ class BattleEncounter:
             device_label = "device1"
 
         # Find the attack entry for this pet
-        attack_entry = next(
-            (a for a in turn_log.attacks if a.device == device_label and a.attacker == pet_index),
-            None
-        )
+        playback = self.battle_timeline.attack(device_label, pet_index, turn)
+        attack_entry = playback.attack if playback else None
 
         runtime_globals.game_console.log(f"Device {device_label} turn {turn} attack {attack_entry}")
 
@@ -1051,7 +1020,6 @@ class BattleEncounter:
         if turn - 1 >= len(self.global_battle_log.battle_log):
             runtime_globals.game_console.log(f"[BattleEncounter] Invalid turn {turn} for enemy {enemy_index}, log length is {len(self.global_battle_log.battle_log)}")
             return
-        turn_log = self.global_battle_log.battle_log[turn - 1]
 
         # For PvP, determine which device this enemy belongs to from the perspective of the battle log
         # Both devices use the same battle log and same visual team arrangement:
@@ -1064,10 +1032,7 @@ class BattleEncounter:
             device_label = "device2"
 
         # For bosses, collect all attacks by this enemy in this turn
-        attack_entries = [
-            a for a in turn_log.attacks
-            if a.device == device_label and a.attacker == enemy_index
-        ]
+        attack_entries = [playback.attack for playback in self.battle_timeline.attacks(device_label, enemy_index, turn)]
 
         runtime_globals.game_console.log(f"Device {device_label} turn {turn} attack {attack_entries}")
 
@@ -1839,8 +1804,7 @@ class BattleEncounter:
                     frame_id = PetFrame.LOSE.value
                 else:
                     frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.HAPPY.value
-                sprite = pet.get_sprite(frame_id)
-                sprite = pygame.transform.scale(sprite, (sprite_width, sprite_height))
+                sprite = pet.get_sprite(frame_id, size=(sprite_width, sprite_height))
                 blit_with_cache(surface, sprite, (pet_x, pets_y))
                 
                 # Draw per-pet labels (centered under each pet)
@@ -1875,12 +1839,8 @@ class BattleEncounter:
             if self.phase in ["battle"]:
                 # Check the global battle log for an attack entry
                 turn = self.battle_player.turns[i]
-                if turn <= self.turn_limit and self.global_battle_log and len(self.global_battle_log.battle_log) >= turn:
-                    turn_log = self.global_battle_log.battle_log[turn - 1]
-                    attack_entry = next(
-                        (a for a in turn_log.attacks if a.device == "device2" and a.attacker == i),
-                        None
-                    )
+                if turn <= self.turn_limit and self.global_battle_log:
+                    attack_entry = self.battle_timeline.attack("device2", i, turn)
 
             if self.phase in ["intimidate", "entry"]:
                 frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.ANGRY.value
@@ -1903,14 +1863,13 @@ class BattleEncounter:
             else:
                 frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.IDLE2.value
 
-            sprite = enemy.get_sprite(frame_id)
+            sprite = enemy.get_sprite(frame_id, mirrored=True)
 
             if attack_entry and self.battle_player.phase[i] == "enemy_charge" and self.battle_player.team2_hp[i] > 0:
                 y -= int(self.battle_player.attack_jump[i] * runtime_globals.UI_SCALE)
                 x -= int(self.battle_player.attack_forward[i] * runtime_globals.UI_SCALE)
 
             if sprite:
-                sprite = pygame.transform.flip(sprite, True, False)
                 blit_with_cache(surface, sprite, (x + (2 * runtime_globals.UI_SCALE), y))
 
     def draw_pets(self, surface: pygame.Surface):
@@ -1934,8 +1893,7 @@ class BattleEncounter:
                     frame_id = PetFrame.LOSE.value
                 else:
                     frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.HAPPY.value
-                sprite = pet.get_sprite(frame_id)
-                sprite = pygame.transform.scale(sprite, (runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
+                sprite = pet.get_sprite(frame_id, size=(runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
                 x = offset_x + i * spacing
                 blit_with_cache(surface, sprite, (x, y))
         else:
@@ -1947,12 +1905,8 @@ class BattleEncounter:
                 if self.phase in ["battle"]:
                     # Check the global battle log for an attack entry
                     turn = self.battle_player.turns[i]
-                    if turn <= self.turn_limit and self.global_battle_log and len(self.global_battle_log.battle_log) >= turn:
-                        turn_log = self.global_battle_log.battle_log[turn - 1]
-                        attack_entry = next(
-                            (a for a in turn_log.attacks if a.device == "device1" and a.attacker == i),
-                            None
-                        )
+                    if turn <= self.turn_limit and self.global_battle_log:
+                        attack_entry = self.battle_timeline.attack("device1", i, turn)
 
                 if self.phase in ["alert", "charge"]:
                     frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.ANGRY.value
@@ -1975,8 +1929,7 @@ class BattleEncounter:
                 else:
                     frame_id = PetFrame.IDLE1.value if anim_toggle == 0 else PetFrame.IDLE2.value
 
-                sprite = pet.get_sprite(frame_id)
-                sprite = pygame.transform.scale(sprite, (runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
+                sprite = pet.get_sprite(frame_id, size=(runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
                 y = self.get_y(i, total)
                 if attack_entry and self.battle_player.phase[i] == "pet_charge" and self.battle_player.team1_hp[i] > 0:
                     y -= int(self.battle_player.attack_jump[i] * runtime_globals.UI_SCALE)
@@ -2307,6 +2260,8 @@ class BattleEncounter:
 
         # Store the result for animation/processing
         self.global_battle_log = result
+        self._battle_timeline = BattleTimeline(result, [d.hp for d in team1], [d.hp for d in team2])
+        self._battle_timeline_source = result
         self.victory_status = "Victory" if result.winner == "device1" else "Defeat"
         
         # Update quest progress if battle was won (skip for PvP)
@@ -307,15 +307,13 @@ class BattleEncounterVersus(BattleEncounter):
             # Position for pet1 (left side)
             pet1_x = runtime_globals.SCREEN_WIDTH // 4 - sprite_width // 2
             pet1_y = runtime_globals.SCREEN_HEIGHT // 2 - sprite_height // 2
-            pet1_sprite = self.pet1.get_sprite(frame_id)
-            pet1_sprite = pygame.transform.scale(pet1_sprite, (sprite_width, sprite_height))
+            pet1_sprite = self.pet1.get_sprite(frame_id, size=(sprite_width, sprite_height))
             surface.blit(pet1_sprite, (pet1_x, pet1_y))
             
             # Position for pet2 (right side)
             pet2_x = 3 * runtime_globals.SCREEN_WIDTH // 4 - sprite_width // 2
             pet2_y = runtime_globals.SCREEN_HEIGHT // 2 - sprite_height // 2
-            pet2_sprite = self.pet2.get_sprite(frame_id)
-            pet2_sprite = pygame.transform.scale(pet2_sprite, (sprite_width, sprite_height))
+            pet2_sprite = self.pet2.get_sprite(frame_id, size=(sprite_width, sprite_height))
             surface.blit(pet2_sprite, (pet2_x, pet2_y))
 
     def draw_alert(self, surface):
@@ -0,0 +1,147 @@
+"""
+Indexed playback timeline of a simulated battle.
+
+GlobalBattleSimulator returns a BattleResult whose battle_log is a list of
+TurnLog entries, each with a flat list of AttackLog entries. Battle playback
+needs "the attack of combatant i of device X in turn t" for every combatant on
+every frame, so the log is indexed once per battle:
+
+    timeline = BattleTimeline(result, device1_hp=[...], device2_hp=[...])
+    hit = timeline.attack("device1", attacker, turn)   # First PlaybackHit or None
+    hits = timeline.attacks("device2", attacker, turn) # All of them (bosses hit every pet)
+    hits = timeline.hits_on("device2", defender, turn) # Attacks of device2 that target defender
+    hp = timeline.hp_after_turn("device2", turn)       # HP of every device2 combatant after turn
+
+Turns are 1-based like TurnLog.turn. Each PlaybackHit also carries the HP the
+defender is left with, replayed from the starting HP when it is given, or
+from the per-turn statuses otherwise. hp_after_turn() allows jumping straight
+to any turn (skip / fast-forward) without replaying the animations.
+"""
+from core.combat.sim.models import battle_result_from_serialized
+
+DEVICES = ("device1", "device2")
+
+
+class PlaybackHit:
+    """One attack of the timeline, with the defender's HP once it lands."""
+
+    __slots__ = ("attack", "turn", "device", "attacker", "defender", "hit", "damage", "defender_hp")
+
+    def __init__(self, attack, defender_hp: int) -> None:
+        self.attack = attack  # The AttackLog it was built from
+        self.turn = attack.turn
+        self.device = attack.device
+        self.attacker = attack.attacker
+        self.defender = attack.defender
+        self.hit = attack.hit
+        self.damage = attack.damage
+        self.defender_hp = defender_hp
+
+    def __repr__(self) -> str:
+        return (f"PlaybackHit(turn={self.turn}, device={self.device!r}, attacker={self.attacker}, "
+                f"defender={self.defender}, hit={self.hit}, damage={self.damage}, defender_hp={self.defender_hp})")
+
+
+class BattleTimeline:
+    """BattleResult indexed by (device, combatant, turn)."""
+
+    def __init__(self, result, device1_hp=None, device2_hp=None) -> None:
+        if result is not None and not hasattr(result, "battle_log"):
+            try:
+                result = battle_result_from_serialized(result)
+            except ValueError:
+                result = None
+        self.result = result
+        log = result.battle_log if result is not None else []
+        self.turns = len(log)
+
+        sizes = {
+            device: max(
+                [len(getattr(turn_log, f"{device}_status")) for turn_log in log] +
+                [attack.attacker + 1 for turn_log in log for attack in turn_log.attacks if attack.device == device] +
+                [attack.defender + 1 for turn_log in log for attack in turn_log.attacks if attack.device != device],
+                default=0
+            )
+            for device in DEVICES
+        }
+        # device -> combatant -> turn - 1 -> tuple of PlaybackHit
+        self._by_attacker = {device: [[() for _ in range(self.turns)] for _ in range(sizes[device])] for device in DEVICES}
+        self._by_defender = {device: [[() for _ in range(self.turns)] for _ in range(sizes[_other(device)])] for device in DEVICES}
+        # device -> turn - 1 -> HP of every combatant at the end of the turn
+        self._hp_after = {device: [] for device in DEVICES}
+
+        hp = {
+            "device1": list(device1_hp) if device1_hp is not None else None,
+            "device2": list(device2_hp) if device2_hp is not None else None,
+        }
+        for device in DEVICES:
+            if hp[device] is None:
+                hp[device] = self._starting_hp(log, device, sizes[device])
+            hp[device] += [0] * (sizes[device] - len(hp[device]))
+        self._hp_start = {device: tuple(hp[device]) for device in DEVICES}
+
+        for index, turn_log in enumerate(log):
+            for attack in turn_log.attacks:
+                target = _other(attack.device)
+                if 0 <= attack.defender < len(hp[target]):
+                    hp[target][attack.defender] = max(0, hp[target][attack.defender] - attack.damage)
+                    remaining = hp[target][attack.defender]
+                else:
+                    remaining = 0
+                entry = PlaybackHit(attack, remaining)
+                if 0 <= attack.attacker < sizes[attack.device]:
+                    cell = self._by_attacker[attack.device][attack.attacker]
+                    cell[index] += (entry,)
+                if 0 <= attack.defender < sizes[target]:
+                    cell = self._by_defender[attack.device][attack.defender]
+                    cell[index] += (entry,)
+            for device in DEVICES:
+                statuses = getattr(turn_log, f"{device}_status")
+                if statuses:
+                    # The simulator's statuses are authoritative; keep the replay in step with them
+                    hp[device] = [status.hp for status in statuses] + hp[device][len(statuses):]
+                self._hp_after[device].append(tuple(hp[device]))
+
+    @staticmethod
+    def _starting_hp(log, device: str, size: int) -> list:
+        """HP before the first turn, from the end of turn 1 plus the damage taken in it."""
+        if not log:
+            return [0] * size
+        first = log[0]
+        hp = [status.hp for status in getattr(first, f"{device}_status")]
+        hp += [0] * (size - len(hp))
+        for attack in first.attacks:
+            if attack.device != device and 0 <= attack.defender < size:
+                hp[attack.defender] += attack.damage
+        return hp
+
+    def attacks(self, device: str, attacker: int, turn: int) -> tuple:
+        """Every attack of combatant attacker of device in turn (1-based), in log order."""
+        rows = self._by_attacker.get(device)
+        if rows is None or not 0 <= attacker < len(rows) or not 1 <= turn <= self.turns:
+            return ()
+        return rows[attacker][turn - 1]
+
+    def attack(self, device: str, attacker: int, turn: int):
+        """First attack of combatant attacker of device in turn, or None."""
+        hits = self.attacks(device, attacker, turn)
+        return hits[0] if hits else None
+
+    def hits_on(self, device: str, defender: int, turn: int) -> tuple:
+        """Attacks made by device in turn that target combatant defender of the other device."""
+        rows = self._by_defender.get(device)
+        if rows is None or not 0 <= defender < len(rows) or not 1 <= turn <= self.turns:
+            return ()
+        return rows[defender][turn - 1]
+
+    def hp_after_turn(self, device: str, turn: int) -> tuple:
+        """HP of every combatant of device once turn (1-based) is over; turn 0 is the start."""
+        if device not in self._hp_start:
+            return ()
+        if turn <= 0 or not self.turns:
+            return self._hp_start[device]
+        return self._hp_after[device][min(turn, self.turns) - 1]
+
+
+def _other(device: str) -> str:
+    return "device2" if device == "device1" else "device1"
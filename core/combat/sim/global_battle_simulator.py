@@ -1,6 +1,11 @@
 import random
 import copy
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: simulate_batch falls back to running simulate() in a loop
+
 try:
     from battle_utils import get_attack_pattern
     from models import *
@@ -36,7 +41,7 @@ class GlobalBattleSimulator:
                 return self.attribute_advantage
         return 0
 
-    def simulate(self, device1, device2):
+    def simulate(self, device1, device2, print_log=True):
         # Deep copy the teams to avoid modifying the original objects
         device1 = [copy.deepcopy(p) for p in device1]
         device2 = [copy.deepcopy(p) for p in device2]
@@ -208,9 +213,165 @@ class GlobalBattleSimulator:
             device1_packets=[],
             device2_packets=[]
         )
-        self.print_battle_log(result)
+        if print_log:
+            self.print_battle_log(result)
         return result
 
+    def simulate_batch(self, device1, device2, battles=10000, seed=None):
+        """
+        Runs the same matchup many times and returns a BatchBattleResult with the
+        win probability, mean rounds and remaining-HP distributions.
+
+        Follows the same rules as simulate(), but every battle is a row in NumPy
+        arrays (HP, alive flags, per-pair hit rates, per-turn damage), so 100k
+        battles take about as many Python steps as one. No AttackLog/TurnLog
+        objects are built. Without NumPy it falls back to calling simulate() per battle.
+        """
+        if np is None:
+            return self._simulate_batch_fallback(device1, device2, battles, seed)
+
+        rng = np.random.default_rng(seed)
+        n1, n2 = len(device1), len(device2)
+        boss = n2 == 1 and not self.pvp_mode
+
+        hp1 = np.tile(np.array([p.hp for p in device1], dtype=np.int32), (battles, 1))
+        hp2 = np.tile(np.array([p.hp for p in device2], dtype=np.int32), (battles, 1))
+        alive1 = np.ones((battles, n1), dtype=bool)
+        alive2 = np.ones((battles, n2), dtype=bool)
+        active = np.ones(battles, dtype=bool)
+        rounds = np.zeros(battles, dtype=np.int32)
+        rows = np.arange(battles)
+
+        # Per-turn damage of each attacker and hit rate of each attacker/defender pair
+        damage1 = self._damage_table(device1)
+        damage2 = self._damage_table(device2)
+        hitrate1 = self._hitrate_table(device1, device2)
+        hitrate2 = self._hitrate_table(device2, device1)
+
+        def attack(i, target, attacker_hp_alive, damage, hitrate, hp, alive):
+            """Applies attacker i's attack on target (per-row defender index) where attacker_hp_alive is set."""
+            idx = rows[attacker_hp_alive]
+            tgt = target[attacker_hp_alive]
+            hit = rng.integers(0, 100, idx.size) < hitrate[i][tgt]
+            hp[idx, tgt] -= np.where(hit, damage, 0).astype(np.int32)
+            dead = hp[idx, tgt] <= 0
+            alive[idx[dead], tgt[dead]] = False
+            hp[idx[dead], tgt[dead]] = 0
+
+        def pick_targets(i, alive):
+            """Opposite member if alive, otherwise a uniformly random alive member (-1 if none)."""
+            count = alive.sum(axis=1)
+            pick = (rng.random(battles) * count).astype(np.int32)
+            random_target = np.argmax(np.cumsum(alive, axis=1) > pick[:, None], axis=1)
+            if i < alive.shape[1]:
+                target = np.where(alive[:, i], i, random_target)
+            else:
+                target = random_target
+            return np.where(count > 0, target, -1)
+
+        for turn in range(12):
+            # Team 1 attacks
+            for i in range(n1):
+                target = pick_targets(i, alive2)
+                attacking = active & alive1[:, i] & (target >= 0)
+                attack(i, target, attacking, damage1[i][turn], hitrate1, hp2, alive2)
+
+            # Team 2 attacks (a boss hits every alive member of team 1)
+            for i in range(n2):
+                if boss:
+                    for j in range(n1):
+                        attacking = active & alive2[:, i] & alive1[:, j]
+                        attack(i, np.full(battles, j), attacking, damage2[i][turn], hitrate2, hp1, alive1)
+                else:
+                    target = pick_targets(i, alive1)
+                    attacking = active & alive2[:, i] & (target >= 0)
+                    attack(i, target, attacking, damage2[i][turn], hitrate2, hp1, alive1)
+
+            rounds[active] = turn + 1
+            active &= alive1.any(axis=1) & alive2.any(axis=1)
+            if not active.any():
+                break
+
+        # Same winner rules as simulate(): wipeout first, then remaining HP
+        team1_hp = (hp1 * alive1).sum(axis=1)
+        team2_hp = (hp2 * alive2).sum(axis=1)
+        any1 = alive1.any(axis=1)
+        any2 = alive2.any(axis=1)
+        wins1 = (any1 & ~any2) | (any1 == any2) & (team1_hp > team2_hp)
+        wins2 = (~any1 & any2) | (any1 == any2) & (team2_hp > team1_hp)
+        ties = ~wins1 & ~wins2
+        if self.force_winner:
+            wins2 |= ties
+            ties[:] = False
+
+        return BatchBattleResult(
+            battles=battles,
+            device1_wins=int(wins1.sum()),
+            device2_wins=int(wins2.sum()),
+            draws=int(ties.sum()),
+            mean_rounds=float(rounds.mean()) if battles else 0.0,
+            device1_hp_distribution=np.bincount(team1_hp).tolist(),
+            device2_hp_distribution=np.bincount(team2_hp).tolist()
+        )
+
+    def _damage_table(self, device):
+        """damage[i][turn] for each team member, from its 12-turn attack pattern."""
+        table = []
+        for pet in device:
+            pattern = (get_attack_pattern(pet.level, pet.mini_game) * 2)[:12]
+            table.append([min(pattern[turn % len(pattern)] + 1, self.damage_limit) + pet.buff for turn in range(12)])
+        return table
+
+    def _hitrate_table(self, attackers, defenders):
+        """hitrate[i][j] (0-100) for attacker i against defender j, as an array per attacker."""
+        table = []
+        for pet in attackers:
+            row = []
+            for target in defenders:
+                hitrate = ((pet.power * 100) / (pet.power + target.power)) + self._attribute_advantage(pet.attribute, target.attribute) - pet.handicap
+                row.append(max(0, min(hitrate, 100)))
+            table.append(np.array(row))
+        return table
+
+    def _simulate_batch_fallback(self, device1, device2, battles, seed):
+        state = random.getstate()
+        if seed is not None:
+            random.seed(seed)
+        wins1 = wins2 = draws = total_rounds = 0
+        hp1_counts = {}
+        hp2_counts = {}
+        try:
+            for _ in range(battles):
+                result = self.simulate(device1, device2, print_log=False)
+                if result.winner == "device1":
+                    wins1 += 1
+                elif result.winner == "device2":
+                    wins2 += 1
+                else:
+                    draws += 1
+                total_rounds += len(result.battle_log)
+                hp1 = sum(s.hp for s in result.device1_final if s.alive)
+                hp2 = sum(s.hp for s in result.device2_final if s.alive)
+                hp1_counts[hp1] = hp1_counts.get(hp1, 0) + 1
+                hp2_counts[hp2] = hp2_counts.get(hp2, 0) + 1
+        finally:
+            if seed is not None:
+                random.setstate(state)
+
+        def distribution(counts):
+            size = max(counts) + 1 if counts else 0
+            return [counts.get(hp, 0) for hp in range(size)]
+
+        return BatchBattleResult(
+            battles=battles,
+            device1_wins=wins1,
+            device2_wins=wins2,
+            draws=draws,
+            mean_rounds=total_rounds / battles if battles else 0.0,
+            device1_hp_distribution=distribution(hp1_counts),
+            device2_hp_distribution=distribution(hp2_counts)
+        )
+
     def print_battle_log(self, result):
         # Generate a detailed battle log
         print(f"Winner: {result.winner}")
@@ -274,17 +435,26 @@ class GlobalBattleSimulator:
 if __name__ == "__main__":
     # Example 1: 4x4 party battle
     device1 = [
-        Digimon(name="Agumon", hp=10, attribute="Va", power=120, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=0, traited=0, egg_shake=0, index=0, stage=3),
-        Digimon(name="Gabumon", hp=10, attribute="Da", power=110, handicap=0, buff=1, mini_game=3, level=3, sick=0, shot1=1, shot2=1, order=1, traited=0, egg_shake=0, index=1, stage=3),
-        Digimon(name="Patamon", hp=10, attribute="Va", power=100, handicap=0, buff=0, mini_game=1, level=3, sick=0, shot1=1, shot2=1, order=2, traited=0, egg_shake=0, index=2, stage=3),
-        Digimon(name="Tentomon", hp=10, attribute="Vi", power=105, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=3, traited=0, egg_shake=0, index=3, stage=3),
+        Digimon(name="Agumon", hp=10, attribute="Va", power=120, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=0, traited=0, egg_shake=0, index=0, stage=3, tag_meter=0),
+        Digimon(name="Gabumon", hp=10, attribute="Da", power=110, handicap=0, buff=1, mini_game=3, level=3, sick=0, shot1=1, shot2=1, order=1, traited=0, egg_shake=0, index=1, stage=3, tag_meter=0),
+        Digimon(name="Patamon", hp=10, attribute="Va", power=100, handicap=0, buff=0, mini_game=1, level=3, sick=0, shot1=1, shot2=1, order=2, traited=0, egg_shake=0, index=2, stage=3, tag_meter=0),
+        Digimon(name="Tentomon", hp=10, attribute="Vi", power=105, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=3, traited=0, egg_shake=0, index=3, stage=3, tag_meter=0),
     ]
     device2 = [
-        Digimon(name="Impmon", hp=10, attribute="Vi", power=115, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=0, traited=0, egg_shake=0, index=0, stage=3),
-        Digimon(name="Wormmon", hp=10, attribute="Da", power=108, handicap=0, buff=1, mini_game=3, level=3, sick=0, shot1=1, shot2=1, order=1, traited=0, egg_shake=0, index=1, stage=3),
-        Digimon(name="Gomamon", hp=10, attribute="Va", power=102, handicap=0, buff=0, mini_game=1, level=3, sick=0, shot1=1, shot2=1, order=2, traited=0, egg_shake=0, index=2, stage=3),
-        Digimon(name="Palmon", hp=10, attribute="Da", power=104, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=3, traited=0, egg_shake=0, index=3, stage=3),
+        Digimon(name="Impmon", hp=10, attribute="Vi", power=115, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=0, traited=0, egg_shake=0, index=0, stage=3, tag_meter=0),
+        Digimon(name="Wormmon", hp=10, attribute="Da", power=108, handicap=0, buff=1, mini_game=3, level=3, sick=0, shot1=1, shot2=1, order=1, traited=0, egg_shake=0, index=1, stage=3, tag_meter=0),
+        Digimon(name="Gomamon", hp=10, attribute="Va", power=102, handicap=0, buff=0, mini_game=1, level=3, sick=0, shot1=1, shot2=1, order=2, traited=0, egg_shake=0, index=2, stage=3, tag_meter=0),
+        Digimon(name="Palmon", hp=10, attribute="Da", power=104, handicap=0, buff=0, mini_game=2, level=3, sick=0, shot1=1, shot2=1, order=3, traited=0, egg_shake=0, index=3, stage=3, tag_meter=0),
     ]
 
     sim = GlobalBattleSimulator(attribute_advantage=5, damage_limit=3)
-    result = sim.simulate(device1, device2)
\ No newline at end of file
+    result = sim.simulate(device1, device2)
+
+    # Example 2: win odds for the same matchup over many battles
+    import time
+    start = time.perf_counter()
+    odds = sim.simulate_batch(device1, device2, battles=100000, seed=1)
+    print(f"Batch: {odds.battles} battles in {time.perf_counter() - start:.2f}s")
+    print(f"  Device 1 win probability: {odds.win_probability:.3f} (draws: {odds.draws})")
+    print(f"  Mean rounds: {odds.mean_rounds:.2f}")
+    print(f"  Device 1 remaining HP distribution: {odds.device1_hp_distribution}")
\ No newline at end of file
@@ -86,6 +86,29 @@ class BattleResult:
         }
 
 
+@dataclass
+class BatchBattleResult:
+    """Aggregate outcome of many simulated battles of the same matchup (no per-turn logs)."""
+    battles: int
+    device1_wins: int
+    device2_wins: int
+    draws: int
+    mean_rounds: float
+    # Index = remaining total HP of the team's survivors, value = number of battles
+    device1_hp_distribution: List[int]
+    device2_hp_distribution: List[int]
+
+    @property
+    def win_probability(self) -> float:
+        """Chance that device1 wins."""
+        return self.device1_wins / self.battles if self.battles else 0.0
+
+    def to_dict(self):
+        data = asdict(self)
+        data["win_probability"] = self.win_probability
+        return data
+
+
 def _restore_packets(packet_lists):
     restored = []
     for pkt_list in packet_lists or []:
@@ -15,6 +15,12 @@ COMPATIBLE_SRCALPHA = pygame.SRCALPHA
 #=====================================================================
 FRAME_RATE = 30  # Default frame rate
 MAX_PETS = 4  # Default maximum number of pets
+SPRITE_CACHE_BUDGET_MB = 32  # Memory budget for decoded pet/enemy sprites (core.utils.sprite_cache)
+TEXT_CACHE_BUDGET_MB = 4  # Memory budget for rendered text surfaces (core.utils.text_cache)
+DIRTY_RECTS = True  # Only upload the parts of the frame that changed (core.utils.frame_presenter)
+SCALED_DISPLAY = False  # Let SDL scale fullscreen output (pygame.SCALED) instead of scaling in software
+LOW_POWER_FPS = 4  # Frames drawn per second while the scene is idle, e.g. screensaver (core.utils.frame_pacer); 0 disables
+MIN_LOW_POWER_FPS = 2  # Lower rates leave 1 s or more between frames, which pet_scheduler treats as a gap it does not simulate
 
 # Debug and logging configuration defaults
 DEBUG_MODE = False
@@ -0,0 +1,212 @@
+"""
+Compiled evolution rules.
+
+A monster's "evolve" list in monster.json is a list of dicts whose optional
+keys (mistakes, training, weight, time_range...) are requirements. Instead of
+testing every key of every entry each minute, each list is compiled once into
+EvolutionRule objects:
+
+    - stat requirements become (stat, low, high) tuples
+    - time_range is parsed into datetime.time values
+    - the target monster's special_key and the module's evolution unlocks
+      that name the target are looked up in advance
+    - jogress and item evolutions are left out (they are never automatic)
+
+Stat requirements only depend on a handful of pet values, so each pet keeps
+an EvolutionIndex that remembers which rules passed for the last values it
+saw and only re-tests them when one of those values changes. Time ranges and special
+locks can change without the pet changing, so they are checked every time.
+
+    rule = pet.evolution_index().find(pet)   # First rule the pet meets, or None
+"""
+from datetime import datetime
+from operator import attrgetter
+
+from core import runtime_globals
+
+# Requirement key -> value it is compared against
+STAT_GETTERS = {
+    "mistakes": lambda pet: pet.mistakes,
+    "condition_hearts": lambda pet: pet.condition_hearts,
+    "training": lambda pet: pet.effort,
+    "overfeed": lambda pet: pet.overfeed,
+    "level": lambda pet: pet.level,
+    "quests_completed": lambda pet: pet.quests_completed,
+    "weight": lambda pet: pet.weight,
+    "trophies": lambda pet: pet.trophies,
+    "vital_values": lambda pet: pet.vital_values,
+    "blue_gcells": lambda pet: pet.get_blue_gcells(),
+    "yellow_gcells": lambda pet: pet.get_yellow_gcells(),
+    "red_gcells": lambda pet: pet.get_red_gcells(),
+    "gcell_level": lambda pet: pet.get_gcell_level(),
+    "stage-5": lambda pet: pet.enemy_kills[5],
+    "stage-6": lambda pet: pet.enemy_kills[6],
+    "stage-7": lambda pet: pet.enemy_kills[7],
+    "stage-8": lambda pet: pet.enemy_kills[8],
+    "stage-9": lambda pet: pet.enemy_kills[9],
+    "pvp": lambda pet: pet.pvp_wins,
+    "sleep_disturbances": lambda pet: pet.sleep_disturbances,
+    "battles": lambda pet: pet.battles,
+    "win_count": lambda pet: pet.win,
+    "win_ratio": lambda pet: (pet.win * 100) // pet.battles if pet.battles else None,  # No battles yet: any ratio passes
+}
+
+# Requirement key -> flag that must be set
+FLAG_GETTERS = {
+    "special_encounter": lambda pet: pet.special_encounter,
+    "gcell_hatch": lambda pet: pet.gcell_fragment,
+}
+
+# Requirement key -> pet attributes its value is derived from
+SIGNATURE_FIELDS = {
+    "training": ("effort",),
+    "blue_gcells": ("gcell_points",),
+    "yellow_gcells": ("gcell_points",),
+    "red_gcells": ("gcell_points",),
+    "gcell_level": ("gcell_points",),
+    "pvp": ("pvp_wins",),
+    "win_count": ("win",),
+    "win_ratio": ("win", "battles"),
+    "special_encounter": ("special_encounter",),
+    "gcell_hatch": ("gcell_fragment",),
+}
+KILL_KEYS = ("stage-5", "stage-6", "stage-7", "stage-8", "stage-9")  # Read from the enemy_kills list
+
+# Keys that make an evolution manual (DNA fusion, digimentals)
+MANUAL_KEYS = ("jogress", "item")
+
+_UNSET = object()  # Signature of an index that has not been checked yet
+
+
+class EvolutionRule:
+    """One automatic entry of an evolve list, with its requirements pre-parsed."""
+
+    __slots__ = ("to", "version", "stats", "flags", "time_range", "special_key", "unlock_names")
+
+    def __init__(self, evo: dict, module, version: int) -> None:
+        self.to = evo["to"]
+        self.version = evo.get("version")  # None: keep the pet's version
+        self.stats = tuple((key, evo[key][0], evo[key][1]) for key in STAT_GETTERS if key in evo)
+        self.flags = tuple(key for key in FLAG_GETTERS if key in evo)
+        self.time_range = _parse_time_range(evo["time_range"]) if "time_range" in evo else None
+        self.special_key = None
+        self.unlock_names = ()
+        if module is not None:
+            # Looked up with the evolving pet's version, as update_evolution always did
+            target = module.data.get_monster(self.to, version)
+            if target and target.get("special", False):
+                self.special_key = target.get("special_key")
+            self.unlock_names = tuple(
+                unlock["name"] for unlock in getattr(module, "unlocks", [])
+                if isinstance(unlock, dict) and unlock.get("type") == "evolution" and self.to in unlock.get("to", ())
+            )
+
+    def stats_match(self, pet) -> bool:
+        for key, low, high in self.stats:
+            value = STAT_GETTERS[key](pet)
+            if value is not None and not low <= value <= high:
+                return False
+        return all(FLAG_GETTERS[key](pet) for key in self.flags)
+
+    def in_time_range(self, now_time=None) -> bool:
+        if self.time_range is None:
+            return True
+        if self.time_range is False:
+            return False  # Unparseable, logged when compiled
+        now_time = now_time or datetime.now().time()
+        start_time, end_time = self.time_range
+        if start_time < end_time:
+            return start_time <= now_time <= end_time
+        # Overnight range (e.g., 23:00 to 01:00)
+        return now_time >= start_time or now_time <= end_time
+
+    def target_version(self, pet) -> int:
+        return pet.version if self.version is None else self.version
+
+
+class CompiledEvolutions:
+    """The automatic rules of one evolve list. Shared by every pet of the monster, read-only."""
+
+    def __init__(self, evolve: list, module, version: int) -> None:
+        self.source = evolve
+        self.rules = [EvolutionRule(evo, module, version) for evo in evolve if not any(key in evo for key in MANUAL_KEYS)]
+        fields = []
+        self.uses_kills = False
+        for rule in self.rules:
+            for key in [key for key, _, _ in rule.stats] + list(rule.flags):
+                if key in KILL_KEYS:
+                    self.uses_kills = True
+                    continue
+                fields.extend(field for field in SIGNATURE_FIELDS.get(key, (key,)) if field not in fields)
+        self._fields = attrgetter(*fields) if fields else None
+
+    def signature(self, pet):
+        """The pet values the stat requirements depend on."""
+        values = self._fields(pet) if self._fields else None
+        if self.uses_kills:
+            return values, tuple(pet.enemy_kills)
+        return values
+
+
+class EvolutionIndex:
+    """
+    One pet's view of its CompiledEvolutions: the rules whose stat
+    requirements passed the last time find() ran, and the values they were
+    tested with.
+    """
+
+    def __init__(self, compiled: CompiledEvolutions) -> None:
+        self.compiled = compiled
+        self._signature = _UNSET
+        self._candidates = []
+
+        # Metrics
+        self.refreshes = 0
+
+    def candidates(self, pet) -> list:
+        """Rules whose stat requirements the pet meets, in evolve list order."""
+        if not self.compiled.rules:
+            return self._candidates
+        signature = self.compiled.signature(pet)
+        if signature != self._signature:
+            self._signature = signature
+            self._candidates = [rule for rule in self.compiled.rules if rule.stats_match(pet)]
+            self.refreshes += 1
+        return self._candidates
+
+    def find(self, pet, is_locked=None, now=None):
+        """
+        First rule the pet meets right now (or at the datetime now), or None.
+        is_locked(special_key) tells whether a special target is still locked
+        (only asked for hatched pets, as before).
+        """
+        now_time = now.time() if now is not None else None
+        for rule in self.candidates(pet):
+            if not rule.in_time_range(now_time):
+                continue
+            if pet.stage > 0 and rule.special_key and is_locked and is_locked(rule.special_key):
+                runtime_globals.game_console.log(f"{pet.name} cannot evolve into {rule.to}—special evolution {rule.special_key} is locked.")
+                continue
+            return rule
+        return None
+
+
+def compile_evolutions(module) -> dict:
+    """(name, version) -> CompiledEvolutions for every monster of a module."""
+    compiled = {}
+    for monster in module.data.monsters:
+        key = (monster.get("name"), monster.get("version"))
+        if key not in compiled:
+            compiled[key] = CompiledEvolutions(monster.get("evolve", []), module, monster.get("version"))
+    return compiled
+
+
+def _parse_time_range(time_range):
+    """(start, end) as datetime.time values, or False if the range cannot be parsed."""
+    try:
+        start_time = datetime.strptime(time_range[0].strip(), "%H:%M").time()
+        end_time = datetime.strptime(time_range[1].strip(), "%H:%M").time()
+        return start_time, end_time
+    except Exception as e:
+        runtime_globals.game_console.log(f"[!] Error parsing time_range: {e}")
+        return False
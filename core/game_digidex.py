@@ -1,8 +1,33 @@
 import json
 import os
+import time
 from core.utils.asset_utils import open_json, resolve_path
 
 DIGIDEX_PATH = "save/digidex.json"
+DIGIDEX_FLUSH_DELAY_SECONDS = 5  # Debounce: new entries are written at most this long after the first unsaved one
+
+# Loaded once on first use; registrations only touch memory until the next flush
+_entries = None  # list[dict] in file order
+_known = set()  # {(module, name, version)}
+_dirty_since = None  # time.monotonic() of the oldest unsaved change
+
+
+def _ensure_loaded() -> None:
+    global _entries, _known
+    if _entries is not None:
+        return
+
+    _entries = []
+    resolved = resolve_path(DIGIDEX_PATH)
+    if os.path.exists(resolved):
+        try:
+            with open_json(DIGIDEX_PATH) as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                _entries = data
+        except (json.JSONDecodeError, IOError):
+            pass
+    _known = {(p["module"], p["name"], p["version"]) for p in _entries}
 
 
 def load_digidex() -> list[dict]:
@@ -10,44 +35,73 @@ def load_digidex() -> list[dict]:
     Lê o arquivo de progresso da Digidex. Retorna uma lista de pets obtidos.
     Cada item contém: { "name": str, "module": str, "version": int }
     """
-    resolved = resolve_path(DIGIDEX_PATH)
-    if not os.path.exists(resolved):
-        return []
-    try:
-        with open_json(DIGIDEX_PATH) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return []
+    _ensure_loaded()
+    return list(_entries)
 
 
 def save_digidex(entries: list[dict]) -> None:
     """
     Salva a lista completa de pets conhecidos no arquivo da Digidex.
     """
-    with open_json(DIGIDEX_PATH, 'w') as f:
+    global _entries, _known, _dirty_since
+    _entries = list(entries)
+    _known = {(p["module"], p["name"], p["version"]) for p in _entries}
+    _dirty_since = None
+    _write_digidex(_entries)
+
+
+def _write_digidex(entries: list[dict]) -> None:
+    """Writes to a temporary file and renames it over the old one, so a crash never leaves a truncated digidex."""
+    resolved = resolve_path(DIGIDEX_PATH)
+    directory = os.path.dirname(resolved)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = resolved + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(entries, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, resolved)
+
+
+def flush_digidex(force: bool = False) -> bool:
+    """
+    Grava as entradas pendentes se o atraso de debounce já passou (ou sempre, com force).
+    Called every frame from game_globals.autosave() and with force=True on save.
+    Returns True if the file was written.
+    """
+    global _dirty_since
+    if _dirty_since is None:
+        return False
+    if not force and time.monotonic() - _dirty_since < DIGIDEX_FLUSH_DELAY_SECONDS:
+        return False
+
+    try:
+        _write_digidex(_entries)
+    except OSError as e:
+        print(f"[Digidex] Failed to save digidex: {e}")
+        return False
+    _dirty_since = None
+    return True
 
 
 def register_digidex_entry(name: str, module: str, version: int) -> None:
     """
     Adiciona um pet à Digidex se ainda não estiver presente.
     """
-    data = load_digidex()
-    exists = any(
-        p["name"] == name and p["module"] == module and p["version"] == version
-        for p in data
-    )
-    if not exists:
-        data.append({"name": name, "module": module, "version": version})
-        save_digidex(data)
+    global _dirty_since
+    _ensure_loaded()
+    key = (module, name, version)
+    if key not in _known:
+        _known.add(key)
+        _entries.append({"name": name, "module": module, "version": version})
+        if _dirty_since is None:
+            _dirty_since = time.monotonic()
 
 
 def is_pet_unlocked(name: str, module: str, version: int) -> bool:
     """
     Verifica se um pet específico já foi desbloqueado.
     """
-    data = load_digidex()
-    return any(
-        p["name"] == name and p["module"] == module and p["version"] == version
-        for p in data
-    )
\ No newline at end of file
+    _ensure_loaded()
+    return (module, name, version) in _known
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from core.animation import PetFrame
 import core.constants as constants
-from core.utils.sprite_utils import convert_sprites_to_list, load_enemy_sprites
+from core.utils.sprite_utils import FrameVariants, convert_sprites_to_list, load_enemy_sprites
 from core import runtime_globals
 
 
@@ -67,7 +67,12 @@ class GameEnemy:
             if i < len(self.frames):
                 self.frames[i] = sprite
 
-    def get_sprite(self, index: int):
+        # Enemies face left in battle; mirror them once here instead of every frame
+        self.frame_variants = FrameVariants(self.frames)
+
+    def get_sprite(self, index: int, mirrored: bool = False):
         if hasattr(self, "frames") and 0 <= index < len(self.frames):
+            if mirrored:
+                return self.frame_variants.get(index, mirrored=True)
             return self.frames[index]
         return None
\ No newline at end of file
@@ -1,16 +1,56 @@
+import os
+import uuid
 from dataclasses import dataclass, field
 from typing import List, Optional
+
+from core import game_globals
 from core.game_pet import GamePet
+from core.save_format import (FREEZER_FORMAT, FREEZER_INDEX_FORMAT, FREEZER_PAGE_FORMAT, SaveFormatError, decode_value,
+                              dumps_records, encode_value, load_legacy_pickle, pet_from_record, pet_to_record, read_records,
+                              write_atomic)
+
+FREEZER_DIRNAME = "freezer"  # index.dat + page_N.dat
+FREEZER_INDEX_FILENAME = "index.dat"
+LEGACY_FREEZER_FILENAME = "freezer.dat"  # Single file with full pet records
+LEGACY_PICKLE_FREEZER_FILENAME = "freezer.pkl"  # Pickled list of GameFreezer (save format version 1)
+FREEZER_PAGE_COUNT = 10
+
+# What the freezer grid, menu and stats panel read from a stored pet
+FROZEN_PET_FIELDS = (
+    "name", "module", "version", "stage", "attribute", "state",
+    "age", "weight", "level", "trophies", "vital_values",
+    "hunger", "strength", "effort", "power", "star", "battles", "win", "dp",
+)
+
+
+class FrozenPet:
+    """
+    Lightweight stand-in for a GamePet stored in the freezer. Holds only the
+    fields listed in FROZEN_PET_FIELDS; the full pet stays on disk in its page
+    file until FreezerStore.take_pet() moves it back to the party.
+
+    id ties the summary to the pet's record in the page file. It is None for
+    pets from files written before ids, until their page is rewritten.
+    """
+
+    def __init__(self, summary: dict, pet_id: str = None) -> None:
+        for key in FROZEN_PET_FIELDS:
+            setattr(self, key, decode_value(summary.get(key)))
+        self.id = pet_id
+
+    @staticmethod
+    def summarize(pet) -> dict:
+        return {key: encode_value(getattr(pet, key, None)) for key in FROZEN_PET_FIELDS}
 
 
 @dataclass
 class GameFreezer:
-    pets: List[Optional[GamePet]]  # Add this field
+    pets: List[Optional[FrozenPet]]  # Add this field
     page: int
     background: str
     background_module: str
 
-    pet_grid: List[List[Optional[GamePet]]] = field(init=False)
+    pet_grid: List[List[Optional[FrozenPet]]] = field(init=False)
 
     def __post_init__(self):
         self.rebuild()
@@ -25,3 +65,304 @@ class GameFreezer:
             self.pet_grid.append(row)
         while len(self.pet_grid) < grid_size:
             self.pet_grid.append([None] * grid_size)
+
+
+#=====================================================================
+# FreezerStore - Index of frozen pets with full records paged on demand
+#=====================================================================
+
+def get_freezer_path(*parts: str) -> str:
+    return os.path.join(game_globals.get_save_dir(), *parts)
+
+
+class FreezerStore:
+    """
+    The freezer box on disk:
+
+        save/freezer/index.dat    page backgrounds + a FrozenPet summary per pet
+        save/freezer/page_N.dat   full pet records of page N
+
+    Opening the freezer only reads the index. A page file is read when one of
+    its pets leaves the freezer or the page is rewritten, and a full GamePet is
+    only built in take_pet().
+
+    Index and page records of a pet share its id, so a crash between writing
+    a page and the index (slots shift when a pet leaves) cannot pair a summary
+    with another pet's record. take_pet() also checks name, module and
+    version before restoring.
+    """
+
+    def __init__(self) -> None:
+        self.pages = []
+        self._page_records = {}  # page -> [full record or None], aligned with pages[page].pets
+        self._dirty_pages = set()
+        self._index_dirty = False
+        self.load()
+
+    #-----------------------------------------------------------------
+    # Loading
+    #-----------------------------------------------------------------
+
+    def load(self) -> None:
+        index_path = get_freezer_path(FREEZER_DIRNAME, FREEZER_INDEX_FILENAME)
+        if os.path.exists(index_path):
+            self._load_index(index_path)
+        elif os.path.exists(get_freezer_path(LEGACY_FREEZER_FILENAME)):
+            print(f"[Freezer] Migrating {LEGACY_FREEZER_FILENAME} to {FREEZER_DIRNAME}/")
+            self._migrate(self._read_single_file_freezer())
+        elif os.path.exists(get_freezer_path(LEGACY_PICKLE_FREEZER_FILENAME)):
+            print(f"[Freezer] Migrating {LEGACY_PICKLE_FREEZER_FILENAME} to {FREEZER_DIRNAME}/")
+            self._migrate(self._read_pickled_freezer())
+        else:
+            self.pages = _empty_pages()
+            self._index_dirty = True
+            self.save()
+
+    def _load_index(self, index_path: str) -> None:
+        self.pages = _empty_pages()
+        try:
+            records, errors = read_records(index_path, FREEZER_INDEX_FORMAT)
+        except (OSError, SaveFormatError) as e:
+            print(f"[Freezer] Failed to load {FREEZER_INDEX_FILENAME}: {e}")
+            return
+
+        slots = {}  # page -> {slot: FrozenPet}
+        for record in records:
+            try:
+                if record["type"] == "page":
+                    page = self._ensure_page(record["page"])
+                    page.background = record.get("background", "default_bg")
+                    page.background_module = record.get("background_module", "default_module")
+                elif record["type"] == "pet":
+                    slots.setdefault(record["page"], {})[record["slot"]] = FrozenPet(record["summary"], record.get("id"))
+            except Exception as e:
+                errors.append(f"{record.get('type')} record on page {record.get('page')}: {e}")
+        for error in errors:
+            print(f"[Freezer] Skipping damaged index record: {error}")
+
+        for index, page_slots in slots.items():
+            self._ensure_page(index).pets = _slots_to_list(page_slots)
+        for page in self.pages:
+            page.rebuild()
+
+    def _page_path(self, index: int) -> str:
+        return get_freezer_path(FREEZER_DIRNAME, f"page_{index}.dat")
+
+    def _load_page_records(self, index: int) -> list:
+        """Full records of a page, aligned with its pets (None where a record is missing)."""
+        if index in self._page_records:
+            return self._page_records[index]
+
+        by_id = {}
+        slots = {}  # For pets from an index written before ids (take_pet() checks the match)
+        path = self._page_path(index)
+        if os.path.exists(path):
+            try:
+                records, errors = read_records(path, FREEZER_PAGE_FORMAT)
+                for record in records:
+                    if record["type"] != "pet":
+                        continue
+                    if record.get("id"):
+                        by_id[record["id"]] = record
+                    if isinstance(record.get("slot"), int):
+                        slots[record["slot"]] = record
+                for error in errors:
+                    print(f"[Freezer] Skipping damaged record in page {index + 1}: {error}")
+            except (OSError, SaveFormatError) as e:
+                print(f"[Freezer] Failed to load page {index + 1}: {e}")
+
+        pets = self.pages[index].pets
+        page_records = [
+            None if pet is None else by_id.get(pet.id) if pet.id is not None else slots.get(slot)
+            for slot, pet in enumerate(pets)
+        ]
+        self._page_records[index] = page_records
+        return page_records
+
+    #-----------------------------------------------------------------
+    # Changes
+    #-----------------------------------------------------------------
+
+    def store_pet(self, page_index: int, pet: GamePet) -> FrozenPet:
+        """Appends a party pet to a page and returns its FrozenPet."""
+        records = self._load_page_records(page_index)
+        frozen = FrozenPet(FrozenPet.summarize(pet), uuid.uuid4().hex)
+        self.pages[page_index].pets.append(frozen)
+        records.append(pet_to_record(pet))
+        self._dirty_pages.add(page_index)
+        self._index_dirty = True
+        return frozen
+
+    def take_pet(self, frozen: FrozenPet) -> Optional[GamePet]:
+        """Removes a pet from the freezer and builds its full GamePet (without sprites). Returns None if its record is unreadable."""
+        page_index, slot = self._locate(frozen)
+        if page_index is None:
+            return None
+        record = self._load_page_records(page_index)[slot]
+        if record is None:
+            print(f"[Freezer] No stored record for {frozen.name} on page {page_index + 1}")
+            return None
+        try:
+            pet = pet_from_record(record)
+        except Exception as e:
+            print(f"[Freezer] Failed to restore {frozen.name}: {e}")
+            return None
+        if (pet.name, pet.module, pet.version) != (frozen.name, frozen.module, frozen.version):
+            print(f"[Freezer] Stored record on page {page_index + 1} is {pet.name}, not {frozen.name}; leaving it in the freezer")
+            return None
+        self._remove_slot(page_index, slot)
+        return pet
+
+    def remove_pet(self, frozen: FrozenPet) -> bool:
+        """Deletes a pet from the freezer (e.g. clearing a dead pet)."""
+        page_index, slot = self._locate(frozen)
+        if page_index is None:
+            return False
+        self._load_page_records(page_index)
+        self._remove_slot(page_index, slot)
+        return True
+
+    def _locate(self, frozen: FrozenPet):
+        for page_index, page in enumerate(self.pages):
+            for slot, pet in enumerate(page.pets):
+                if pet is frozen:
+                    return page_index, slot
+        return None, None
+
+    def _remove_slot(self, page_index: int, slot: int) -> None:
+        del self.pages[page_index].pets[slot]
+        del self._page_records[page_index][slot]
+        self._dirty_pages.add(page_index)
+        self._index_dirty = True
+
+    def _ensure_page(self, index: int) -> GameFreezer:
+        while len(self.pages) <= index:
+            self.pages.append(GameFreezer([], len(self.pages), "default_bg", "default_module"))
+        return self.pages[index]
+
+    #-----------------------------------------------------------------
+    # Saving
+    #-----------------------------------------------------------------
+
+    def save(self) -> None:
+        """Writes changed page files, then the index. Pets without an id get one when their page is written."""
+        os.makedirs(get_freezer_path(FREEZER_DIRNAME), exist_ok=True)
+        for index in sorted(self._dirty_pages):
+            records = []
+            for slot, record in enumerate(self._page_records.get(index, [])):
+                if record is not None:
+                    frozen = self.pages[index].pets[slot]
+                    if frozen.id is None:
+                        frozen.id = uuid.uuid4().hex
+                    records.append(dict(record, slot=slot, id=frozen.id))
+            write_atomic(self._page_path(index), dumps_records(FREEZER_PAGE_FORMAT, records))
+        self._dirty_pages.clear()
+
+        if self._index_dirty:
+            records = []
+            for index, page in enumerate(self.pages):
+                records.append({"type": "page", "page": index, "background": page.background, "background_module": page.background_module})
+                for slot, pet in enumerate(page.pets):
+                    if pet is not None:
+                        records.append({"type": "pet", "page": index, "slot": slot, "id": pet.id, "summary": FrozenPet.summarize(pet)})
+            write_atomic(get_freezer_path(FREEZER_DIRNAME, FREEZER_INDEX_FILENAME), dumps_records(FREEZER_INDEX_FORMAT, records))
+            self._index_dirty = False
+
+    #-----------------------------------------------------------------
+    # Migration from older freezer files
+    #-----------------------------------------------------------------
+
+    def _migrate(self, legacy_pages: list) -> None:
+        """Writes the index and page files from old freezer pages, whose pets are GamePets or (summary, record) pairs."""
+        self.pages = _empty_pages()
+        for index, legacy_page in enumerate(legacy_pages):
+            page = self._ensure_page(index)
+            page.background = legacy_page.background
+            page.background_module = legacy_page.background_module
+            records = []
+            for pet in legacy_page.pets:
+                if pet is None:
+                    page.pets.append(None)
+                    records.append(None)
+                elif isinstance(pet, tuple):
+                    summary, record = pet
+                    page.pets.append(FrozenPet(summary))
+                    records.append(record)
+                else:
+                    page.pets.append(FrozenPet(FrozenPet.summarize(pet)))
+                    records.append(pet_to_record(pet))
+            page.rebuild()
+            self._page_records[index] = records
+            self._dirty_pages.add(index)
+        self._index_dirty = True
+        self.save()
+
+    def _read_single_file_freezer(self) -> list:
+        """Reads freezer.dat (one file with every full pet record) without keeping any GamePet."""
+        path = get_freezer_path(LEGACY_FREEZER_FILENAME)
+        try:
+            records, errors = read_records(path, FREEZER_FORMAT)
+        except (OSError, SaveFormatError) as e:
+            print(f"[Freezer] Failed to load {LEGACY_FREEZER_FILENAME}: {e}")
+            return []
+
+        pages = _empty_pages()
+        slots = {}  # page -> {slot: (summary, record)}
+        for record in records:
+            try:
+                if record["type"] == "page":
+                    index = record["page"]
+                    while len(pages) <= index:
+                        pages.append(GameFreezer([], len(pages), "default_bg", "default_module"))
+                    pages[index].background = record.get("background", "default_bg")
+                    pages[index].background_module = record.get("background_module", "default_module")
+                elif record["type"] == "pet":
+                    summary = FrozenPet.summarize(pet_from_record(record))
+                    slots.setdefault(record["page"], {})[record["slot"]] = (summary, {"type": "pet", "fields": record["fields"]})
+            except Exception as e:
+                errors.append(f"{record.get('type')} record on page {record.get('page')}: {e}")
+        for error in errors:
+            print(f"[Freezer] Skipping damaged record: {error}")
+
+        for index, page_slots in slots.items():
+            if index < len(pages):
+                pages[index].pets = _slots_to_list(page_slots)
+        return pages
+
+    def _read_pickled_freezer(self) -> list:
+        try:
+            return load_legacy_pickle(get_freezer_path(LEGACY_PICKLE_FREEZER_FILENAME))
+        except Exception as e:
+            print(f"[Freezer] Failed to load {LEGACY_PICKLE_FREEZER_FILENAME}: {e}")
+            return []
+
+
+def _empty_pages() -> list:
+    return [GameFreezer([], i, "default_bg", "default_module") for i in range(FREEZER_PAGE_COUNT)]
+
+
+def _slots_to_list(slots: dict) -> list:
+    items = [None] * (max(slots) + 1) if slots else []
+    for slot, item in slots.items():
+        items[slot] = item
+    return items
+
+
+def has_frozen_pets() -> bool:
+    """True if the freezer holds at least one pet. Only reads the index (or the legacy file)."""
+    try:
+        index_path = get_freezer_path(FREEZER_DIRNAME, FREEZER_INDEX_FILENAME)
+        if os.path.exists(index_path):
+            records, _ = read_records(index_path, FREEZER_INDEX_FORMAT)
+            return any(record["type"] == "pet" for record in records)
+        legacy_path = get_freezer_path(LEGACY_FREEZER_FILENAME)
+        if os.path.exists(legacy_path):
+            records, _ = read_records(legacy_path, FREEZER_FORMAT)
+            return any(record["type"] == "pet" for record in records)
+        pickle_path = get_freezer_path(LEGACY_PICKLE_FREEZER_FILENAME)
+        if os.path.exists(pickle_path):
+            return any(page.pets and any(pet is not None for pet in page.pets) for page in load_legacy_pickle(pickle_path))
+    except Exception:
+        # If there's any error reading the file, assume no pets
+        pass
+    return False
@@ -1,9 +1,14 @@
+import copy
 import datetime
 import os
-import pickle
 import random
 import time
 
+from core.save_format import (SAVE_FORMAT, TRANSIENT_PET_FIELDS, decode_value, dumps_records, encode_value, is_legacy_pickle,
+                              load_legacy_pickle, pet_to_record, poop_to_record, pet_from_record,
+                              poop_from_record, read_records, write_atomic)
+from core.utils.save_writer import save_writer
+
 #=====================================================================
 # Game Global State
 #=====================================================================
@@ -144,74 +149,148 @@ def cleanup_old_saves():
             except Exception as e:
                 print(f"[Save] Failed to remove old backup {file_path}: {e}")
 
-def save() -> None:
+def _snapshot_game_object(obj):
     """
-    Saves the current global game state to a file with backup rotation.
+    Detached copy of a pet/poop for the save writer, which JSON-encodes it with
+    pet_to_record()/poop_to_record() on its own thread. Skips __init__ (which
+    would reload sprites). list/dict/set attributes are deep-copied, so the
+    writer owns everything it encodes; transient attributes (sprites, caches)
+    are left out, as the writer skips them anyway.
     """
-    # Ensure save directory exists
-    save_dir = get_save_dir()
-    if not os.path.exists(save_dir):
-        try:
-            os.makedirs(save_dir)
-            print(f"[Save] Created save directory: {save_dir}")
-        except Exception as e:
-            print(f"[Save] Failed to create save directory: {e}")
-            return
+    clone = obj.__class__.__new__(obj.__class__)
+    clone.__dict__ = {
+        key: copy.deepcopy(value) if isinstance(value, (list, dict, set)) else value
+        for key, value in obj.__dict__.items()
+        if key not in TRANSIENT_PET_FIELDS
+    }
+    return clone
 
-    data = {
-        "pet_list": pet_list,
-        "poop_list": poop_list,
-        "traited": traited,
-        "gcell_fragments": gcell_fragments,
+def _snapshot() -> dict:
+    """Captures the persistent state on the frame thread. Must stay cheap: it runs inside update()."""
+    return {
+        "pet_list": [_snapshot_game_object(pet) for pet in pet_list],
+        "poop_list": [_snapshot_game_object(poop) for poop in poop_list],
+        "traited": list(traited),
+        "gcell_fragments": list(gcell_fragments),
         "game_background": game_background,
-        "battle_area": battle_area,
-        "battle_round": battle_round,
+        "battle_area": dict(battle_area),
+        "battle_round": dict(battle_round),
         "last_adventure_module": last_adventure_module,
         "background_module_name": background_module_name,
-        "unlocks": unlocks,
+        "unlocks": copy.deepcopy(unlocks),
         "showClock": showClock,
         "sound": sound,
         "xai": xai,
         "xai_date": xai_date,
-        "inventory": inventory,
-        "battle_effects": battle_effects,
+        "inventory": dict(inventory),
+        "battle_effects": copy.deepcopy(battle_effects),
         "background_high_res": background_high_res,
         "wake_time": wake_time,
         "sleep_time": sleep_time,
         "screen_timeout": screen_timeout,
-        "quests": quests,
-        "event": event,
+        "quests": copy.deepcopy(quests),
+        "event": copy.deepcopy(event),
         "event_time": event_time,
         "sprite_resolution_preference": sprite_resolution_preference,
-        "total_victories": total_victories,
+        "total_victories": dict(total_victories),
+        "saved_at": time.time(),  # Offline catch-up starts here
     }
 
+def _write_save(data: dict) -> None:
+    """
+    Writes a snapshot to the next numbered save file. Runs on the save writer thread.
+    The file is written under a temporary name, fsynced and renamed, so an
+    interrupted save never leaves a truncated save_data_N.dat behind.
+    """
+    # Ensure save directory exists
+    save_dir = get_save_dir()
+    if not os.path.exists(save_dir):
+        try:
+            os.makedirs(save_dir)
+            print(f"[Save] Created save directory: {save_dir}")
+        except Exception as e:
+            print(f"[Save] Failed to create save directory: {e}")
+            return
+
     # Get the next save number and create the filename
     save_number = get_next_save_number()
     save_path = os.path.join(save_dir, f"save_data_{save_number}.dat")
 
-    try:
-        with open(save_path, "wb") as f:
-            pickle.dump(data, f)
-            f.flush()
-            os.fsync(f.fileno())
-        
-        print(f"[Save] Game saved successfully to: {os.path.basename(save_path)}")
-        
-        # Clean up old saves
-        cleanup_old_saves()
-        
-    except Exception as e:
-        print(f"[Save] Failed to save game: {e}")
+    # Errors are reported and counted by the save writer
+    write_atomic(save_path, serialize_save(data))
+    print(f"[Save] Game saved successfully to: {os.path.basename(save_path)}")
+
+    # Clean up old saves
+    cleanup_old_saves()
+
+def serialize_save(data: dict) -> bytes:
+    """Encodes a snapshot in the current save format (see core.save_format)."""
+    records = [{"type": "global", "key": key, "value": encode_value(value)}
+               for key, value in data.items() if key not in ("pet_list", "poop_list")]
+    records.extend(pet_to_record(pet) for pet in data["pet_list"])
+    records.extend(poop_to_record(poop) for poop in data["poop_list"])
+    return dumps_records(SAVE_FORMAT, records)
 
-def load() -> None:
+def read_save_file(save_path: str) -> dict:
+    """
+    Reads a save file of any format version into the dict layout save() snapshots.
+    Damaged records are reported and skipped; the rest of the file is still used.
+    Pets come back without sprites (see load()).
+    """
+    if is_legacy_pickle(save_path):
+        print(f"[Save] Migrating {os.path.basename(save_path)} from the pickled save format")
+        return load_legacy_pickle(save_path)
+
+    records, errors = read_records(save_path, SAVE_FORMAT)
+    data = {"pet_list": [], "poop_list": []}
+    for record in records:
+        try:
+            if record["type"] == "global":
+                data[record["key"]] = decode_value(record["value"])
+            elif record["type"] == "pet":
+                data["pet_list"].append(pet_from_record(record))
+            elif record["type"] == "poop":
+                data["poop_list"].append(poop_from_record(record))
+        except Exception as e:
+            errors.append(f"{record.get('type')} record {record.get('key', '')}: {e}")
+    for error in errors:
+        print(f"[Save] Skipping damaged record in {os.path.basename(save_path)}: {error}")
+    return data
+
+def save(wait: bool = False) -> None:
+    """
+    Saves the current global game state to a file with backup rotation.
+    The state is snapshotted here and written by a background thread; pass
+    wait=True (e.g. on quit) to block until it is on disk.
+    """
+    from core.game_digidex import flush_digidex
+
+    # Write digidex entries still waiting for their debounce
+    flush_digidex(force=True)
+
+    save_writer.submit(_snapshot(), _write_save)
+    if wait:
+        save_writer.flush()
+
+def flush_saves(timeout: float = None) -> bool:
+    """Blocks until every pending save is written. Returns False on timeout."""
+    return save_writer.flush(timeout)
+
+def get_save_metrics() -> dict:
+    """Save writer metrics: queue_depth, written, coalesced, failed and last/max/avg duration in ms."""
+    return save_writer.stats()
+
+def load(load_sprites: bool = True) -> None:
     """
     Loads the global game state from the most recent save file, with fallback to previous saves.
+    With load_sprites=False pets are restored without sprites; call pet.load_saved_sprite()
+    before they are drawn (SceneBoot does this during the splash).
     """
     global pet_list, poop_list, traited, gcell_fragments, unlocks, battle_area, battle_round, last_adventure_module, xai, xai_date, background_high_res
     global game_background, background_module_name, showClock, sound, inventory, battle_effects
     global wake_time, sleep_time, screen_timeout, sprite_resolution_preference
     global quests, event, event_time, total_victories
+    from core.pet_catchup import catch_up
 
     # Get all available save files in order (newest first)
     save_files_to_try = []
@@ -253,79 +332,92 @@ def load() -> None:
     # Try to load each save file in order
     for save_path in save_files_to_try:
         try:
-            with open(save_path, "rb") as f:
-                data = pickle.load(f)
-
-                # Load pet list with error handling
-                loaded_pet_list = data.get("pet_list", [])
-                valid_pets = []
-                
-                for pet in loaded_pet_list:
-                    if pet is None:
-                        continue
+            data = read_save_file(save_path)
+
+            # Load pet list with error handling
+            loaded_pet_list = data.get("pet_list", [])
+            valid_pets = []
+            
+            for pet in loaded_pet_list:
+                if pet is None:
+                    continue
+                    
+                try:
+                    # Test basic pet attributes safely
+                    if (hasattr(pet, 'name') and hasattr(pet, 'module') and 
+                        hasattr(pet, 'stage') and hasattr(pet, 'state')):
                         
-                    try:
-                        # Test basic pet attributes safely
-                        if (hasattr(pet, 'name') and hasattr(pet, 'module') and 
-                            hasattr(pet, 'stage') and hasattr(pet, 'state')):
-                            
-                            # Initialize missing attributes for compatibility
-                            if not hasattr(pet, 'trophies'):
-                                pet.trophies = 0
-                            if not hasattr(pet, 'vital_values'):
-                                pet.vital_values = 0
-                            # Ensure PvP counters exist for compatibility with older saves
-                            if not hasattr(pet, 'pvp_battles'):
-                                pet.pvp_battles = 0
-                            if not hasattr(pet, 'pvp_wins'):
-                                pet.pvp_wins = 0
-                            
-                            # Apply any patches from the pet class
-                            if hasattr(pet, 'patch'):
-                                pet.patch()
-                                
-                            valid_pets.append(pet)
-                            print(f"[Game] Successfully loaded pet: {pet.name}")
-                        else:
-                            print(f"[Game] Pet missing required attributes, skipping")
-                            continue
+                        # Initialize missing attributes for compatibility
+                        if not hasattr(pet, 'trophies'):
+                            pet.trophies = 0
+                        if not hasattr(pet, 'vital_values'):
+                            pet.vital_values = 0
+                        # Ensure PvP counters exist for compatibility with older saves
+                        if not hasattr(pet, 'pvp_battles'):
+                            pet.pvp_battles = 0
+                        if not hasattr(pet, 'pvp_wins'):
+                            pet.pvp_wins = 0
+                        
+                        # Apply any patches from the pet class
+                        if hasattr(pet, 'patch'):
+                            pet.patch()
                             
-                    except Exception as e:
-                        print(f"[Game] Failed to load pet (removing from save): {e}")
+                        valid_pets.append(pet)
+                        print(f"[Game] Successfully loaded pet: {pet.name}")
+                    else:
+                        print(f"[Game] Pet missing required attributes, skipping")
                         continue
-                
-                pet_list = valid_pets
-                poop_list = data.get("poop_list", [])
-                for poop in poop_list:
-                    poop.patch()  # Ensure all poops have necessary attributes
-
-                traited = data.get("traited", [])
-                gcell_fragments = data.get("gcell_fragments", [])
-                game_background = data.get("game_background", None)
-                battle_area = data.get("battle_area", {})
-                battle_round = data.get("battle_round", {})
-                last_adventure_module = data.get("last_adventure_module", None)
-                background_module_name = data.get("background_module_name", None)
-                unlocks = data.get("unlocks", {})
-                showClock = data.get("showClock", True)
-                sound = data.get("sound", 1)
-                xai = data.get("xai", random.randint(1, 7))
-                xai_date = data.get("xai_date", datetime.date.today())
-                inventory = data.get("inventory", {})
-                battle_effects = data.get("battle_effects", {})
-                background_high_res = data.get("background_high_res", False)
-                wake_time = data.get("wake_time", None)
-                sleep_time = data.get("sleep_time", None)
-                screen_timeout = data.get("screen_timeout", 60)
-                quests = data.get("quests", [])
-                event = data.get("event", None)
-                event_time = data.get("event_time", None)
-                sprite_resolution_preference = data.get("sprite_resolution_preference", 0)
-                total_victories = data.get("total_victories", {})
-
-                print(f"[Game] Successfully loaded save file: {os.path.basename(save_path)} with {len(pet_list)} valid pets")
-                return  # Successfully loaded, exit the function
-                
+                        
+                except Exception as e:
+                    print(f"[Game] Failed to load pet (removing from save): {e}")
+                    continue
+            
+            pet_list = valid_pets
+
+            poop_list = data.get("poop_list", [])
+            for poop in poop_list:
+                poop.patch()  # Ensure all poops have necessary attributes
+
+            traited = data.get("traited", [])
+            gcell_fragments = data.get("gcell_fragments", [])
+            game_background = data.get("game_background", None)
+            battle_area = data.get("battle_area", {})
+            battle_round = data.get("battle_round", {})
+            last_adventure_module = data.get("last_adventure_module", None)
+            background_module_name = data.get("background_module_name", None)
+            unlocks = data.get("unlocks", {})
+            showClock = data.get("showClock", True)
+            sound = data.get("sound", 1)
+            xai = data.get("xai", random.randint(1, 7))
+            xai_date = data.get("xai_date", datetime.date.today())
+            inventory = data.get("inventory", {})
+            battle_effects = data.get("battle_effects", {})
+            background_high_res = data.get("background_high_res", False)
+            wake_time = data.get("wake_time", None)
+            sleep_time = data.get("sleep_time", None)
+            screen_timeout = data.get("screen_timeout", 60)
+            quests = data.get("quests", [])
+            event = data.get("event", None)
+            event_time = data.get("event_time", None)
+            sprite_resolution_preference = data.get("sprite_resolution_preference", 0)
+            total_victories = data.get("total_victories", {})
+
+            # Replay the time the game was closed; older saves fall back to the file time
+            saved_at = data.get("saved_at") or os.path.getmtime(save_path)
+            try:
+                catch_up(pet_list, saved_at)
+            except Exception as e:
+                print(f"[Game] Offline catch-up failed, pets resume where they were saved: {e}")
+
+            # Sprites are loaded here, after the whole file was read and the pets caught up
+            # (they may have evolved or died), instead of while decoding
+            if load_sprites:
+                for pet in pet_list:
+                    pet.load_saved_sprite()
+
+            print(f"[Game] Successfully loaded save file: {os.path.basename(save_path)} with {len(pet_list)} valid pets")
+            return  # Successfully loaded, exit the function
+            
         except Exception as e:
             print(f"[Game] Failed to load save file {os.path.basename(save_path)}: {e}")
             continue  # Try the next save file
@@ -359,9 +451,12 @@ def autosave() -> None:
     """
     Automatically saves the game if the autosave interval has passed.
     """
+    from core.game_digidex import flush_digidex
     global _last_save_time
     now = time.time()
 
+    flush_digidex()
+
     if now - _last_save_time >= AUTOSAVE_INTERVAL_SECONDS:
         save()
         _last_save_time = now
@@ -4,6 +4,7 @@ import core.constants as constants
 import core.runtime_globals as runtime_globals
 from core.utils.asset_utils import font_load
 from core.utils.pygame_utils import blit_with_shadow, get_font
+from core.utils.text_cache import text_cache
 
 
 class GameMessage:
@@ -17,7 +18,7 @@ class GameMessage:
 
     def add(self, text: str, pos: tuple[int, int], color: tuple[int, int, int], font_size=None):
         font = font_load(TEXT_FONT, font_size)
-        surface = font.render(text, True, color).convert_alpha()
+        surface = text_cache.render(font, text, color).convert_alpha()
         self.messages.append([surface, list(pos), 255, 0])
 
     def add_slide(self, text: str, color: tuple[int, int, int], y: int, font_size=None):
@@ -57,7 +58,7 @@ class GameMessage:
         elif self.slide_queue:
             text, color, y, font_size = self.slide_queue.pop(0)
             font = get_font(font_size)
-            surf = font.render(text, True, color).convert_alpha()
+            surf = text_cache.render(font, text, color).convert_alpha()
             start_x = runtime_globals.SCREEN_WIDTH  # Start off-screen
             surf.set_alpha(255)
             self.current_slide = (surf, [start_x, y], 255)
@@ -8,9 +8,12 @@ from core.utils.asset_utils import image_load, open_json, resolve_path
 from core import runtime_globals
 import core.constants as constants
 from core.game_enemy import GameEnemy
+from core.evolution_rules import CompiledEvolutions, compile_evolutions
 import copy
 
 from core.game_item import GameItem
+from core.module_data_store import ModuleDataStore
+from core.utils.module_cache import load_module_cache
 from core.quest_event_data import QuestData, EventData
 
 
@@ -31,121 +34,135 @@ class GameModule:
         self.unlocks = {"eggs": [], "backgrounds": [], "evolutions": []}
         self.backgrounds = []
         self.visible_stats = []
+        self.data = ModuleDataStore(folder_path)
+        self._evolutions = {}
+        self._evolutions_source = None  # ModuleDataStore.monsters list the rules were compiled from
+        self.cached_files = load_module_cache(resolve_path(folder_path)) or {}
+        if "monster.json" in self.cached_files:
+            self.data.seed_monsters(self.cached_files.pop("monster.json"))
+        if "battle.json" in self.cached_files:
+            self.data.seed_enemies(self.cached_files.pop("battle.json"))
         self.load_module_data()
         self.load_sprites()
         self.load_items()
 
+    def _read_json(self, filename: str):
+        """Returns the parsed contents of a module JSON file, preferring the precompiled module cache."""
+        if filename in self.cached_files:
+            return self.cached_files[filename]
+        with open_json(os.path.join(self.folder_path, filename)) as file:
+            return json.load(file)
+
     def load_module_data(self) -> None:
         json_path = os.path.join(self.folder_path, "module.json")
         resolved_path = resolve_path(json_path)
         if os.path.exists(resolved_path):
             try:
-                with open_json(json_path) as file:
-                    data = json.load(file)
-                    self.name = data.get("name", "default")
-                    self.name_format = data.get("name_format", "$_dmc")
-                    self.ruleset = data.get("ruleset", "dmc")
-                    self.author = data.get("author", "Unknown")
-                    self.version = data.get("version", "1.0")
-                    self.category = data.get("category", "Custom")
-                    self.description = data.get("description", "No description available.")
-
-                    self.adventure_mode = data.get("adventure_mode", False)
-
-                    self.meat_weight_gain = int(data.get("care_meat_weight_gain"))
-                    self.meat_hunger_gain = float(data.get("care_meat_hunger_gain"))
-                    self.meat_care_mistake_time = int(data.get("care_meat_care_mistake_time"))
-                    self.overfeed_timer = int(data.get("care_overfeed_timer"))
-                    self.use_condition_hearts = bool(data.get("care_condition_heart", False))
-                    self.can_eat_sleeping = bool(data.get("care_can_eat_sleeping", True))
-                    
-                    self.back_to_sleep_time = int(data.get("care_back_to_sleep_time", 10))
-                    self.enable_shaken_egg = bool(data.get("care_enable_shaken_egg", False))
-
-                    self.protein_weight_gain = int(data.get("care_protein_weight_gain"))
-                    self.protein_strengh_gain = float(data.get("care_protein_strengh_gain"))
-                    self.protein_dp_gain = int(data.get("care_protein_dp_gain"))
-                    self.protein_care_mistake_time = int(data.get("care_protein_care_mistake_time"))
-                    self.protein_overdose_max = int(data.get("care_protein_overdose_max", 0))
-                    self.protein_penalty = int(data.get("care_protein_penalty", 10))
-                    self.disturbance_penalty_max = int(data.get("care_disturbance_penalty_max", 0))
-
-                    self.care_flush_disturbance_sleep = bool(data.get("care_flush_disturbance_sleep", True))
-
-                    self.sleep_care_mistake_timer = int(data.get("care_sleep_care_mistake_timer"))
-
-                    self.training_effort_gain = int(data.get("training_effort_gain", 0))
-
-                    self.training_strengh_gain_win = int(data.get("training_strengh_gain_win", 1))
-                    self.training_strengh_gain_lose = int(data.get("training_strengh_gain_lose", 0))
-                    self.training_strengh_multiplier = float(data.get("training_strengh_multiplier", 1.0))
-
-                    self.training_weight_win = int(data.get("training_weight_win", 1))
-                    self.training_weight_lose = int(data.get("training_weight_lose", 1))
-
-                    self.traited_egg_starting_level = int(data.get("traited_egg_starting_level"))
-
-                    self.reverse_atk_frames = bool(data.get("reverse_atk_frames", False))
-
-                    self.battle_base_sick_chance_win = int(data.get("battle_base_sick_chance_win"))
-                    self.battle_base_sick_chance_lose = int(data.get("battle_base_sick_chance_lose"))
-                    self.battle_atribute_advantage = int(data.get("battle_atribute_advantage", 5))
-                    self.battle_global_hit_points = int(data.get("battle_global_hit_points", 0))
-                    # sequential rounds is a boolean flag in newer module.json files
-                    self.battle_sequential_rounds = bool(data.get("battle_sequential_rounds", False))
-
-                    self.death_max_injuries = int(data.get("death_max_injuries"))
-                    self.death_sick_timer = int(data.get("death_sick_timer"))
-                    self.death_hunger_timer = int(data.get("death_hunger_timer"))
-                    self.death_starvation_count = int(data.get("death_starvation_count"))
-                    self.death_strength_timer = int(data.get("death_strength_timer"))
-                    self.death_stage45_mistake = int(data.get("death_stage45_mistake"))
-                    self.death_stage67_mistake = int(data.get("death_stage67_mistake"))
-                    self.death_care_mistake = int(data.get("death_care_mistake",999999))
-                    self.death_save_by_b_press = int(data.get("death_save_by_b_press",0))
-                    self.death_save_by_shake = int(data.get("death_save_by_shake",0))
-                    self.death_old_age = int(data.get("death_old_age",0))
-                    
-                    self.hp_max_item_boost = int(data.get("hp_max_item_boost", 0))
-                    self.atk_max_item_boost = int(data.get("atk_max_item_boost", 0))
-                    self.power_max_item_boost = int(data.get("power_max_item_boost", 0))
-
-                    self.vital_value_base = int(data.get("vital_value_base", 50))
-                    self.vital_value_loss = int(data.get("vital_value_loss", 50))
-
-                    # G-Cell system configuration
-                    self.use_gcells = bool(data.get("use_gcells", False))
-                    self.gcell_random_encounter_win = int(data.get("gcell_random_encounter_win", 0))
-                    self.gcell_random_encounter_loose = int(data.get("gcell_random_encounter_loose", 0))
-                    self.gcell_battle_win = int(data.get("gcell_battle_win", 0))
-                    self.gcell_battle_loose = int(data.get("gcell_battle_loose", 0))
-                    self.gcell_training_success = int(data.get("gcell_training_success", 0))
-                    self.gcell_training_phase2_failure = int(data.get("gcell_training_phase2_failure", 0))
-                    self.gcell_training_phase1_failure = int(data.get("gcell_training_phase1_failure", 0))
-                    self.gcell_protein = int(data.get("gcell_protein", 0))
-                    self.gcell_care_mistake = int(data.get("gcell_care_mistake", 0))
-
-                    if self.battle_global_hit_points > 0:
-                        self.battle_damage_limit = 1 + (self.battle_global_hit_points // 2)
-                    else:
-                        self.battle_damage_limit = 99
-                    
-                    self.unlocks = data.get("unlocks", {
-                        "eggs": [],
-                        "backgrounds": [],
-                        "evolutions": []
-                    })
-
-                    self.backgrounds = data.get("backgrounds", [])
-
-                    # Add missing attributes
-                    self.high_definition_sprites = bool(data.get("high_definition_sprites", False))
-
-                    visible_stats_raw = data.get("visible_stats", "")
-                    if isinstance(visible_stats_raw, str):
-                        self.visible_stats = [s.strip() for s in visible_stats_raw.split(",") if s.strip()]
-                    elif isinstance(visible_stats_raw, list):
-                        self.visible_stats = visible_stats_raw
+                data = self._read_json("module.json")
+                self.name = data.get("name", "default")
+                self.name_format = data.get("name_format", "$_dmc")
+                self.ruleset = data.get("ruleset", "dmc")
+                self.author = data.get("author", "Unknown")
+                self.version = data.get("version", "1.0")
+                self.category = data.get("category", "Custom")
+                self.description = data.get("description", "No description available.")
+
+                self.adventure_mode = data.get("adventure_mode", False)
+
+                self.meat_weight_gain = int(data.get("care_meat_weight_gain"))
+                self.meat_hunger_gain = float(data.get("care_meat_hunger_gain"))
+                self.meat_care_mistake_time = int(data.get("care_meat_care_mistake_time"))
+                self.overfeed_timer = int(data.get("care_overfeed_timer"))
+                self.use_condition_hearts = bool(data.get("care_condition_heart", False))
+                self.can_eat_sleeping = bool(data.get("care_can_eat_sleeping", True))
+                
+                self.back_to_sleep_time = int(data.get("care_back_to_sleep_time", 10))
+                self.enable_shaken_egg = bool(data.get("care_enable_shaken_egg", False))
+
+                self.protein_weight_gain = int(data.get("care_protein_weight_gain"))
+                self.protein_strengh_gain = float(data.get("care_protein_strengh_gain"))
+                self.protein_dp_gain = int(data.get("care_protein_dp_gain"))
+                self.protein_care_mistake_time = int(data.get("care_protein_care_mistake_time"))
+                self.protein_overdose_max = int(data.get("care_protein_overdose_max", 0))
+                self.protein_penalty = int(data.get("care_protein_penalty", 10))
+                self.disturbance_penalty_max = int(data.get("care_disturbance_penalty_max", 0))
+
+                self.care_flush_disturbance_sleep = bool(data.get("care_flush_disturbance_sleep", True))
+
+                self.sleep_care_mistake_timer = int(data.get("care_sleep_care_mistake_timer"))
+
+                self.training_effort_gain = int(data.get("training_effort_gain", 0))
+
+                self.training_strengh_gain_win = int(data.get("training_strengh_gain_win", 1))
+                self.training_strengh_gain_lose = int(data.get("training_strengh_gain_lose", 0))
+                self.training_strengh_multiplier = float(data.get("training_strengh_multiplier", 1.0))
+
+                self.training_weight_win = int(data.get("training_weight_win", 1))
+                self.training_weight_lose = int(data.get("training_weight_lose", 1))
+
+                self.traited_egg_starting_level = int(data.get("traited_egg_starting_level"))
+
+                self.reverse_atk_frames = bool(data.get("reverse_atk_frames", False))
+
+                self.battle_base_sick_chance_win = int(data.get("battle_base_sick_chance_win"))
+                self.battle_base_sick_chance_lose = int(data.get("battle_base_sick_chance_lose"))
+                self.battle_atribute_advantage = int(data.get("battle_atribute_advantage", 5))
+                self.battle_global_hit_points = int(data.get("battle_global_hit_points", 0))
+                # sequential rounds is a boolean flag in newer module.json files
+                self.battle_sequential_rounds = bool(data.get("battle_sequential_rounds", False))
+
+                self.death_max_injuries = int(data.get("death_max_injuries"))
+                self.death_sick_timer = int(data.get("death_sick_timer"))
+                self.death_hunger_timer = int(data.get("death_hunger_timer"))
+                self.death_starvation_count = int(data.get("death_starvation_count"))
+                self.death_strength_timer = int(data.get("death_strength_timer"))
+                self.death_stage45_mistake = int(data.get("death_stage45_mistake"))
+                self.death_stage67_mistake = int(data.get("death_stage67_mistake"))
+                self.death_care_mistake = int(data.get("death_care_mistake",999999))
+                self.death_save_by_b_press = int(data.get("death_save_by_b_press",0))
+                self.death_save_by_shake = int(data.get("death_save_by_shake",0))
+                self.death_old_age = int(data.get("death_old_age",0))
+                
+                self.hp_max_item_boost = int(data.get("hp_max_item_boost", 0))
+                self.atk_max_item_boost = int(data.get("atk_max_item_boost", 0))
+                self.power_max_item_boost = int(data.get("power_max_item_boost", 0))
+
+                self.vital_value_base = int(data.get("vital_value_base", 50))
+                self.vital_value_loss = int(data.get("vital_value_loss", 50))
+
+                # G-Cell system configuration
+                self.use_gcells = bool(data.get("use_gcells", False))
+                self.gcell_random_encounter_win = int(data.get("gcell_random_encounter_win", 0))
+                self.gcell_random_encounter_loose = int(data.get("gcell_random_encounter_loose", 0))
+                self.gcell_battle_win = int(data.get("gcell_battle_win", 0))
+                self.gcell_battle_loose = int(data.get("gcell_battle_loose", 0))
+                self.gcell_training_success = int(data.get("gcell_training_success", 0))
+                self.gcell_training_phase2_failure = int(data.get("gcell_training_phase2_failure", 0))
+                self.gcell_training_phase1_failure = int(data.get("gcell_training_phase1_failure", 0))
+                self.gcell_protein = int(data.get("gcell_protein", 0))
+                self.gcell_care_mistake = int(data.get("gcell_care_mistake", 0))
+
+                if self.battle_global_hit_points > 0:
+                    self.battle_damage_limit = 1 + (self.battle_global_hit_points // 2)
+                else:
+                    self.battle_damage_limit = 99
+                
+                self.unlocks = data.get("unlocks", {
+                    "eggs": [],
+                    "backgrounds": [],
+                    "evolutions": []
+                })
+
+                self.backgrounds = data.get("backgrounds", [])
+
+                # Add missing attributes
+                self.high_definition_sprites = bool(data.get("high_definition_sprites", False))
+
+                visible_stats_raw = data.get("visible_stats", "")
+                if isinstance(visible_stats_raw, str):
+                    self.visible_stats = [s.strip() for s in visible_stats_raw.split(",") if s.strip()]
+                elif isinstance(visible_stats_raw, list):
+                    self.visible_stats = visible_stats_raw
             except json.JSONDecodeError:
                 runtime_globals.game_console.log(f"⚠️ Failed to parse {json_path}")
         else:
@@ -156,13 +173,12 @@ class GameModule:
         json_path = os.path.join(self.folder_path, "item.json")
         resolved_path = resolve_path(json_path)
         if os.path.exists(resolved_path):
-            with open_json(json_path) as file:
-                try:
-                    data = json.load(file)
-                    # Expecting a list of items in the JSON file
-                    self.items = self.load_items_from_json(data, self.name)
-                except json.JSONDecodeError:
-                    runtime_globals.game_console.log(f"Error: Failed to parse {json_path}")
+            try:
+                data = self._read_json("item.json")
+                # Expecting a list of items in the JSON file
+                self.items = self.load_items_from_json(data, self.name)
+            except json.JSONDecodeError:
+                runtime_globals.game_console.log(f"Error: Failed to parse {json_path}")
         else:
             self.items = {}
 
@@ -174,9 +190,8 @@ class GameModule:
             return []
             
         try:
-            with open_json(json_path) as file:
-                data = json.load(file)
-                return self.parse_quests_from_json(data)
+            data = self._read_json("quests.json")
+            return self.parse_quests_from_json(data)
         except json.JSONDecodeError:
             runtime_globals.game_console.log(f"Error: Failed to parse {json_path}")
             return []
@@ -189,9 +204,8 @@ class GameModule:
             return []
             
         try:
-            with open_json(json_path) as file:
-                data = json.load(file)
-                return self.parse_events_from_json(data)
+            data = self._read_json("events.json")
+            return self.parse_events_from_json(data)
         except json.JSONDecodeError:
             runtime_globals.game_console.log(f"Error: Failed to parse {json_path}")
             return []
@@ -329,82 +343,46 @@ class GameModule:
         runtime_globals.game_module_flag[self.name] = sprite_load(flag_path, size=(runtime_globals.OPTION_ICON_SIZE, runtime_globals.OPTION_ICON_SIZE))
 
     def get_monsters_by_stage(self, stage: int, special_list: list[str] = None) -> list[dict]:
-        monsters = []
-        json_path = os.path.join(self.folder_path, "monster.json")
-        resolved_path = resolve_path(json_path)
-
-        if not os.path.exists(resolved_path):
-            runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
-            return monsters
+        if not self.data.load_monsters():
+            runtime_globals.game_console.log(f"⚠️ Monster file {self.data.monster_path} not found.")
+            return []
 
-        try:
-            with open_json(json_path) as file:
-                data = json.load(file)
-                for monster in data.get("monster", []):
-                    if monster["stage"] == stage and (special_list is None or (monster["special"] and monster["name"] in special_list)):
-                        monster["module"] = self.name
-                        monsters.append(monster)
-
-                runtime_globals.game_console.log(f"✅ Loaded {len(monsters)} monsters from stage {stage}.")
-                return monsters
-        except json.JSONDecodeError:
-            runtime_globals.game_console.log(f"⚠️ Failed to parse {json_path}")
-            return monsters
+        monsters = self.data.get_monsters_by_stage(stage, special_list)
+        for monster in monsters:
+            monster["module"] = self.name
+        runtime_globals.game_console.log(f"✅ Loaded {len(monsters)} monsters from stage {stage}.")
+        return monsters
 
     def get_monster(self, name: str, version: int) -> Optional[dict]:
-        json_path = os.path.join(self.folder_path, "monster.json")
-        resolved_path = resolve_path(json_path)
-
-        if not os.path.exists(resolved_path):
-            runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
+        if not self.data.load_monsters():
+            runtime_globals.game_console.log(f"⚠️ Monster file {self.data.monster_path} not found.")
             return None
+        return self.data.get_monster(name, version)
 
-        try:
-            with open_json(json_path) as file:
-                data = json.load(file)
-                for monster in data.get("monster", []):
-                    if monster["name"] == name and monster["version"] == version:
-                        return monster
-        except json.JSONDecodeError:
-            runtime_globals.game_console.log(f"⚠️ Failed to parse {json_path}")
-        return None
-
-    def _parse_battle_json(self, path):
-        """Helper to load and normalize battle.json data to a list of dicts."""
-        resolved_path = resolve_path(path)
-        if not os.path.exists(resolved_path):
-            return []
-        try:
-            with open_json(path) as file:
-                data = json.load(file)
-                if isinstance(data, dict) and "enemies" in data and isinstance(data["enemies"], list):
-                    return data["enemies"]
-                elif isinstance(data, list):
-                    return data
-                else:
-                    return []
-        except Exception as e:
-            runtime_globals.game_console.log(f"⚠️ Failed to parse {path}: {e}")
-            return []
+    def get_evolutions(self, name: str, version: int) -> Optional[CompiledEvolutions]:
+        """
+        Compiled evolve rules of a monster. The whole module is compiled on
+        first use and again whenever monster.json is reindexed.
+        """
+        if not self.data.load_monsters():
+            return None
+        if self._evolutions_source is not self.data.monsters:
+            self._evolutions_source = self.data.monsters
+            self._evolutions = compile_evolutions(self)
+        return self._evolutions.get((name, version))
 
     def get_enemies(self, area: int, round: int, versions: List[int]) -> List[Optional[GameEnemy]]:
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
-            runtime_globals.game_console.log(f"⚠️ Enemy file {battle_path} not found or empty.")
+        if not self.data.load_enemies():
+            runtime_globals.game_console.log(f"⚠️ Enemy file {self.data.battle_path} not found or empty.")
             return [None] * len(versions)
 
         id = 1
         selected = []
         for v in versions:
-            match = next(
-                (e for e in all_enemies
-                 if int(e.get("area", -1)) == int(area)
-                 and int(e.get("round", -1)) == int(round)
-                 and int(e.get("version", -1)) == int(v)),
-                None
-            )
+            match = self.data.get_enemy_entry(area, round, v)
             if match:
+                # Copy so the indexed row stays untouched
+                match = dict(match)
                 if "handicap" not in match:
                     match["handicap"] = 0
                 match["id"] = id
@@ -422,111 +400,56 @@ class GameModule:
         return selected
 
     def get_enemy_versions(self, area: int, round_: int) -> list[int]:
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
-            runtime_globals.game_console.log(f"⚠️ Enemy file {battle_path} not found or empty.")
+        if not self.data.load_enemies():
+            runtime_globals.game_console.log(f"⚠️ Enemy file {self.data.battle_path} not found or empty.")
             return []
-        versions = set()
-        for entry in all_enemies:
-            if int(entry.get("area", -1)) == int(area) and int(entry.get("round", -1)) == int(round_):
-                v = entry.get("version")
-                if v is not None:
-                    versions.add(v)
-        return sorted(versions)
+        return self.data.get_enemy_versions(area, round_)
 
     def area_exists(self, area: int) -> bool:
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
-            runtime_globals.game_console.log(f"⚠️ Enemy file {battle_path} not found or empty.")
+        if not self.data.load_enemies():
+            runtime_globals.game_console.log(f"⚠️ Enemy file {self.data.battle_path} not found or empty.")
             return False
-        for entry in all_enemies:
-            if int(entry.get("area", -1)) == int(area):
-                return True
-        return False
+        return self.data.area_exists(area)
 
     def get_area_round_counts(self) -> dict:
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
-            runtime_globals.game_console.log(f"⚠️ Enemy file {battle_path} not found or empty.")
+        if not self.data.load_enemies():
+            runtime_globals.game_console.log(f"⚠️ Enemy file {self.data.battle_path} not found or empty.")
             return {}
-        area_rounds = {}
-        for entry in all_enemies:
-            area = int(entry.get("area", -1))
-            round_ = int(entry.get("round", -1))
-            if area == -1 or round_ == -1:
-                continue
-            if area not in area_rounds:
-                area_rounds[area] = set()
-            area_rounds[area].add(round_)
-        return {area: len(rounds) for area, rounds in area_rounds.items()}
+        return {area: len(rounds) for area, rounds in self.data.area_rounds.items()}
         
     def is_boss(self, area, round, version):
         """
         Checks if the enemy in the specified area, round, and version is a boss.
         """
-        enemies = self.get_enemies(area, round + 1, [version])
-        return enemies[0] == None
+        if not self.data.load_enemies():
+            return True
+        return self.data.get_enemy_entry(area, round + 1, version) is None
     
     def get_all_monsters(self) -> list[dict]:
         """
         Retorna todos os monstros listados no monster.json deste módulo.
         """
-        json_path = os.path.join(self.folder_path, "monster.json")
-        resolved_path = resolve_path(json_path)
-        if not os.path.exists(resolved_path):
-            runtime_globals.game_console.log(f"⚠️ Monster file {json_path} not found.")
-            return []
-
-        try:
-            with open_json(json_path) as file:
-                data = json.load(file)
-                return data.get("monster", [])
-        except json.JSONDecodeError:
-            runtime_globals.game_console.log(f"⚠️ Failed to parse {json_path}")
+        if not self.data.load_monsters():
+            runtime_globals.game_console.log(f"⚠️ Monster file {self.data.monster_path} not found.")
             return []
+        return list(self.data.monsters)
         
     def is_valid_area_round(self, area: int, round_: int) -> bool:
         """
         Return True if this module has any battle entry for the given area and round.
         """
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
+        if not self.data.load_enemies():
             return False
-        for entry in all_enemies:
-            try:
-                a = int(entry.get("area", -1))
-                r = int(entry.get("round", -1))
-            except Exception:
-                continue
-            if a == int(area) and r == int(round_):
-                return True
-        return False
+        return self.data.is_valid_area_round(area, round_)
 
     def get_available_area_rounds(self) -> dict:
         """
         Return a dict mapping available area -> sorted list of rounds defined
         in this module's battle.json. Example: {1: [1,2,3], 2: [1,2]}
         """
-        battle_path = os.path.join(self.folder_path, "battle.json")
-        all_enemies = self._parse_battle_json(battle_path)
-        if not all_enemies:
+        if not self.data.load_enemies():
             return {}
-        area_rounds = {}
-        for entry in all_enemies:
-            try:
-                a = int(entry.get("area", -1))
-                r = int(entry.get("round", -1))
-            except Exception:
-                continue
-            if a == -1 or r == -1:
-                continue
-            area_rounds.setdefault(a, set()).add(r)
-        # convert sets to sorted lists
-        return {a: sorted(list(rounds)) for a, rounds in area_rounds.items()}
+        return self.data.get_available_area_rounds()
         
 def sprite_load(path, size=None, scale=1):
     """Loads a sprite and optionally scales it to a fixed size or by a scale factor."""
@@ -5,9 +5,11 @@ import random
 from core import game_globals, runtime_globals
 from core.animation import Animation, PetFrame
 import core.constants as constants
+from core.evolution_rules import CompiledEvolutions, EvolutionIndex
 from core.game_digidex import register_digidex_entry
-from core.utils.sprite_utils import load_pet_sprites, convert_sprites_to_list
+from core.utils.sprite_utils import FrameVariants, load_pet_sprites, convert_sprites_to_list
 from core.game_poop import GamePoop
+from core.pet_scheduler import pet_scheduler
 from core.utils.module_utils import get_module
 from core.utils.pygame_utils import blit_with_cache, sprite_load
 from core.utils.scene_utils import change_scene
@@ -62,6 +64,7 @@ class GamePet:
         else:
             self.special_key = None
         self.evolve = data["evolve"]
+        self._evolution_index = None
         self.sleeps = data.get("sleeps")
         self.wakes = data.get("wakes")
         self.atk_main = data.get("atk_main", 0)
@@ -153,8 +156,19 @@ class GamePet:
             self.y = int(190 * runtime_globals.UI_SCALE - runtime_globals.PET_HEIGHT - 5)
         self.x_range = (0, runtime_globals.SCREEN_WIDTH - runtime_globals.PET_WIDTH)
 
-    def get_sprite(self, index):
-        return runtime_globals.pet_sprites[self][index]
+    def get_sprite(self, index, mirrored=False, size=None):
+        """Frame at index; mirrored faces right, size is one of the sizes in sprite_variants()."""
+        if not mirrored and size is None:
+            return runtime_globals.pet_sprites[self][index]
+        return self.sprite_variants().get(index, mirrored, size)
+
+    def sprite_variants(self):
+        """Mirrored and display-size copies of the pet's frames, rebuilt when its frame list is replaced."""
+        frames = runtime_globals.pet_sprites[self]
+        variants = getattr(self, "_sprite_variants", None)
+        if variants is None or variants.frames is not frames:
+            variants = self._sprite_variants = FrameVariants(frames, sizes=((runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT),))
+        return variants
 
     def set_state(self, new_state, force=False):
         if self.state == "dead":
@@ -213,6 +227,9 @@ class GamePet:
                 sprites[PetFrame.ATK1.value], sprites[PetFrame.ATK2.value] = sprites[PetFrame.ATK2.value], sprites[PetFrame.ATK1.value]  # ATK1 ↔ ATK2
             runtime_globals.pet_sprites[self] = sprites
 
+        # Facing-right and battle-size copies, so draw code never transforms
+        self.sprite_variants()
+
     def draw(self, surface):
         # Get base frame; skip if missing
         sprite_list = runtime_globals.pet_sprites.get(self)
@@ -220,11 +237,7 @@ class GamePet:
             return
         
         frame_key = self.animation_frames[self.frame_index].value
-        frame = sprite_list[frame_key]
-        
-        # Flip if facing right
-        if self.direction == 1:
-            frame = pygame.transform.flip(frame, True, False)
+        frame = self.get_sprite(frame_key, mirrored=self.direction == 1)
         
         # Draw base pet sprite
         blit_with_cache(surface, frame, (self.x, self.y))
@@ -265,16 +278,13 @@ class GamePet:
                 blit_with_cache(surface, overlay, (x - runtime_globals.PET_WIDTH - (24 * runtime_globals.UI_SCALE), y + (24 * runtime_globals.UI_SCALE)))
 
     def update(self):
-        self.timer += 1
-        self.age_timer += 1
+        # Timers follow the scheduler clock; minute/hour/day work runs from handle_scheduled_event()
+        pet_scheduler.sync(self)
         self.update_animation()
         self.update_cache()
 
-        if self.state != "nap" and self.state in ("moving", "idle"):
+        if self.state in ("moving", "idle"):
             self.update_idle_movement()
-        elif self.state == "nap":
-            self.sleep_timer += 1
-            self.check_wake_up()
         elif self.state == "pooping":
             if self.frame_counter in [0, int(6 * (constants.FRAME_RATE / 30))]:
                 self.x += int(2 * runtime_globals.UI_SCALE)
@@ -287,43 +297,80 @@ class GamePet:
 
             if self.animation_counter == int(15 * (constants.FRAME_RATE / 30)):
                 self.poop()
-        elif self.state in ("moving", "idle") and self.timer % (constants.FRAME_RATE // 2) == 0 and self.should_sleep():
-            self.set_state("tired")
-
-        # Increase age every day (24 * 60 * 60 = 86.400)
-        if self.age_timer % (constants.FRAME_RATE * 86400) == 0:
-            self.age += 1
-            runtime_globals.game_console.log(f"{self.name} aged to {self.age}")
-
-        # Update immunity timer (only when not sleeping)
-        
 
-        # Check for evolutions once a minute, considering variable constants
-        if self.timer % (constants.FRAME_RATE * 60) == 0:
-            if self.state not in ("nap", "dead"):
-                self.update_evolution()
-                self.update_needs()
-                self.update_pooping()
-                self.update_care_mistakes()
-                self.update_vital_values_loss()
-            if self.state != "nap":
-                self.update_death_save_counters()
-                self.update_death_check()
-
-                if self.death_save_immunity > 0:
-                    self.death_save_immunity -= 1
-                    if self.death_save_immunity == 0:
-                        runtime_globals.game_console.log(f"[Death Save] {self.name} immunity expired!")
-
-            if self.back_to_sleep > 0:
-                self.back_to_sleep -= 1
-                if self.back_to_sleep == 0 and self.state != "nap" and self.should_sleep():
-                    self.set_state("nap")
-
-        # Check for vital values gain every hour (60 minutes)
-        if self.timer % (constants.FRAME_RATE * 60 * 60) == 0:
-            if self.state not in ("nap", "dead"):
+    #=====================================================================
+    # Scheduled events (see core.pet_scheduler)
+    #=====================================================================
+
+    def scheduled_events(self) -> dict:
+        """Initial delay in ticks of each scheduled event, aligned to the pet's timers."""
+        return {
+            "minute": self._ticks_until(self.timer, constants.FRAME_RATE * 60),
+            "hour": self._ticks_until(self.timer, constants.FRAME_RATE * 60 * 60),
+            "day": self._ticks_until(self.age_timer, constants.FRAME_RATE * 86400),
+            "wake": constants.FRAME_RATE,
+        }
+
+    def handle_scheduled_event(self, event: str) -> int:
+        """Runs a due event and returns the delay in ticks until it is due again."""
+        if event == "minute":
+            period = constants.FRAME_RATE * 60
+            # A timer changed outside the scheduler (evolution, items) moves the boundary
+            if self.timer % period == 0:
+                self.update_minute()
+            return self._ticks_until(self.timer, period)
+        if event == "hour":
+            period = constants.FRAME_RATE * 60 * 60
+            if self.timer % period == 0 and self.state not in ("nap", "dead"):
                 self.update_vital_values_gain()
+            return self._ticks_until(self.timer, period)
+        if event == "day":
+            # Increase age every day (24 * 60 * 60 = 86.400)
+            period = constants.FRAME_RATE * 86400
+            if self.age_timer % period == 0:
+                self.age += 1
+                runtime_globals.game_console.log(f"{self.name} aged to {self.age}")
+            return self._ticks_until(self.age_timer, period)
+        if event == "wake":
+            if self.state == "nap":
+                self.check_wake_up()
+            return constants.FRAME_RATE
+        return 0
+
+    @staticmethod
+    def _ticks_until(counter: int, period: int) -> int:
+        return period - counter % period
+
+    def update_minute(self):
+        # Check for evolutions once a minute, considering variable constants
+        if self.state not in ("nap", "dead"):
+            self.update_evolution()
+            self.update_care_rules()
+        if self.state != "nap":
+            self.update_death_save_counters()
+            self.update_death_check()
+        self.update_countdowns()
+
+    def update_care_rules(self, now=None, alert=True):
+        """Needs, pooping, care mistakes and vital value loss for one minute. Also replayed by core.pet_catchup."""
+        self.update_needs()
+        self.update_pooping()
+        self.update_care_mistakes(now, alert)
+        self.update_vital_values_loss()
+
+    def update_countdowns(self, now=None):
+        """Death save immunity and back-to-sleep countdowns for one minute."""
+        if self.state != "nap" and self.death_save_immunity > 0:
+            self.death_save_immunity -= 1
+            if self.death_save_immunity == 0:
+                runtime_globals.game_console.log(f"[Death Save] {self.name} immunity expired!")
+
+        if self.back_to_sleep > 0:
+            self.back_to_sleep -= 1
+            if self.back_to_sleep == 0 and self.state != "nap" and self.should_sleep(now):
+                self.set_state("nap")
+                if now:
+                    self.sleep_start_time = now
 
     def update_cache(self):
         # Check for changes that require cache invalidation
@@ -394,7 +441,7 @@ class GamePet:
 
     def update_animation(self):
         # Handle special 'nope' animation with direction flip
-        if self.state == "nope" and self.timer % constants.FRAME_RATE == 0:
+        if self.state == "nope" and self.animation_counter % constants.FRAME_RATE == 0:
             self.direction *= -1
 
         # Choppy animation sync for movement
@@ -420,16 +467,19 @@ class GamePet:
         if self.stage == 0 and ((self.timer / constants.FRAME_RATE) - (self.time * 60)) >= -5:
             self.set_state("hatch")
 
-    def evolve_to(self, name, version):
+    def evolve_to(self, name, version, alert=True):
+        """alert=False (offline catch-up) changes the pet without the sound, sprites or animation; load_saved_sprite() follows."""
         runtime_globals.game_console.log(f"Evolving to {name}")
-        runtime_globals.game_sound.play("evolution")
+        if alert:
+            runtime_globals.game_sound.play("evolution")
         module = get_module(self.module)
         pet_data = module.get_monster(name, version)
         pet_data["module"] = module.name
         self.set_data(pet_data)
         self.reset_variables()
-        self.load_sprite()
-        self.set_state("happy1")
+        if alert:
+            self.load_sprite()
+            self.set_state("happy1")
         register_digidex_entry(self.name, module.name, self.version)
 
     def armor_evolve(self, item_name):
@@ -456,15 +506,19 @@ class GamePet:
 
     def poop(self):
         runtime_globals.game_sound.play("cancel")
+        self.drop_poop()
+        self.set_state("idle")
+
+    def drop_poop(self):
+        """Adds a poop next to the pet and takes its weight off (no sound or animation)."""
         if random.random() < 0.2:
             game_globals.poop_list.append(GamePoop((12 * runtime_globals.UI_SCALE) + self.x + (constants.FRAME_SIZE // 2), self.y + (runtime_globals.PET_HEIGHT-(48 * runtime_globals.UI_SCALE)), True))
         else:
             game_globals.poop_list.append(GamePoop((12 * runtime_globals.UI_SCALE) + self.x + (constants.FRAME_SIZE // 2), self.y + (runtime_globals.PET_HEIGHT-(24 * runtime_globals.UI_SCALE))))
         if self.weight > self.min_weight:
             self.weight -= 1
-        self.set_state("idle")
 
-    def check_death_conditions(self):
+    def check_death_conditions(self, alert=True):
         if self.state in ["nap", "dead"]:
             return False
 
@@ -509,20 +563,22 @@ class GamePet:
                 # Activate B-press death save
                 self.death_save_b_counter = module.death_save_by_b_press
                 self.dying = True
-                runtime_globals.game_sound.play("alarm")
+                if alert:
+                    runtime_globals.game_sound.play("alarm")
                 runtime_globals.game_console.log(f"[Death Save] {self.name} needs {module.death_save_by_b_press} B presses in 60 seconds!")
                 return False
             elif module.death_save_by_shake > 0 and self.death_save_shake_counter == 0:
                 # Activate shake death save
                 self.death_save_shake_counter = module.death_save_by_shake
                 self.dying = True
-                runtime_globals.game_sound.play("alarm")
+                if alert:
+                    runtime_globals.game_sound.play("alarm")
                 runtime_globals.game_console.log(f"[Death Save] {self.name} needs {module.death_save_by_shake} shakes in 60 seconds!")
                 return False
 
         return result
 
-    def update_death_save_counters(self):
+    def update_death_save_counters(self, alert=True):
         """Update death save counters and handle success/failure."""
         # Countdown the timer
         if self.dying:
@@ -534,24 +590,30 @@ class GamePet:
                 self.death_save_shake_counter = 0
                 self.dying = False
                 self.set_state("happy2")
-                runtime_globals.game_sound.play("happy")
+                if alert:
+                    runtime_globals.game_sound.play("happy")
                 runtime_globals.game_console.log(f"[Death Save] {self.name} was saved! 60-minute immunity granted.")
 
-    def update_death_check(self):
-        """Checks pet death conditions and updates the sprite accordingly."""
-        if self.check_death_conditions() and self.death_save_immunity == 0:
+    def update_death_check(self, alert=True):
+        """
+        Checks pet death conditions and updates the sprite accordingly.
+        alert=False (offline catch-up) only changes the state: no sound or dead frame
+        (load_saved_sprite() shows it), and the removal is left to the first live minute.
+        """
+        if self.check_death_conditions(alert) and self.death_save_immunity == 0:
             self.set_state("dead")
-            runtime_globals.game_sound.play("death")
+            if alert:
+                runtime_globals.game_sound.play("death")
 
-            # 🔹 Load dead frame with sprite_load()
-            dead_sprite = sprite_load(constants.DEAD_FRAME_PATH, size=(runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
-            runtime_globals.pet_sprites[self][0] = dead_sprite
-            runtime_globals.pet_sprites[self][1] = dead_sprite
+                # 🔹 Load dead frame with sprite_load()
+                dead_sprite = sprite_load(constants.DEAD_FRAME_PATH, size=(runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
+                runtime_globals.pet_sprites[self][0] = dead_sprite
+                runtime_globals.pet_sprites[self][1] = dead_sprite
 
             self.timer = 0
 
         # 🔥 Remove pet from game if dead for too long
-        if self.state == "dead" and self.timer > 9000:
+        if alert and self.state == "dead" and self.timer > 9000:
             if self in game_globals.pet_list:
                 game_globals.pet_list.remove(self)
                 del runtime_globals.pet_sprites[self]
@@ -630,88 +692,42 @@ class GamePet:
         self.injuries += 1
         self.set_state("sick")
 
-    def update_evolution(self):
-        if self.stage > 5 or (self.timer / ( constants.FRAME_RATE * 60)) < self.time or self.need_care():
-            return
-        
-        for evo in self.evolve:
-            def in_range(val, r): return r[0] <= val <= r[1]
-            def in_time_range(time_range):
-                try:
-                    now_time = datetime.now().time()
-                    start_time = datetime.strptime(time_range[0].strip(), "%H:%M").time()
-                    end_time = datetime.strptime(time_range[1].strip(), "%H:%M").time()
-                    
-                    if start_time < end_time:
-                        return start_time <= now_time <= end_time
-                    else:
-                        # Handle overnight range (e.g., 23:00 to 01:00)
-                        return now_time >= start_time or now_time <= end_time
-                except Exception as e:
-                    runtime_globals.game_console.log(f"[!] Error parsing time_range: {e}")
-                    return False
-                    
-            if (
-                ("jogress" in evo) or ("item" in evo) or
-                ("mistakes" in evo and not in_range(self.mistakes, evo["mistakes"])) or
-                ("condition_hearts" in evo and not in_range(self.condition_hearts, evo["condition_hearts"])) or
-                ("training" in evo and not in_range(self.effort, evo["training"])) or
-                ("overfeed" in evo and not in_range(self.overfeed, evo["overfeed"])) or
-                ("special_encounter" in evo and not self.special_encounter) or
-                ("level" in evo and not in_range(self.level, evo["level"])) or
-                ("quests_completed" in evo and not in_range(self.quests_completed, evo["quests_completed"])) or
-                ("weight" in evo and not in_range(self.weight, evo["weight"])) or
-                ("trophies" in evo and not in_range(self.trophies, evo["trophies"])) or
-                ("vital_values" in evo and not in_range(self.vital_values, evo["vital_values"])) or
-                ("blue_gcells" in evo and not in_range(self.get_blue_gcells(), evo["blue_gcells"])) or
-                ("yellow_gcells" in evo and not in_range(self.get_yellow_gcells(), evo["yellow_gcells"])) or
-                ("red_gcells" in evo and not in_range(self.get_red_gcells(), evo["red_gcells"])) or
-                ("gcell_level" in evo and not in_range(self.get_gcell_level(), evo["gcell_level"])) or
-                ("gcell_hatch" in evo and not self.gcell_fragment) or
-                ("stage-5" in evo and not in_range(self.enemy_kills[5], evo["stage-5"])) or
-                ("stage-6" in evo and not in_range(self.enemy_kills[6], evo["stage-6"])) or
-                ("stage-7" in evo and not in_range(self.enemy_kills[7], evo["stage-7"])) or
-                ("stage-8" in evo and not in_range(self.enemy_kills[8], evo["stage-8"])) or
-                ("stage-9" in evo and not in_range(self.enemy_kills[9], evo["stage-9"])) or
-                ("pvp" in evo and not in_range(self.pvp_wins, evo["pvp"])) or
-                ("sleep_disturbances" in evo and not in_range(self.sleep_disturbances, evo["sleep_disturbances"])) or
-                ("battles" in evo and not in_range(self.battles, evo["battles"])) or
-                ("win_count" in evo and not in_range(self.win, evo["win_count"])) or
-                ("win_ratio" in evo and self.battles and not in_range((self.win * 100) // self.battles, evo["win_ratio"])) or
-                ("time_range" in evo and not in_time_range(evo["time_range"]))
-            ):
-                continue
-
-            if self.stage > 0:
-                module = get_module(self.module)
-                pet_data = module.get_monster(evo["to"], self.version)
-
-                if pet_data.get("special", False):
-                    special_key = pet_data.get("special_key")
-                    if special_key and not is_unlocked(self.module, None, special_key):
-                        runtime_globals.game_console.log(f"{self.name} cannot evolve into {evo['to']}—special evolution {special_key} is locked.")
-                        continue  # Skip this evolution
-                    else:
-                        runtime_globals.game_console.log("Special evolution check pass")
-
-            # Unlock evolution if present in module unlocks (new format)
+    def evolution_index(self):
+        """This pet's compiled evolve rules (see core/evolution_rules.py), built on first use."""
+        index = getattr(self, "_evolution_index", None)
+        if index is None:
             module = get_module(self.module)
-            unlocks = getattr(module, "unlocks", [])
-            for unlock in unlocks:
-                if unlock.get("type") == "evolution" and "to" in unlock:
-                    if evo["to"] in unlock["to"]:
-                        unlock_item(self.module, "evolution", unlock["name"])
-
-            if self.stage == 0 and self.shake_counter >= 99 and get_module(self.module).enable_shaken_egg:
-                self.shook = True
-                
-            self.evolve_to(evo["to"], evo.get("version", self.version))
-            
-            # Update quest progress for normal evolution
-            from core.utils.quest_event_utils import update_evolution_quest_progress
-            update_evolution_quest_progress("normal", self.module)
-            
-            break
+            compiled = module.get_evolutions(self.name, self.version)
+            if compiled is None or (compiled.source is not self.evolve and compiled.source != self.evolve):
+                # Saved pet whose evolve list no longer matches monster.json
+                compiled = CompiledEvolutions(self.evolve, module, self.version)
+            index = self._evolution_index = EvolutionIndex(compiled)
+        return index
+
+    def update_evolution(self, now=None, alert=True):
+        """Evolves the pet if a rule passes. Also replayed by core.pet_catchup (at now, with alert=False, see evolve_to)."""
+        if self.stage > 5 or (self.timer / ( constants.FRAME_RATE * 60)) < self.time or self.need_care(now):
+            return
+
+        rule = self.evolution_index().find(self, lambda special_key: not is_unlocked(self.module, None, special_key), now)
+        if rule is None:
+            return
+
+        if self.stage > 0 and rule.special_key:
+            runtime_globals.game_console.log("Special evolution check pass")
+
+        # Unlock evolution if present in module unlocks (new format)
+        for unlock_name in rule.unlock_names:
+            unlock_item(self.module, "evolution", unlock_name)
+
+        if self.stage == 0 and self.shake_counter >= 99 and get_module(self.module).enable_shaken_egg:
+            self.shook = True
+
+        self.evolve_to(rule.to, rule.target_version(self), alert)
+
+        # Update quest progress for normal evolution
+        from core.utils.quest_event_utils import update_evolution_quest_progress
+        update_evolution_quest_progress("normal", self.module)
 
     def update_needs(self):
         if self.timer % (self.hunger_loss  * 60 * constants.FRAME_RATE) == 0 and self.overfeed_timer == 0:
@@ -748,7 +764,7 @@ class GamePet:
         if self.timer % (self.poop_timer * 60 * constants.FRAME_RATE // depletion_rate) == 0:
             self.set_state("pooping")
 
-    def update_care_mistakes(self):
+    def update_care_mistakes(self, now=None, alert=True):
         sound_alert = False
         #hunger call
         if self.hunger == 0:
@@ -771,7 +787,7 @@ class GamePet:
             self.care_sick_mistake_timer = 0
 
         #sleep call
-        if self.should_sleep():
+        if self.should_sleep(now):
             self.care_sleep_mistake_timer += 1
             if self.care_sleep_mistake_timer >= get_module(self.module).sleep_care_mistake_timer:
                 self.add_care_mistake("sleep")
@@ -779,7 +795,7 @@ class GamePet:
                 self.care_sleep_mistake_timer = 0
                 
         
-        if sound_alert:
+        if sound_alert and alert:
             runtime_globals.game_sound.play("alarm")
 
     def update_vital_values_gain(self):
@@ -834,8 +850,8 @@ class GamePet:
             if gcell_points != 0:
                 self.add_gcell_points(gcell_points)
 
-    def need_care(self):
-        return self.stage != 0 and self.state not in ("dead","nap") and (self.hunger == 0 or self.strength == 0 or self.sick > 0 or self.should_sleep()) 
+    def need_care(self, now=None):
+        return self.stage != 0 and self.state not in ("dead","nap") and (self.hunger == 0 or self.strength == 0 or self.sick > 0 or self.should_sleep(now)) 
 
     def call_sign(self):
         if self.stage == 0 or self.state in ("dead","nap"):
@@ -1178,32 +1194,32 @@ class GamePet:
             if self.level == constants.MAX_LEVEL[self.stage]:
                 self.experience = 0
 
-    def should_sleep(self):
+    def sleep_window(self):
+        """(sleep_time, wake_time) for this pet, using the global times if set; None if it never sleeps."""
         if not self.sleeps or not self.wakes:
-            return False
-        
+            return None
+
         # Use global sleep/wake if set
         global_sleep = getattr(game_globals, "sleep_time", None)
         global_wake = getattr(game_globals, "wake_time", None)
-
+        if global_sleep is not None and global_wake is not None:
+            return global_sleep, global_wake
+
+        # Cache parsing whenever sleeps/wakes change
+        if not hasattr(self, '_cached_sleep_time') or self._last_sleeps != self.sleeps or self._last_wakes != self.wakes:
+            self._cached_sleep_time = datetime.strptime(self.sleeps.strip(), "%H:%M").time()
+            self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
+            self._last_sleeps = self.sleeps
+            self._last_wakes = self.wakes
+        return self._cached_sleep_time, self._cached_wake_time
+
+    def should_sleep(self, now=None):
         try:
-            now_time = datetime.now().time()
-
-            # Use global times if set
-            if global_sleep is not None and global_wake is not None:
-                sleep_time = global_sleep
-                wake_time = global_wake
-            elif self.sleeps and self.wakes:
-                # Cache parsing whenever sleeps/wakes change
-                if not hasattr(self, '_cached_sleep_time') or self._last_sleeps != self.sleeps or self._last_wakes != self.wakes:
-                    self._cached_sleep_time = datetime.strptime(self.sleeps.strip(), "%H:%M").time()
-                    self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                    self._last_sleeps = self.sleeps
-                    self._last_wakes = self.wakes
-                sleep_time = self._cached_sleep_time
-                wake_time = self._cached_wake_time
-            else:
+            window = self.sleep_window()
+            if window is None:
                 return False
+            sleep_time, wake_time = window
+            now_time = (now or datetime.now()).time()
 
             if sleep_time < wake_time:
                 return sleep_time <= now_time < wake_time
@@ -1214,51 +1230,69 @@ class GamePet:
             runtime_globals.game_console.log(f"[!] Error parsing sleep range: {e}")
             return False
 
-    def check_wake_up(self):
-        now = datetime.now()
+    def check_wake_up(self, now=None):
+        now = now or datetime.now()
 
         if not hasattr(self, 'sleep_start_time'):
             return
 
-        global_wake = getattr(game_globals, "wake_time", None)
-
         try:
-            # Use global wake time if set
-            if global_wake is not None:
-                wake_time = global_wake
-            elif self.wakes:
-                # Cache parsing if wakes change
-                if not hasattr(self, '_cached_wake_time') or self._last_wakes != self.wakes:
-                    self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
-                    self._last_wakes = self.wakes
-                wake_time = self._cached_wake_time
-            else:
+            wake_time = self.natural_wake_time()
+            if wake_time is None:
                 return
 
             # Wake up if it's the wake time exactly (match hour and minute)
             if now.hour == wake_time.hour and now.minute == wake_time.minute:
-                slept_seconds = (now - self.sleep_start_time).total_seconds()
-                slept_hours = int(slept_seconds // 3600)
-
-                if slept_hours >= constants.SLEEP_RECOVERY_HOURS:
-                    self.dp = self.energy
-                    runtime_globals.game_console.log(f"{self.name} slept {slept_hours}h and recovered DP!")
-
-                self.set_state("idle")
+                self.wake_up(now)
                 runtime_globals.game_console.log(f"{self.name} woke up naturally at {wake_time.strftime('%H:%M')}")
 
         except Exception as e:
             runtime_globals.game_console.log(f"[!] Error parsing wake time: {e}")
 
+    def natural_wake_time(self):
+        """Time of day a napping pet wakes up by itself (global wake time if set), or None."""
+        global_wake = getattr(game_globals, "wake_time", None)
+        # Use global wake time if set
+        if global_wake is not None:
+            return global_wake
+        if not self.wakes:
+            return None
+        # Cache parsing if wakes change
+        if not hasattr(self, '_cached_wake_time') or self._last_wakes != self.wakes:
+            self._cached_wake_time = datetime.strptime(self.wakes.strip(), "%H:%M").time()
+            self._last_wakes = self.wakes
+        return self._cached_wake_time
+
+    def wake_up(self, now):
+        """Ends a nap at now, restoring DP after a full night's sleep."""
+        slept_hours = 0
+        if self.sleep_start_time:
+            slept_hours = int((now - self.sleep_start_time).total_seconds() // 3600)
+
+        if slept_hours >= constants.SLEEP_RECOVERY_HOURS:
+            self.dp = self.energy
+            runtime_globals.game_console.log(f"{self.name} slept {slept_hours}h and recovered DP!")
+
+        self.set_state("idle")
+
     def __getstate__(self):
         state = self.__dict__.copy()
         state.pop("frames", None)
+        # Scheduler bookkeeping only applies to the running session
+        state.pop("_schedule_id", None)
+        state.pop("_clock_tick", None)
+        state.pop("_evolution_index", None)
+        state.pop("_sprite_variants", None)
         return state
     
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self.load_saved_sprite()
+
+    def load_saved_sprite(self):
+        """Loads sprites for a pet restored from a save; dead pets show the dead frame."""
         self.load_sprite()
-        if self.state == "dead":
+        if self.state == "dead" and self in runtime_globals.pet_sprites:
             runtime_globals.pet_sprites[self][0] = image_load(constants.DEAD_FRAME_PATH).convert_alpha()
             runtime_globals.pet_sprites[self][0] = pygame.transform.scale(runtime_globals.pet_sprites[self][0], (runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT))
             runtime_globals.pet_sprites[self][1] = runtime_globals.pet_sprites[self][0]
@@ -0,0 +1,195 @@
+import json
+import os
+from typing import Optional
+
+from core import runtime_globals
+from core.utils.asset_utils import open_json, resolve_path
+
+
+#=====================================================================
+# ModuleDataStore - Parsed-once, indexed monster/battle tables
+#=====================================================================
+
+class ModuleDataStore:
+    """
+    In-memory copy of a module's monster.json and battle.json.
+
+    Each file is parsed once and indexed so lookups by (name, version), stage,
+    special flag and (area, round, version) are dictionary hits instead of a
+    full JSON parse. Every access compares the file's mtime with the one seen at
+    parse time, so edits made with the Module Editor are picked up on the next call.
+
+    Returned dicts are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, folder_path: str) -> None:
+        self.folder_path = folder_path
+        self.monster_path = os.path.join(folder_path, "monster.json")
+        self.battle_path = os.path.join(folder_path, "battle.json")
+
+        self._monster_mtime = None
+        self._battle_mtime = None
+
+        self._reset_monsters()
+        self._reset_enemies()
+
+    #-----------------------------------------------------------------
+    # Monster tables
+    #-----------------------------------------------------------------
+
+    def _reset_monsters(self) -> None:
+        self.monsters = []
+        self.monsters_by_key = {}
+        self.monsters_by_stage = {}
+        self.special_by_stage = {}
+
+    def load_monsters(self) -> bool:
+        """
+        Ensures the monster indexes reflect monster.json on disk.
+        Returns False if the file does not exist.
+        """
+        mtime = _file_mtime(self.monster_path)
+        if mtime is None:
+            if self._monster_mtime is not None:
+                self._reset_monsters()
+                self._monster_mtime = None
+            return False
+        if mtime == self._monster_mtime:
+            return True
+
+        self._reset_monsters()
+        self._monster_mtime = mtime
+        try:
+            with open_json(self.monster_path) as file:
+                data = json.load(file)
+        except json.JSONDecodeError:
+            runtime_globals.game_console.log(f"⚠️ Failed to parse {self.monster_path}")
+            return True
+
+        self._index_monsters(data)
+        return True
+
+    def seed_monsters(self, data: dict) -> None:
+        """Indexes monster.json contents that were already parsed (e.g. by the module cache)."""
+        self._reset_monsters()
+        self._monster_mtime = _file_mtime(self.monster_path)
+        self._index_monsters(data)
+
+    def _index_monsters(self, data: dict) -> None:
+        for monster in data.get("monster", []):
+            self.monsters.append(monster)
+            self.monsters_by_key.setdefault((monster["name"], monster["version"]), monster)
+            self.monsters_by_stage.setdefault(monster["stage"], []).append(monster)
+            if monster.get("special"):
+                self.special_by_stage.setdefault(monster["stage"], []).append(monster)
+
+    def get_monster(self, name: str, version: int) -> Optional[dict]:
+        return self.monsters_by_key.get((name, version))
+
+    def get_monsters_by_stage(self, stage: int, special_list: list[str] = None) -> list[dict]:
+        if special_list is None:
+            return list(self.monsters_by_stage.get(stage, []))
+        wanted = set(special_list)
+        return [m for m in self.special_by_stage.get(stage, []) if m["name"] in wanted]
+
+    #-----------------------------------------------------------------
+    # Battle tables
+    #-----------------------------------------------------------------
+
+    def _reset_enemies(self) -> None:
+        self.enemies = []
+        self.enemies_by_key = {}
+        self.enemy_versions = {}
+        self.area_round_keys = set()
+        self.areas = set()
+        self.area_rounds = {}
+
+    def load_enemies(self) -> bool:
+        """
+        Ensures the enemy indexes reflect battle.json on disk.
+        Returns False if the file is missing, unreadable or has no enemies.
+        """
+        mtime = _file_mtime(self.battle_path)
+        if mtime is None:
+            if self._battle_mtime is not None:
+                self._reset_enemies()
+                self._battle_mtime = None
+            return False
+        if mtime != self._battle_mtime:
+            self._reset_enemies()
+            self._battle_mtime = mtime
+            self._index_enemies(self._parse_battle_json())
+        return bool(self.enemies)
+
+    def seed_enemies(self, data) -> None:
+        """Indexes battle.json contents that were already parsed (e.g. by the module cache)."""
+        self._reset_enemies()
+        self._battle_mtime = _file_mtime(self.battle_path)
+        self._index_enemies(_normalize_battle_data(data))
+
+    def _parse_battle_json(self) -> list:
+        """Loads battle.json and normalizes it to a list of dicts."""
+        try:
+            with open_json(self.battle_path) as file:
+                return _normalize_battle_data(json.load(file))
+        except Exception as e:
+            runtime_globals.game_console.log(f"⚠️ Failed to parse {self.battle_path}: {e}")
+            return []
+
+    def _index_enemies(self, entries: list) -> None:
+        self.enemies = entries
+        versions = {}
+        area_rounds = {}
+        for entry in entries:
+            try:
+                area = int(entry.get("area", -1))
+                round_ = int(entry.get("round", -1))
+            except Exception:
+                continue
+
+            self.areas.add(area)
+            self.area_round_keys.add((area, round_))
+            version = entry.get("version")
+            if version is not None:
+                versions.setdefault((area, round_), set()).add(version)
+                try:
+                    # First matching row wins, as with the previous linear scan
+                    self.enemies_by_key.setdefault((area, round_, int(version)), entry)
+                except Exception:
+                    pass
+
+            if area != -1 and round_ != -1:
+                area_rounds.setdefault(area, set()).add(round_)
+
+        self.enemy_versions = {key: sorted(v) for key, v in versions.items()}
+        self.area_rounds = {area: sorted(rounds) for area, rounds in area_rounds.items()}
+
+    def get_enemy_entry(self, area: int, round_: int, version: int) -> Optional[dict]:
+        return self.enemies_by_key.get((int(area), int(round_), int(version)))
+
+    def get_enemy_versions(self, area: int, round_: int) -> list:
+        return list(self.enemy_versions.get((int(area), int(round_)), []))
+
+    def area_exists(self, area: int) -> bool:
+        return int(area) in self.areas
+
+    def is_valid_area_round(self, area: int, round_: int) -> bool:
+        return (int(area), int(round_)) in self.area_round_keys
+
+    def get_available_area_rounds(self) -> dict:
+        return {area: list(rounds) for area, rounds in self.area_rounds.items()}
+
+
+def _normalize_battle_data(data) -> list:
+    if isinstance(data, dict) and "enemies" in data and isinstance(data["enemies"], list):
+        return data["enemies"]
+    elif isinstance(data, list):
+        return data
+    return []
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(resolve_path(path))
+    except OSError:
+        return None
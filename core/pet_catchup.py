@@ -0,0 +1,361 @@
+"""
+Offline catch-up for the party.
+
+When a save is loaded, the wall-clock time since it was written is replayed
+through the per-minute pet rules, so the party looks the way it would have if
+the game had kept running: hunger and strength loss, overfeeding, pooping
+(and poop sickness), care mistakes, sleep windows and natural wake-ups, vital
+values, death-save immunity, age, evolution, hatching and death.
+
+Nothing is simulated frame by frame. Every pet jumps from one interesting
+minute to the next (a hunger or strength tick, a poop, a care-mistake
+threshold, an hour boundary, a sleep window edge, a wake-up, an evolution
+window opening, a death threshold...) and runs the real GamePet rules there;
+the quiet minutes in between are applied in bulk. A week offline is a few
+hundred steps per pet, and the result only depends on the save, the elapsed
+time and the random seed.
+
+Evolution and death run at the minute they happen, in the same order as
+GamePet.update_minute(), with alert=False: the pet changes species or dies
+there, but no sound plays and no sprites load (game_globals.load() loads
+them after the catch-up). A pet that died is removed on the first live
+minute, since that swaps in a traited egg and may change scene. Eggs (stage 0)
+only wake up to hatch; dead pets only have their timers moved forward.
+
+utilities/catchup_harness.py compares catch_up() with a frame-by-frame run of
+the same rules.
+"""
+import datetime
+import heapq
+import math
+import time
+
+from core import game_globals, runtime_globals
+import core.constants as constants
+from core.utils.module_utils import get_module
+
+MAX_CATCH_UP_DAYS = 30  # Longer absences are replayed as this many days
+
+
+class _Replay:
+    """Catch-up bookkeeping for one pet."""
+
+    def __init__(self, pet, index: int) -> None:
+        self.pet = pet
+        self.index = index
+        self.module = get_module(pet.module)
+        self.tick = 0  # Replay tick the pet's timers were last moved to
+        self.wake_at = None  # When a napping pet wakes up by itself
+
+    @property
+    def active(self) -> bool:
+        return self.pet.stage > 0 and self.pet.state != "dead"
+
+    @property
+    def hatching(self) -> bool:
+        return self.pet.stage == 0 and self.pet.state != "dead"
+
+
+def catch_up(pets: list, saved_at: float, now: float = None) -> dict:
+    """
+    Replays the time between saved_at and now (Unix timestamps) for pets.
+    Poops go to game_globals.poop_list. Returns {"seconds", "events", "duration_ms"}.
+    """
+    started = time.perf_counter()
+    now = time.time() if now is None else now
+    seconds = min(now - saved_at, MAX_CATCH_UP_DAYS * 86400)
+    if seconds <= 0 or not pets:
+        return {"seconds": 0, "events": 0, "duration_ms": 0.0}
+
+    minute = constants.FRAME_RATE * 60
+    total = int(seconds * constants.FRAME_RATE)
+    start = datetime.datetime.fromtimestamp(saved_at)
+    replays = [_Replay(pet, index) for index, pet in enumerate(pets)]
+
+    heap = []
+    for replay in replays:
+        pet = replay.pet
+        if pet.state == "pooping":
+            # The poop that was on its way when the game was saved
+            pet.drop_poop()
+            pet.set_state("idle")
+        if pet.state == "nap":
+            replay.wake_at = _next_time_of_day(start, pet.natural_wake_time())
+        first = minute - pet.timer % minute
+        if replay.hatching:
+            first = max(first, pet.time * minute - pet.timer)  # Eggs wake up when they are due to hatch
+        if (replay.active or replay.hatching) and first <= total:
+            heapq.heappush(heap, (first, replay.index))
+
+    events = 0
+    while heap:
+        tick, index = heapq.heappop(heap)
+        replay = replays[index]
+        _run_minute(replay, tick, start)
+        events += 1
+
+        if not replay.active:
+            continue
+        skip = _quiet_minutes(replay, replays, tick, start)
+        next_tick = tick + (skip + 1) * minute
+        if next_tick > total:
+            skip = (total - tick) // minute
+        if skip:
+            _apply_quiet_minutes(replay, skip, _wall(start, tick))
+            _advance(replay, tick + skip * minute)
+        if next_tick <= total:
+            heapq.heappush(heap, (next_tick, index))
+
+    for replay in replays:
+        _advance(replay, total)
+        pet = replay.pet
+        if pet.state == "nap" and replay.wake_at is not None and replay.wake_at <= _wall(start, total):
+            pet.wake_up(replay.wake_at)
+        if pet.state not in ("idle", "moving", "nap", "dead"):
+            # Short animations (eat, sick, pooping...) ended long ago
+            pet.set_state("idle")
+
+    duration_ms = (time.perf_counter() - started) * 1000
+    runtime_globals.game_console.log(f"[CatchUp] Replayed {seconds / 3600:.1f}h for {len(pets)} pets in {events} steps ({duration_ms:.1f} ms)")
+    return {"seconds": seconds, "events": events, "duration_ms": duration_ms}
+
+
+#=====================================================================
+# One minute, the same rules GamePet.update_minute() runs
+#=====================================================================
+
+def _run_minute(replay: _Replay, tick: int, start: datetime.datetime) -> None:
+    _advance(replay, tick)
+    pet = replay.pet
+    now = _wall(start, tick)
+    # The hour event is due at the timer value the minute started with (evolving resets it to 0)
+    hourly = pet.timer % (constants.FRAME_RATE * 60 * 60) == 0
+
+    if pet.state == "nap" and replay.wake_at is not None and replay.wake_at <= now:
+        pet.wake_up(replay.wake_at)
+        replay.wake_at = None
+
+    if pet.state not in ("nap", "dead"):
+        pet.update_evolution(now, alert=False)
+        if pet.stage == 0:
+            return  # Did not hatch
+        pet.update_care_rules(now, alert=False)
+        if pet.state == "pooping":
+            pet.drop_poop()
+            pet.set_state("idle")
+    if pet.state != "nap":
+        pet.update_death_save_counters(alert=False)
+        pet.update_death_check(alert=False)
+
+    was_napping = pet.state == "nap"
+    pet.update_countdowns(now)
+    if pet.state == "nap" and not was_napping:
+        replay.wake_at = _next_time_of_day(now, pet.natural_wake_time())
+
+    if hourly and pet.timer % (constants.FRAME_RATE * 60 * 60) == 0 and pet.state not in ("nap", "dead"):
+        pet.update_vital_values_gain()
+
+
+def _advance(replay: _Replay, tick: int) -> None:
+    """Moves the pet's timers (and age) forward to a replay tick."""
+    delta = tick - replay.tick
+    if delta <= 0:
+        return
+    pet = replay.pet
+    day = constants.FRAME_RATE * 86400
+    pet.age += (pet.age_timer + delta) // day - pet.age_timer // day
+    pet.timer += delta
+    pet.age_timer += delta
+    if pet.state == "nap":
+        pet.sleep_timer += delta
+    replay.tick = tick
+
+
+#=====================================================================
+# Quiet minutes
+#=====================================================================
+
+def _quiet_minutes(replay: _Replay, replays: list, tick: int, start: datetime.datetime) -> int:
+    """How many minutes after this one nothing but counters change for the pet."""
+    pet = replay.pet
+    module = replay.module
+    minute = constants.FRAME_RATE * 60
+    current = pet.timer // minute
+    now = _wall(start, tick)
+
+    # Minutes until each thing that the bulk update does not cover
+    candidates = [60 - current % 60]  # Vital value gain
+    if current < 1:
+        candidates.append(1 - current)  # Pooping starts after the first minute
+    if pet.hunger_loss:
+        candidates.append(pet.hunger_loss - current % pet.hunger_loss)
+    if pet.strength_loss and pet.strength > 0:
+        candidates.append(pet.strength_loss - current % pet.strength_loss)
+    if pet.back_to_sleep > 0:
+        candidates.append(pet.back_to_sleep)
+
+    if pet.poop_timer:
+        candidates.append(_minutes_until_tick(tick, _next_poop_tick(replay, tick + 1)))
+    # Poop sickness only changes when the poop count reaches its limit, so stop before the earliest drop that could reach it
+    horizon = _poop_limit_horizon(replays, tick)
+    if horizon is not None:
+        candidates.append(_minutes_until_tick(tick, horizon))
+    if (horizon is None and pet.stage >= 2) != bool(pet.poop_count_flag):
+        candidates.append(1)  # The limit was reached (or cleared) after this pet's check ran
+    threshold = _depletion_threshold_tick(replay, tick)
+    if threshold is not None:
+        candidates.append(_minutes_until_tick(tick, threshold))
+
+    if pet.state == "nap":
+        if replay.wake_at is not None:
+            candidates.append(_minutes_until(now, replay.wake_at))
+    else:
+        if pet.hunger == 0 and pet.care_food_mistake_timer < module.meat_care_mistake_time:
+            candidates.append(module.meat_care_mistake_time - pet.care_food_mistake_timer)
+        if pet.strength == 0 and pet.care_strength_mistake_timer < module.protein_care_mistake_time:
+            candidates.append(module.protein_care_mistake_time - pet.care_strength_mistake_timer)
+        if pet.should_sleep(now):
+            candidates.append(max(1, module.sleep_care_mistake_timer - pet.care_sleep_mistake_timer))
+        # Death once a care timer passes its limit (checked after the minute's care rules)
+        if pet.hunger == 0 and 0 < module.death_hunger_timer >= pet.care_food_mistake_timer:
+            candidates.append(module.death_hunger_timer + 1 - pet.care_food_mistake_timer)
+        if pet.strength == 0 and 0 < module.death_strength_timer >= pet.care_strength_mistake_timer:
+            candidates.append(module.death_strength_timer + 1 - pet.care_strength_mistake_timer)
+        if pet.sick > 0 and 0 < module.death_sick_timer >= pet.care_sick_mistake_timer:
+            candidates.append(module.death_sick_timer + 1 - pet.care_sick_mistake_timer)
+
+    # Death checks that wait for a countdown or for the pet's age
+    if getattr(pet, "dying", False):
+        candidates.append(1)  # Nobody presses B or shakes while the game is closed
+    if pet.death_save_immunity > 0:
+        candidates.append(pet.death_save_immunity + 1)
+    if pet.stage in (4, 5) and current <= pet.time:
+        candidates.append(pet.time + 1 - current)  # Stage IV/V mistake limit applies once the evolution time is over
+    if module.death_old_age > 0 and pet.age + 1 >= module.death_old_age:
+        day = constants.FRAME_RATE * 86400
+        candidates.append(_minutes_until_tick(tick, tick + day - pet.age_timer % day))
+
+    # Evolution: the window opening, then the edges of time_range rules
+    if pet.stage <= 5 and pet.evolve:
+        if current < pet.time:
+            candidates.append(pet.time - current)
+        else:
+            for rule in pet.evolution_index().compiled.rules:
+                for edge in rule.time_range or ():
+                    candidates.append(_minutes_until(now, _next_time_of_day(now + datetime.timedelta(microseconds=1), edge)))
+
+    # should_sleep() changes at the sleep window edges
+    window = pet.sleep_window()
+    if window is not None:
+        for edge in window:
+            candidates.append(_minutes_until(now, _next_time_of_day(now + datetime.timedelta(microseconds=1), edge)))
+
+    return max(0, min(candidates) - 1)
+
+
+def _apply_quiet_minutes(replay: _Replay, count: int, now: datetime.datetime) -> None:
+    """Applies count minutes after the one at now in which no rule crosses a threshold (see _quiet_minutes)."""
+    pet = replay.pet
+    if pet.back_to_sleep > 0:
+        pet.back_to_sleep -= count
+    if pet.state == "nap":
+        return
+
+    if pet.overfeed_timer > 0:
+        pet.overfeed_timer = max(0, pet.overfeed_timer - count)
+    if pet.hunger == 0:
+        pet.care_food_mistake_timer += count
+    if pet.strength == 0:
+        pet.care_strength_mistake_timer += count
+    if pet.sick > 0:
+        pet.care_sick_mistake_timer += count
+    else:
+        pet.care_sick_mistake_timer = 0
+    if pet.should_sleep(now):
+        pet.care_sleep_mistake_timer += count
+
+    if not (pet.sick <= 0 and pet.hunger > 0 and pet.strength > 0):
+        vital_loss = getattr(replay.module, 'vital_value_loss', 1)
+        pet.vital_values = max(0, pet.vital_values - vital_loss * count)
+
+    if pet.death_save_immunity > 0:
+        pet.death_save_immunity = max(0, pet.death_save_immunity - count)
+
+
+def _next_poop_tick(replay: _Replay, tick: int, fastest: bool = False) -> int:
+    """First replay tick at or after tick where the pet's poop timer fires (ignoring naps)."""
+    minute = constants.FRAME_RATE * 60
+    period = _poop_period(replay, tick, fastest)
+    step = minute * period // math.gcd(minute, period)
+    timer = replay.pet.timer + (tick - replay.tick)
+    return tick + (-timer) % step
+
+
+def _poop_period(replay: _Replay, tick: int, fastest: bool = False) -> int:
+    """Poop period in ticks, as GamePet.update_pooping() computes it. fastest assumes the 48 hour rate already applies."""
+    pet = replay.pet
+    depletion_rate = 1
+    if pet.stage >= 6 and (fastest or pet.age_timer + (tick - replay.tick) >= 48 * 60 * 60 * constants.FRAME_RATE):
+        depletion_rate = 2  # Accelerate depletion after 48 hours
+    return pet.poop_timer * 60 * constants.FRAME_RATE // depletion_rate
+
+
+def _poop_limit_horizon(replays: list, tick: int):
+    """
+    Earliest replay tick at which the poop count could reach the poop sickness
+    limit (8 per pet), or None if it already has. Assumes every pet poops as
+    often as it can, so the real moment is never earlier.
+    """
+    needed = len(game_globals.pet_list) * 8 - len(game_globals.poop_list)
+    if needed <= 0:
+        return None
+    drops = []
+    for other in replays:
+        if not other.active or not other.pet.poop_timer:
+            continue
+        first = _next_poop_tick(other, tick, fastest=True)
+        step = _next_poop_tick(other, first + 1, fastest=True) - first
+        drops.extend(first + step * i for i in range(needed))
+    if len(drops) < needed:
+        return None
+    return heapq.nsmallest(needed, drops)[-1]
+
+
+def _depletion_threshold_tick(replay: _Replay, tick: int):
+    """Replay tick at which the pet's faster (48 hour) poop rate starts, if it is still ahead."""
+    pet = replay.pet
+    remaining = 48 * 60 * 60 * constants.FRAME_RATE - (pet.age_timer + tick - replay.tick)
+    if pet.stage < 6 or remaining <= 0:
+        return None
+    return tick + remaining
+
+
+#=====================================================================
+# Wall clock
+#=====================================================================
+
+def _wall(start: datetime.datetime, tick: int) -> datetime.datetime:
+    return start + datetime.timedelta(seconds=tick / constants.FRAME_RATE)
+
+
+def _next_time_of_day(after: datetime.datetime, time_of_day):
+    """
+    First moment at or after `after` whose hour and minute match time_of_day
+    (checks run every second, so a moment inside that minute counts).
+    """
+    if time_of_day is None:
+        return None
+    moment = after.replace(hour=time_of_day.hour, minute=time_of_day.minute, second=0, microsecond=0)
+    if moment + datetime.timedelta(minutes=1) <= after:
+        moment += datetime.timedelta(days=1)
+    return max(moment, after)
+
+
+def _minutes_until_tick(tick: int, target: int) -> int:
+    """Number of minutes from tick to the first minute boundary at or after target (at least 1)."""
+    return max(1, math.ceil((target - tick) / (constants.FRAME_RATE * 60)))
+
+
+def _minutes_until(now: datetime.datetime, moment: datetime.datetime) -> int:
+    """Number of minutes from now to the first minute boundary at or after moment (at least 1)."""
+    return max(1, math.ceil((moment - now).total_seconds() / 60))
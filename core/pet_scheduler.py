@@ -0,0 +1,130 @@
+"""
+Event scheduler for the pet simulation.
+
+Pet timers (GamePet.timer, age_timer, sleep_timer) count ticks at
+constants.FRAME_RATE ticks per second of monotonic time, no matter how many
+frames are actually drawn. Instead of every pet testing modulo counters each
+frame, each pet keeps its next due events in one heap:
+
+    minute   evolution, needs, pooping, care mistakes, death checks
+    hour     vital value gain
+    day      age
+    wake     natural wake-up check while napping
+
+advance() runs once per frame and pops only the events that are due. Before
+an event runs, the pet's timers are moved to the exact tick the event was due
+at, so handlers see the same timer values the per-frame checks used to see.
+
+    pet_scheduler.advance(game_globals.pet_list)   # once per frame
+    pet_scheduler.sync(pet)                        # in GamePet.update()
+"""
+import heapq
+import itertools
+import time
+
+import core.constants as constants
+
+# Gaps longer than this (another scene was open, the window was dragged) are
+# not simulated, the same as when pets were only updated per frame
+MAX_STEP_SECONDS = 1.0
+
+
+class PetScheduler:
+    """Priority queue of (due tick, pet, event) shared by every pet in the party."""
+
+    def __init__(self) -> None:
+        self.tick = 0  # Scheduler clock, in ticks
+        self._heap = []  # (due_tick, rank, seq, schedule_id, pet, event)
+        self._ranks = {}  # event -> rank; events due on the same tick run in the order pets list them
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._last_time = None
+        self._carry = 0.0  # Fraction of a tick left over from the last advance
+
+        # Metrics (read with stats())
+        self.events_run = 0
+        self.events_dropped = 0
+
+    #-----------------------------------------------------------------
+    # Clock
+    #-----------------------------------------------------------------
+
+    def advance(self, pets: list, now: float = None) -> None:
+        """Moves the clock to the current monotonic time and runs every event due by then."""
+        now = time.monotonic() if now is None else now
+        if self._last_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = now - self._last_time
+            if elapsed > MAX_STEP_SECONDS or elapsed < 0:
+                elapsed = 1.0 / constants.FRAME_RATE
+        self._last_time = now
+
+        self._carry += elapsed * constants.FRAME_RATE
+        ticks = int(self._carry)
+        self._carry -= ticks
+        target = self.tick + ticks
+
+        while self._heap and self._heap[0][0] <= target:
+            due, _, _, schedule_id, pet, event = heapq.heappop(self._heap)
+            if getattr(pet, "_schedule_id", None) != schedule_id:
+                continue  # Entry left over from before the pet was rescheduled
+            if pet not in pets:
+                # Pet left the party (stored, cleared or dead); register again if it comes back
+                pet._schedule_id = None
+                self.events_dropped += 1
+                continue
+            self.tick = due
+            self._sync_timers(pet)
+            delay = pet.handle_scheduled_event(event)
+            self.events_run += 1
+            if delay:
+                self._push(pet, event, delay)
+        self.tick = target
+
+    def sync(self, pet) -> None:
+        """Brings a pet's timers up to the clock, registering its events the first time it is seen."""
+        if getattr(pet, "_schedule_id", None) is None:
+            self.register(pet)
+        else:
+            self._sync_timers(pet)
+
+    def register(self, pet) -> None:
+        """Queues the pet's events from its current timers. Earlier entries for the pet are dropped lazily."""
+        pet._schedule_id = next(self._ids)
+        pet._clock_tick = self.tick
+        for event, delay in pet.scheduled_events().items():
+            self._push(pet, event, delay)
+
+    def _sync_timers(self, pet) -> None:
+        delta = self.tick - getattr(pet, "_clock_tick", self.tick)
+        if delta > 0:
+            pet.timer += delta
+            pet.age_timer += delta
+            if pet.state == "nap":
+                pet.sleep_timer += delta
+        pet._clock_tick = self.tick
+
+    def _push(self, pet, event: str, delay: int) -> None:
+        rank = self._ranks.setdefault(event, len(self._ranks))
+        heapq.heappush(self._heap, (self.tick + max(1, int(delay)), rank, next(self._seq), pet._schedule_id, pet, event))
+
+    #-----------------------------------------------------------------
+    # Metrics
+    #-----------------------------------------------------------------
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._heap)
+
+    def stats(self) -> dict:
+        return {
+            "tick": self.tick,
+            "queue_depth": len(self._heap),
+            "run": self.events_run,
+            "dropped": self.events_dropped,
+        }
+
+
+# Shared by GamePet and SceneMainGame
+pet_scheduler = PetScheduler()
@@ -0,0 +1,284 @@
+"""
+Versioned save file format.
+
+Save files (save_data_N.dat and the freezer/ index and page files) are JSON lines: a header line
+naming the format and schema version, then one record per line. Pets and
+poops are stored as explicit attribute records instead of pickled objects, so
+loading never runs GamePet.__setstate__ (which loads sprites) and a damaged
+record only loses that record:
+
+    {"format": "omnipet-save", "version": 2}
+    {"type": "global", "key": "inventory", "value": {...}}
+    {"type": "pet", "fields": {...}}
+    {"type": "poop", "fields": {...}}
+
+Values that JSON cannot hold (tuples, dates, enums, quests and events) are
+tagged, e.g. {"$date": "2025-01-31"}. Version 1 is the old pickled dict; it is
+still readable and is migrated forward on the next save.
+"""
+import datetime
+import json
+import os
+import pickle
+from enum import Enum
+
+SAVE_FORMAT = "omnipet-save"
+FREEZER_FORMAT = "omnipet-freezer"  # Single-file freezer with full pet records (replaced by the index + pages below)
+FREEZER_INDEX_FORMAT = "omnipet-freezer-index"
+FREEZER_PAGE_FORMAT = "omnipet-freezer-page"
+SAVE_FORMAT_VERSION = 2  # 1 = pickled dict of live GamePet/GamePoop objects
+
+# Attributes that only make sense for the running session
+TRANSIENT_PET_FIELDS = ("frames", "_schedule_id", "_clock_tick", "_evolution_index", "_sprite_variants")
+
+
+class SaveFormatError(ValueError):
+    """Raised when a save file (or one of its records) cannot be decoded."""
+
+
+#=====================================================================
+# Value encoding
+#=====================================================================
+
+def _enum_types() -> dict:
+    from core.animation import PetFrame
+    from core.game_event import EventType
+    from core.game_quest import QuestStatus, QuestType, RewardType
+    return {cls.__name__: cls for cls in (PetFrame, EventType, QuestStatus, QuestType, RewardType)}
+
+
+def _object_types() -> dict:
+    from core.game_event import GameEvent
+    from core.game_quest import GameQuest
+    return {cls.__name__: cls for cls in (GameEvent, GameQuest)}
+
+
+def encode_value(value):
+    """Converts a saved value to JSON-compatible data, tagging the types JSON lacks."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return {"$enum": type(value).__name__, "name": value.name}
+    if isinstance(value, list):
+        return [encode_value(v) for v in value]
+    if isinstance(value, tuple):
+        return {"$tuple": [encode_value(v) for v in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"$set": [encode_value(v) for v in value]}
+    if isinstance(value, dict):
+        if all(isinstance(k, str) and not k.startswith("$") for k in value):
+            return {k: encode_value(v) for k, v in value.items()}
+        return {"$dict": [[encode_value(k), encode_value(v)] for k, v in value.items()]}
+    # datetime is a subclass of date, so check it first
+    if isinstance(value, datetime.datetime):
+        return {"$datetime": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, datetime.time):
+        return {"$time": value.isoformat()}
+    if type(value).__name__ in _object_types():
+        return {"$object": type(value).__name__, "fields": encode_value(vars(value))}
+    raise SaveFormatError(f"Cannot save value of type {type(value).__name__}")
+
+
+def decode_value(data):
+    """Inverse of encode_value."""
+    if isinstance(data, list):
+        return [decode_value(v) for v in data]
+    if not isinstance(data, dict):
+        return data
+    if "$tuple" in data:
+        return tuple(decode_value(v) for v in data["$tuple"])
+    if "$set" in data:
+        return set(decode_value(v) for v in data["$set"])
+    if "$dict" in data:
+        return {decode_value(k): decode_value(v) for k, v in data["$dict"]}
+    if "$datetime" in data:
+        return datetime.datetime.fromisoformat(data["$datetime"])
+    if "$date" in data:
+        return datetime.date.fromisoformat(data["$date"])
+    if "$time" in data:
+        return datetime.time.fromisoformat(data["$time"])
+    if "$enum" in data:
+        enum_type = _enum_types().get(data["$enum"])
+        if enum_type is None:
+            raise SaveFormatError(f"Unknown enum {data['$enum']}")
+        return enum_type[data["name"]]
+    if "$object" in data:
+        object_type = _object_types().get(data["$object"])
+        if object_type is None:
+            raise SaveFormatError(f"Unknown object type {data['$object']}")
+        obj = object_type.__new__(object_type)
+        obj.__dict__.update(decode_value(data["fields"]))
+        return obj
+    return {k: decode_value(v) for k, v in data.items()}
+
+
+#=====================================================================
+# Pet / poop records
+#=====================================================================
+
+def encode_object_fields(obj, transient: tuple = ()) -> dict:
+    """
+    Encodes an object's attributes one by one. Attributes that cannot be
+    encoded are left out (and logged) instead of failing the whole save.
+    """
+    fields = {}
+    for key, value in vars(obj).items():
+        if key in transient:
+            continue
+        try:
+            fields[key] = encode_value(value)
+        except SaveFormatError as e:
+            print(f"[Save] Skipping {type(obj).__name__}.{key}: {e}")
+    return fields
+
+
+def pet_to_record(pet) -> dict:
+    return {"type": "pet", "fields": encode_object_fields(pet, TRANSIENT_PET_FIELDS)}
+
+
+def pet_from_record(record: dict):
+    """
+    Rebuilds a GamePet without loading its sprites; call pet.load_saved_sprite()
+    once the pet is shown (freezer pets only need a thumbnail).
+    """
+    from core.game_pet import GamePet
+    fields = decode_value(record["fields"])
+    for required in ("name", "module", "stage", "state"):
+        if required not in fields:
+            raise SaveFormatError(f"Pet record is missing '{required}'")
+    pet = GamePet.__new__(GamePet)
+    pet.__dict__.update(fields)
+    pet.patch()
+    return pet
+
+
+def poop_to_record(poop) -> dict:
+    return {"type": "poop", "fields": encode_object_fields(poop)}
+
+
+def poop_from_record(record: dict):
+    from core.game_poop import GamePoop
+    poop = GamePoop.__new__(GamePoop)
+    poop.__dict__.update(decode_value(record["fields"]))
+    poop.patch()
+    return poop
+
+
+#=====================================================================
+# Files
+#=====================================================================
+
+def dumps_records(file_format: str, records: list) -> bytes:
+    """Serializes a header plus records into the JSON lines file content."""
+    lines = [json.dumps({"format": file_format, "version": SAVE_FORMAT_VERSION}, separators=(",", ":"))]
+    lines.extend(json.dumps(record, separators=(",", ":"), ensure_ascii=False) for record in records)
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """Writes payload to a temporary file, fsyncs it and renames it over path, so a crash keeps the old file."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def read_records(path: str, file_format: str):
+    """
+    Reads a JSON lines save file. Returns (records, errors) where errors lists
+    a message for every line that could not be parsed. Raises SaveFormatError
+    if the header is missing or from a newer version.
+    """
+    records = []
+    errors = []
+    with open(path, "rb") as f:
+        header_line = f.readline()
+        try:
+            header = json.loads(header_line)
+        except ValueError as e:
+            raise SaveFormatError(f"Invalid header: {e}")
+        if not isinstance(header, dict) or header.get("format") != file_format:
+            raise SaveFormatError("Not a save file of this kind")
+        if header.get("version", 0) > SAVE_FORMAT_VERSION:
+            raise SaveFormatError(f"Save version {header.get('version')} is newer than this game")
+
+        for line_number, line in enumerate(f, start=2):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict) or "type" not in record:
+                    raise ValueError("record has no type")
+                records.append(record)
+            except ValueError as e:
+                errors.append(f"line {line_number}: {e}")
+    return records, errors
+
+
+def is_legacy_pickle(path: str) -> bool:
+    """True for version 1 files (pickle protocol 2+ starts with 0x80)."""
+    with open(path, "rb") as f:
+        return f.read(1) == b"\x80"
+
+
+def load_legacy_pickle(path: str):
+    """
+    Loads a version 1 (pickled) save or freezer file. Pets are restored without
+    running GamePet.__setstate__, so no sprites are loaded.
+    """
+    with open(path, "rb") as f:
+        data = _LegacyUnpickler(f).load()
+    _restore_legacy_pets(data)
+    return data
+
+
+class _LegacyUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if module == "core.game_pet" and name == "GamePet":
+            return _legacy_pet_type()
+        return super().find_class(module, name)
+
+
+_legacy_pet_class = None
+
+
+def _legacy_pet_type():
+    """GamePet subclass whose __setstate__ only restores attributes (created on first use to avoid an import cycle)."""
+    global _legacy_pet_class
+    if _legacy_pet_class is None:
+        from core.game_pet import GamePet
+
+        class LegacyGamePet(GamePet):
+            def __setstate__(self, state):
+                self.__dict__.update(state)
+
+        _legacy_pet_class = LegacyGamePet
+    return _legacy_pet_class
+
+
+def _restore_legacy_pets(value) -> None:
+    """Turns LegacyGamePet instances back into plain GamePets, wherever they are nested."""
+    if _legacy_pet_class is None:
+        return
+    from core.game_pet import GamePet
+    if isinstance(value, _legacy_pet_class):
+        value.__class__ = GamePet
+    elif isinstance(value, dict):
+        for v in value.values():
+            _restore_legacy_pets(v)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _restore_legacy_pets(v)
+    elif hasattr(value, "pets"):  # GameFreezer pages
+        _restore_legacy_pets(value.pets)
@@ -0,0 +1,126 @@
+"""
+Lazy scene registry.
+
+Importing every scene module up front pulls in networking (scene_connect),
+the evolution effects, the Digidex and most UI components before the boot
+splash can show. Scenes are instead listed here by module and class name and
+imported the first time the game switches to them:
+
+    scene_class = scene_registry.get("game")   # Imports scenes.scene_maingame on first use
+    scene_registry.warm("boot")                # Imports the likely next scenes in the background
+
+warm() hands the modules of the scenes that usually follow the given one to
+a daemon thread, so that the transition itself finds them already imported.
+A switch that comes while the thread is still importing the module waits for
+that import to finish (importlib's per-module lock). A failed background import is only logged; the same import on the main
+thread then raises as usual.
+"""
+import importlib
+import sys
+import threading
+import time
+from collections import deque
+
+from core import runtime_globals
+from core.utils import startup_report
+
+# game_state -> (module, class name)
+SCENES = {
+    "boot": ("scenes.scene_boot", "SceneBoot"),
+    "egg": ("scenes.scene_eggselection", "SceneEggSelection"),
+    "game": ("scenes.scene_maingame", "SceneMainGame"),
+    "settings": ("scenes.scene_settingsmenu", "SceneSettingsMenu"),
+    "status": ("scenes.scene_status", "SceneStatus"),
+    "feeding": ("scenes.scene_inventory", "SceneInventory"),
+    "training": ("scenes.scene_training", "SceneTraining"),
+    "sleepmenu": ("scenes.scene_sleep", "SceneSleep"),
+    "battle": ("scenes.scene_battle", "SceneBattle"),
+    "battle_pvp": ("scenes.scene_battle_pvp", "SceneBattlePvP"),
+    "connect": ("scenes.scene_connect", "SceneConnect"),
+    "digidex": ("scenes.scene_digidex", "SceneDigidex"),
+    "evolution": ("scenes.scene_evolution", "SceneEvolution"),
+    "freezer": ("scenes.scene_freezerbox", "SceneFreezerBox"),
+    "library": ("scenes.scene_library", "SceneLibrary"),
+    "debug": ("scenes.scene_debug", "SceneDebug"),
+}
+
+# Scenes worth importing in the background while the key scene is showing, most likely first
+LIKELY_NEXT = {
+    "boot": ("game", "egg"),
+    "egg": ("game",),
+    "game": ("status", "feeding", "training", "sleepmenu", "battle", "evolution", "library"),
+    "freezer": ("game", "egg"),
+}
+
+
+class SceneRegistry:
+    """Imports scene modules on first use, or ahead of time in a background thread."""
+
+    def __init__(self, scenes: dict = None, likely_next: dict = None) -> None:
+        self.scenes = dict(SCENES if scenes is None else scenes)
+        self.likely_next = dict(LIKELY_NEXT if likely_next is None else likely_next)
+        self.load_times = {}  # module -> seconds spent importing it (main thread or background)
+        self._loaded = set()  # Modules whose import has finished (sys.modules lists them as soon as it starts)
+
+        self._lock = threading.Condition()
+        self._queue = deque()
+        self._thread = None
+
+    def get(self, state: str):
+        """The scene class for a game_state, importing its module if needed; None for unknown states."""
+        entry = self.scenes.get(state)
+        if entry is None:
+            return None
+        module_name, class_name = entry
+        # A module the warm-up thread is still importing is already in sys.modules, without its
+        # classes; import_module() then waits for that import instead of returning it half done
+        importing_here = module_name not in sys.modules
+        started = time.perf_counter()
+        module = importlib.import_module(module_name)
+        if importing_here:
+            elapsed = time.perf_counter() - started
+            self.load_times.setdefault(module_name, elapsed)
+            startup_report.mark(f"Scene '{state}' imported on switch", elapsed)
+        self._loaded.add(module_name)
+        return getattr(module, class_name)
+
+    def is_loaded(self, state: str) -> bool:
+        """True once the scene's module has finished importing (not while the warm-up thread is still at it)."""
+        entry = self.scenes.get(state)
+        return entry is not None and entry[0] in self._loaded
+
+    def warm(self, state: str) -> None:
+        """Queues the modules of the scenes that usually follow state for a background import."""
+        modules = [self.scenes[name][0] for name in self.likely_next.get(state, ()) if name in self.scenes]
+        modules = [module for module in modules if module not in sys.modules]
+        if not modules:
+            return
+        with self._lock:
+            self._queue.extend(module for module in modules if module not in self._queue)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name="SceneWarmup", daemon=True)
+                self._thread.start()
+            self._lock.notify()
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._lock.wait()
+                module_name = self._queue.popleft()
+            if module_name in sys.modules:
+                continue
+            started = time.perf_counter()
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                runtime_globals.game_console.log(f"[SceneRegistry] Background import of {module_name} failed: {e}")
+                continue
+            elapsed = time.perf_counter() - started
+            self._loaded.add(module_name)
+            self.load_times.setdefault(module_name, elapsed)
+            startup_report.mark(f"{module_name} imported in the background", elapsed)
+
+
+# Shared by the game loop (vpet.VirtualPetGame)
+scene_registry = SceneRegistry()
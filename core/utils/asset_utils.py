@@ -55,6 +55,9 @@ def resolve_path(rel_path: str) -> str:
     else:
         return rel_path
 
+# Loaded fonts by (resolved path, size), shared by every caller of font_load
+_font_registry = {}
+
 def font_load(rel_path: str, size: int):
     """
     Load a font file, adjusting path for Android environment.
@@ -62,6 +65,9 @@ def font_load(rel_path: str, size: int):
     On desktop, uses relative path as-is.
     Pass None as rel_path to use pygame's default font.
     
+    Each (path, size) is only read from disk once; later calls return the
+    same Font object, so callers must not change its style (bold, italic...).
+    
     Args:
         rel_path: Relative path to font file (e.g., 'assets/DigimonBasic.ttf') or None for default
         size: Font size in pixels
@@ -74,9 +80,14 @@ def font_load(rel_path: str, size: int):
     
     if runtime_globals.IS_ANDROID and runtime_globals.APP_ROOT:
         full_path = os.path.join(runtime_globals.APP_ROOT, rel_path)
-        return pygame.font.Font(full_path, size)
     else:
-        return pygame.font.Font(rel_path, size)
+        full_path = rel_path
+    
+    key = (full_path, size)
+    font = _font_registry.get(key)
+    if font is None:
+        font = _font_registry[key] = pygame.font.Font(full_path, size)
+    return font
 
 def open_json(rel_path: str, mode='r', encoding='utf-8'):
     """
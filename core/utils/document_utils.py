@@ -1,7 +1,12 @@
+import hashlib
 import os
 import json
+import sys
 from typing import List, Dict, Optional
 
+# Bump when the generated HTML changes, so existing guides are rebuilt once
+MANIFEST_VERSION = 1
+
 
 class DocumentationBuilder:
     """
@@ -20,6 +25,8 @@ class DocumentationBuilder:
         self.docs_dir = os.path.join(project_root, "Documentation")
         self.template_path = os.path.join(project_root, "game", "core", "utils", "module-guide_template.html")
         self.output_path = os.path.join(self.docs_dir, "pages", "module-guide.html")
+        # Fingerprint of the inputs the current guide was built from (see is_up_to_date)
+        self.manifest_path = os.path.join(self.docs_dir, "pages", "module-guide.manifest.json")
     
     def scan_modules(self) -> List[Dict[str, Optional[str]]]:
         """
@@ -100,6 +107,81 @@ class DocumentationBuilder:
             "doc_path": f"../../modules/{module_name}/documentation/index.html"
         }
     
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _write_manifest(self, fingerprint: dict) -> None:
+        try:
+            with open(self.manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(fingerprint, f, indent=1, sort_keys=True)
+        except OSError as e:
+            print(f"Could not write module guide manifest: {e}")
+
+    def fingerprint(self, previous: dict = None) -> Dict:
+        """
+        Describe every input of the module guide without reading the modules' files.
+        
+        Only stat() calls are made; module.json is hashed only when its mtime or
+        size differ from the previous fingerprint, so touching a file without
+        changing it does not cause a rebuild.
+        
+        Args:
+            previous: Fingerprint from the manifest, to reuse module.json hashes
+            
+        Returns:
+            Dictionary that is equal to previous if the guide would come out the same
+        """
+        previous_modules = (previous or {}).get("modules", {})
+        modules = {}
+        if os.path.isdir(self.modules_dir):
+            for module_name in sorted(os.listdir(self.modules_dir)):
+                module_path = os.path.join(self.modules_dir, module_name)
+                if not os.path.isdir(module_path):
+                    continue
+                entry = {
+                    "documentation": os.path.exists(os.path.join(module_path, "documentation", "index.html")),
+                    "logo": os.path.exists(os.path.join(module_path, "logo.png")),
+                    "flag": os.path.exists(os.path.join(module_path, "Flag.png")),
+                    "module_json": None,
+                }
+                module_json_path = os.path.join(module_path, "module.json")
+                try:
+                    stat = os.stat(module_json_path)
+                except OSError:
+                    stat = None
+                if stat is not None:
+                    old = previous_modules.get(module_name, {}).get("module_json")
+                    if old and old[0] == stat.st_mtime_ns and old[1] == stat.st_size:
+                        digest = old[2]
+                    else:
+                        with open(module_json_path, 'rb') as f:
+                            digest = hashlib.sha1(f.read()).hexdigest()
+                    entry["module_json"] = [stat.st_mtime_ns, stat.st_size, digest]
+                modules[module_name] = entry
+
+        try:
+            stat = os.stat(self.template_path)
+            template = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            template = None
+        return {"version": MANIFEST_VERSION, "template": template, "modules": modules}
+
+    @staticmethod
+    def _same_inputs(a: dict, b: dict) -> bool:
+        """Fingerprints are equal apart from module.json mtimes (the hash decides)."""
+        def strip(fingerprint):
+            modules = {
+                name: dict(entry, module_json=entry["module_json"] and entry["module_json"][1:])
+                for name, entry in fingerprint.get("modules", {}).items()
+            }
+            return dict(fingerprint, modules=modules)
+        return strip(a) == strip(b)
+
     def generate_module_cards_html(self, modules: List[Dict[str, Optional[str]]]) -> str:
         """
         Generate HTML for module cards.
@@ -278,12 +360,18 @@ class DocumentationBuilder:
         </style>
         """
     
-    def build_module_guide(self) -> bool:
+    def build_module_guide(self, force: bool = False) -> bool:
         """
         Build the module guide HTML page by scanning modules and updating the template.
         
+        The page is only rewritten when a module, its documentation or the template
+        changed since the last build (see module-guide.manifest.json).
+        
+        Args:
+            force: Rebuild even if the guide is up to date
+        
         Returns:
-            True if successful, False otherwise
+            True if successful (or already up to date), False otherwise
         """
         try:
             # Read template
@@ -291,6 +379,14 @@ class DocumentationBuilder:
                 print(f"Template not found: {self.template_path}")
                 return False
             
+            previous = self._read_manifest()
+            fingerprint = self.fingerprint(previous)
+            if not force and previous and os.path.exists(self.output_path) and self._same_inputs(fingerprint, previous):
+                print("Module guide is up to date")
+                if fingerprint != previous:
+                    self._write_manifest(fingerprint)  # Only mtimes changed; skip hashing next time
+                return True
+            
             with open(self.template_path, 'r', encoding='utf-8') as f:
                 template_content = f.read()
             
@@ -333,6 +429,7 @@ class DocumentationBuilder:
             # Write final content
             with open(self.output_path, 'w', encoding='utf-8') as f:
                 f.write(final_content)
+            self._write_manifest(fingerprint)
             
             print(f"Module guide built successfully with {len(modules)} modules")
             return True
@@ -342,15 +439,26 @@ class DocumentationBuilder:
             return False
 
 
-def build_module_documentation(project_root: str) -> bool:
+def build_module_documentation(project_root: str, force: bool = False) -> bool:
     """
     Convenience function to build module documentation.
     
     Args:
         project_root: Path to the root directory of the Omnipet project
+        force: Rebuild even if nothing changed since the last build
         
     Returns:
         True if successful, False otherwise
     """
     builder = DocumentationBuilder(project_root)
-    return builder.build_module_guide()
+    return builder.build_module_guide(force)
+
+
+if __name__ == "__main__":
+    # Build step for packaging scripts: python -m core.utils.document_utils [--force] [project_root]
+    # asset_utils needs runtime_globals imported first, which opens the mixer; no audio device is needed here
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from core import runtime_globals  # noqa: F401
+    args = [arg for arg in sys.argv[1:] if arg != "--force"]
+    root = args[0] if args else os.getcwd()
+    sys.exit(0 if build_module_documentation(root, force="--force" in sys.argv[1:]) else 1)
@@ -0,0 +1,105 @@
+"""
+Adaptive frame pacing with a low-power rate for idle scenes.
+
+The main loop used to draw and present constants.FRAME_RATE frames a second
+no matter what was on screen, including the main game's screensaver (which
+changes every few seconds) and a napping party. Scenes can now report how
+active they are, and while they report IDLE only constants.LOW_POWER_FPS
+frames a second are drawn:
+
+    while running:
+        for event in pygame.event.get():
+            game.handle_event(event)                 # Input calls frame_pacer.wake()
+        for _ in range(frame_pacer.logic_ticks()):
+            game.update()
+        game.draw(screen, clock)
+        presenter.present(game.rotated)
+        frame_pacer.tick(clock, game.activity_level())   # Instead of clock.tick(FRAME_RATE)
+
+Game logic counts frames at FRAME_RATE (pet animation counters, the
+screensaver timeout, menu fade-out), so in low power logic_ticks() returns
+the number of updates the elapsed time is worth and timers run at the same
+speed; only drawing and presenting are skipped. The low-power wait returns
+as soon as an input event arrives, and the next frame is at full rate again.
+"""
+import time
+
+import pygame
+
+import core.constants as constants
+
+# Activity levels reported by scenes (activity_level())
+ACTIVE = "active"
+IDLE = "idle"
+
+MAX_CATCHUP_SECONDS = 1.0  # Longer gaps (window dragged, system suspended) are not replayed
+
+
+class FramePacer:
+    """Chooses between the full and the low-power frame rate every frame."""
+
+    def __init__(self) -> None:
+        self.low_power = False  # The last tick waited at the low-power rate
+        self._woken = False
+        self._frame_start = None  # time.monotonic() when the current frame's logic started
+        self._carry = 0.0  # Fraction of a logic tick left over from the last low-power frame
+
+        # Metrics (read with stats())
+        self.frames_full = 0
+        self.frames_low = 0
+        self.wakeups = 0
+
+    def wake(self) -> None:
+        """Input arrived: the next frame is drawn at full rate."""
+        self._woken = True
+
+    def logic_ticks(self) -> int:
+        """How many times to call game.update() before drawing this frame. Call once per frame."""
+        now = time.monotonic()
+        previous, self._frame_start = self._frame_start, now
+        if not self.low_power or previous is None:
+            # At full rate every frame is one update, as before
+            self._carry = 0.0
+            return 1
+        # After a low-power wait (also the one a key press ended) catch up on the time it took
+        elapsed = min(max(0.0, now - previous), MAX_CATCHUP_SECONDS)
+        ticks = elapsed * constants.FRAME_RATE + self._carry
+        whole = int(ticks)
+        self._carry = ticks - whole
+        return whole
+
+    def tick(self, clock: pygame.time.Clock, activity: str = ACTIVE) -> None:
+        """Waits until the next frame is due, at the low-power rate when activity is IDLE."""
+        low_fps = getattr(constants, "LOW_POWER_FPS", 0)
+        if low_fps > 0:
+            low_fps = max(getattr(constants, "MIN_LOW_POWER_FPS", 2), low_fps)  # Keeps frames inside pet_scheduler.MAX_STEP_SECONDS
+        low_power = activity == IDLE and low_fps > 0 and low_fps < constants.FRAME_RATE and not self._woken
+        self._woken = False
+
+        if low_power:
+            frame_start = self._frame_start if self._frame_start is not None else time.monotonic()
+            timeout = int((frame_start + 1.0 / low_fps - time.monotonic()) * 1000)
+            if timeout > 0:
+                # Sleep in the event queue so a key press ends the wait right away
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    pygame.event.post(event)
+                    self.wakeups += 1
+                    self.wake()
+            clock.tick()  # Keeps clock.get_fps() meaningful
+            self.frames_low += 1
+        else:
+            clock.tick(constants.FRAME_RATE)
+            self.frames_full += 1
+        self.low_power = low_power
+
+    def stats(self) -> dict:
+        return {
+            "full": self.frames_full,
+            "low": self.frames_low,
+            "wakeups": self.wakeups,
+        }
+
+
+# Shared by the main loop and VirtualPetGame (input wakes it)
+frame_pacer = FramePacer()
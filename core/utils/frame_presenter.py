@@ -0,0 +1,286 @@
+"""
+Presentation of the rendered frame, shared by every entry point.
+
+Scenes draw the whole frame into the render surface every tick (usually a
+cached background plus pets and UI). Uploading and, in scaled fullscreen,
+rescaling all of it every frame is the most expensive part of a frame on
+fbcon/kmsdrm devices, even when only a pet moved a few pixels.
+
+FramePresenter compares each rendered frame with the last one it presented,
+in bands of rows and, on narrow surfaces, then in column tiles, and only
+scales and updates the rectangles that changed:
+
+    presenter = FramePresenter(render_surface, final_screen, scale_to_screen)
+    ...
+    game.draw(render_surface, clock)
+    presenter.present(game.rotated)   # instead of transform.scale + display.flip
+
+Frames with no change (screensaver, a sleeping party between animation steps)
+are not presented at all. When most of the frame changed, a full present is
+cheaper than many small ones and is used instead. Tiles are aligned so that
+scaling a tile gives exactly the pixels a full-frame scale would.
+
+The cost of the diff is kept well below the scale and upload it saves. The
+last frame is kept as one bytearray per band, so checking a band is a single
+memcmp (bytearray == memoryview) and only changed bands are copied back. In
+a changed band the columns are narrowed to one tile-aligned span: once it is
+known, a row costs two memcmps and tiles are only compared to widen it. Wider
+surfaces than TILE_DIFF_MAX_WIDTH (AUTO_RESOLUTION, unscaled windows) skip
+the column search and present changed bands at full width.
+utilities/presenter_benchmark.py times every path.
+
+The scaled frame goes to dest_rect of the display (the whole display by
+default; Android centers a 2x image). Scaling writes straight into a
+subsurface of the display made once, integer factors map tiles exactly and a
+factor of 1 is a plain blit, so a steady frame allocates no frame-sized
+buffers, with one exception: the 180 degree rotation (upside-down mode).
+pygame.transform.flip() has no destination surface, so it allocates a new
+one every present: one per changed rect, scaled straight to its mirrored
+position, or a frame-sized one on full presents and, without scaling, for
+turning the display around in place. A flip into a kept surface through
+memoryviews or array.reverse() avoids that, but measured 6-10 times slower
+than transform.flip() (13.9 ms against 2.2 ms per frame at 1920x1080).
+
+Where the video driver has a renderer, set_scaled_mode() opens the display at
+the game's resolution with pygame.SCALED so SDL does the scaling instead
+(config.json "SCALED_DISPLAY"); the presenter then has nothing to scale.
+
+invalidate() forces the next present to be a full one. Call it after the
+display was changed from outside the render surface (mode change).
+"""
+import math
+
+import pygame
+
+import core.constants as constants
+
+BAND_HEIGHT = 16  # Rows compared at a time
+TILE_WIDTH = 32  # Column granularity of the changed span inside a band
+TILE_DIFF_MAX_WIDTH = 640  # Wider surfaces only compare whole bands
+FULL_PRESENT_RATIO = 0.6  # Above this share of changed pixels, present the whole frame
+
+
+class FramePresenter:
+    """Presents the render surface, uploading only what changed since the last frame."""
+
+    def __init__(self, render_surface: pygame.Surface, display_surface: pygame.Surface, scale: bool = False, dest_rect: pygame.Rect = None) -> None:
+        """
+        Args:
+            render_surface: Surface the game draws into
+            display_surface: The display (pygame.display.set_mode); the render surface itself when not scaling
+            scale: Scale the render surface to dest_rect of the display
+            dest_rect: Where the scaled frame goes (defaults to the whole display)
+        """
+        self.render_surface = render_surface
+        self.display_surface = display_surface
+        self.scale = scale
+        self.dest_rect = pygame.Rect(dest_rect) if dest_rect is not None else display_surface.get_rect()
+        self._dest = display_surface.subsurface(self.dest_rect) if scale else None
+        self._bands = []  # Pixel bytes of the last presented frame, one bytearray per band (reused every frame)
+        self._has_previous = False
+        self._rotated = False
+
+        width, height = render_surface.get_size()
+        native_width, native_height = self.dest_rect.size if scale else (width, height)
+        # Whole-number scale factors map every tile exactly, 1x is a blit
+        if native_width % width == 0 and native_height % height == 0:
+            self._factor = (native_width // width, native_height // height)
+        else:
+            self._factor = None
+        # Step sizes whose scaled size is a whole number of native pixels
+        step_x = width // math.gcd(width, native_width)
+        step_y = height // math.gcd(height, native_height)
+        self.band_height = step_y * max(1, math.ceil(BAND_HEIGHT / step_y))
+        if width <= TILE_DIFF_MAX_WIDTH:
+            self.tile_width = step_x * max(1, math.ceil(TILE_WIDTH / step_x))
+        else:
+            self.tile_width = width  # Changed bands are presented whole
+
+        # Metrics (read with stats())
+        self.frames_full = 0
+        self.frames_partial = 0
+        self.frames_skipped = 0
+
+    def invalidate(self) -> None:
+        """Makes the next present() a full one."""
+        self._has_previous = False
+
+    def present(self, rotated: bool = False) -> None:
+        """Shows the render surface, turned 180 degrees if rotated."""
+        if rotated != self._rotated:
+            self._rotated = rotated
+            self._has_previous = False
+        if not getattr(constants, "DIRTY_RECTS", True):
+            self._present_full()
+            self._has_previous = False
+            return
+
+        rects = self._compare_and_store()
+        if rects is None:
+            self._present_full()
+            return
+        if not rects:
+            self.frames_skipped += 1
+            return
+        width, height = self.render_surface.get_size()
+        if sum(rect.width * rect.height for rect in rects) > FULL_PRESENT_RATIO * width * height:
+            self._present_full()
+            return
+
+        if not self.scale:
+            if self._rotated:
+                self._rotate_in_place()
+                rects = [self._mirror(rect) for rect in rects]
+            pygame.display.update(rects)
+        else:
+            pygame.display.update([self._present_rect(rect) for rect in rects])
+        self.frames_partial += 1
+
+    def _compare_and_store(self):
+        """Changed rects since the last frame (None: no usable last frame), keeping a copy of this one."""
+        buffer = self.render_surface.get_buffer()  # Locks the surface until released
+        current = memoryview(buffer)
+        try:
+            if not self._has_previous or sum(len(band) for band in self._bands) != current.nbytes:
+                band_bytes = self.band_height * self.render_surface.get_pitch()
+                self._bands = [bytearray(current[start:start + band_bytes]) for start in range(0, current.nbytes, band_bytes)]
+                self._has_previous = True
+                return None
+            return self._changed_rects(current)
+        finally:
+            current.release()
+            del buffer
+
+    def _present_full(self) -> None:
+        if self.scale:
+            source = self.render_surface
+            if self._rotated:
+                source = pygame.transform.flip(source, True, True)
+            if self._factor == (1, 1):
+                self._dest.blit(source, (0, 0))
+            else:
+                pygame.transform.scale(source, self._dest.get_size(), self._dest)
+        elif self._rotated:
+            self._rotate_in_place()
+        pygame.display.flip()
+        self.frames_full += 1
+
+    def _rotate_in_place(self) -> None:
+        """Turns the render surface (which is the display when not scaling) 180 degrees."""
+        self.render_surface.blit(pygame.transform.flip(self.render_surface, True, True), (0, 0))
+
+    def _mirror(self, rect: pygame.Rect) -> pygame.Rect:
+        """Where rect ends up in the frame turned 180 degrees."""
+        width, height = self.render_surface.get_size()
+        return pygame.Rect(width - rect.right, height - rect.bottom, rect.width, rect.height)
+
+    def _present_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """Scales one changed region of the render surface into the display surface; returns the display rect."""
+        tile = self.render_surface.subsurface(rect)
+        if self._rotated:
+            tile = pygame.transform.flip(tile, True, True)
+            rect = self._mirror(rect)
+
+        if self._factor is not None:
+            factor_x, factor_y = self._factor
+            target = pygame.Rect(rect.left * factor_x, rect.top * factor_y, rect.width * factor_x, rect.height * factor_y)
+        else:
+            width, height = self.render_surface.get_size()
+            native_width, native_height = self.dest_rect.size
+            left = rect.left * native_width // width
+            top = rect.top * native_height // height
+            right = rect.right * native_width // width
+            bottom = rect.bottom * native_height // height
+            target = pygame.Rect(left, top, right - left, bottom - top)
+
+        if self._factor == (1, 1):
+            self._dest.blit(tile, target)
+        else:
+            pygame.transform.scale(tile, target.size, self._dest.subsurface(target))
+        return target.move(self.dest_rect.topleft)
+
+    def _changed_rects(self, current: memoryview) -> list:
+        """Rectangles (render surface coordinates) that differ from the stored frame; stores the changed bands."""
+        surface = self.render_surface
+        width, height = surface.get_size()
+        rects = []
+        start = 0
+        for index, previous in enumerate(self._bands):
+            band = current[start:start + len(previous)]
+            start += len(previous)
+            if previous == band:  # memcmp
+                continue
+
+            if self.tile_width >= width:
+                span = (0, width)
+            else:
+                span = self._changed_span(previous, band, surface.get_pitch(), width, surface.get_bytesize())
+            previous[:] = band
+            if span is None:
+                continue  # Only the row padding changed
+
+            # A band spanning the same columns as the band above extends its rect
+            top = index * self.band_height
+            left, right = span
+            if rects and rects[-1].bottom == top and rects[-1].left == left and rects[-1].right == right:
+                rects[-1].height = min(height, top + self.band_height) - rects[-1].top
+            else:
+                rects.append(pygame.Rect(left, top, right - left, min(height, top + self.band_height) - top))
+        return rects
+
+    def _changed_span(self, previous: bytearray, band: memoryview, pitch: int, width: int, bytes_per_pixel: int):
+        """
+        Tile-aligned (left, right) columns covering every change inside one changed band,
+        or None if only the row padding changed. Once a span is known, a row costs two
+        memcmps (the parts left and right of it); tiles are only compared to widen it.
+        """
+        row_bytes = width * bytes_per_pixel
+        tile_bytes = self.tile_width * bytes_per_pixel
+        tile_count = math.ceil(width / self.tile_width)
+        first, end = tile_count, 0  # Changed tiles [first, end), empty so far
+        for offset in range(0, len(previous), pitch):
+            row = previous[offset:offset + row_bytes]
+            current = band[offset:offset + row_bytes]
+            if first > end:
+                if row == current:
+                    continue
+            elif row[:first * tile_bytes] == current[:first * tile_bytes] and row[end * tile_bytes:] == current[end * tile_bytes:]:
+                continue
+
+            for tile in range(first):
+                a = tile * tile_bytes
+                if row[a:a + tile_bytes] != current[a:a + tile_bytes]:
+                    first = tile
+                    break
+            for tile in range(tile_count - 1, max(end, first) - 1, -1):
+                a = tile * tile_bytes
+                if row[a:a + tile_bytes] != current[a:a + tile_bytes]:
+                    end = tile + 1
+                    break
+            if first == 0 and end == tile_count:
+                break
+        if first >= end:
+            return None
+        return first * self.tile_width, min(width, end * self.tile_width)
+
+    def stats(self) -> dict:
+        return {
+            "full": self.frames_full,
+            "partial": self.frames_partial,
+            "skipped": self.frames_skipped,
+        }
+
+
+def set_scaled_mode(size: tuple, flags: int = 0, depth: int = 0):
+    """
+    Opens the display at the game's resolution and lets SDL scale it to the
+    window or screen (pygame.SCALED). Returns None if the video driver has no
+    renderer for it (e.g. fbcon); the caller then scales with FramePresenter.
+    """
+    if not hasattr(pygame, "SCALED"):
+        return None
+    try:
+        return pygame.display.set_mode(size, flags | pygame.SCALED, depth)
+    except pygame.error as e:
+        print(f"[Display] SDL scaling not available ({e}), scaling in software")
+        return None
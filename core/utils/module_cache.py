@@ -0,0 +1,172 @@
+"""
+Precompiled module cache.
+
+Each module folder can hold a ``module.cache`` file containing the already
+parsed contents of its JSON files. The cache is a versioned pickle keyed by a
+content hash of the source files, so it stays valid when a build copies the
+module folder (and changes every mtime) but is rebuilt as soon as any JSON
+file is edited.
+
+Prebuild the caches at packaging time with:
+
+    python -m core.utils.module_cache [modules_folder] [--force]
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import pickle
+import sys
+from typing import Optional
+
+CACHE_VERSION = 1
+CACHE_FILENAME = "module.cache"
+CACHE_MAGIC = b"OMNIMC"
+SOURCE_FILES = ("module.json", "monster.json", "battle.json", "item.json", "quests.json", "events.json")
+
+
+class _DataUnpickler(pickle.Unpickler):
+    """Unpickler that only accepts plain JSON-like data (no classes or callables)."""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Forbidden global in module cache: {module}.{name}")
+
+
+def _file_stamps(folder_path: str) -> dict:
+    """Returns {filename: (size, mtime_ns)} for every source file present."""
+    stamps = {}
+    for filename in SOURCE_FILES:
+        try:
+            st = os.stat(os.path.join(folder_path, filename))
+        except OSError:
+            continue
+        stamps[filename] = (st.st_size, st.st_mtime_ns)
+    return stamps
+
+
+def compute_content_hash(folder_path: str) -> str:
+    """SHA-1 over the names and bytes of the module's source JSON files."""
+    digest = hashlib.sha1()
+    for filename in SOURCE_FILES:
+        path = os.path.join(folder_path, filename)
+        if not os.path.exists(path):
+            continue
+        digest.update(filename.encode("utf-8"))
+        with open(path, "rb") as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _read_cache(cache_path: str) -> Optional[dict]:
+    try:
+        with open(cache_path, "rb") as file:
+            if file.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+            payload = _DataUnpickler(io.BytesIO(file.read())).load()
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+        return None
+    return payload
+
+
+def _write_cache(cache_path: str, payload: dict) -> bool:
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as file:
+            file.write(CACHE_MAGIC)
+            pickle.dump(payload, file, protocol=4)
+        os.replace(tmp_path, cache_path)
+        return True
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+
+def build_module_cache(folder_path: str, content_hash: Optional[str] = None) -> Optional[dict]:
+    """
+    Parses every source JSON file in folder_path and writes module.cache.
+    Returns the parsed files, or None if any of them failed to parse.
+    """
+    files = {}
+    for filename in SOURCE_FILES:
+        path = os.path.join(folder_path, filename)
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                files[filename] = json.load(file)
+        except (OSError, ValueError):
+            # Leave broken files to the regular loaders so they report the error
+            return None
+
+    payload = {
+        "version": CACHE_VERSION,
+        "hash": content_hash or compute_content_hash(folder_path),
+        "stamps": _file_stamps(folder_path),
+        "files": files,
+    }
+    _write_cache(os.path.join(folder_path, CACHE_FILENAME), payload)
+    return files
+
+
+def load_module_cache(folder_path: str) -> Optional[dict]:
+    """
+    Returns {filename: parsed JSON} for the module at folder_path.
+
+    Uses module.cache when it matches the source files and regenerates it
+    otherwise. Returns None if the module cannot be cached, in which case the
+    caller should parse the JSON files itself.
+    """
+    cache_path = os.path.join(folder_path, CACHE_FILENAME)
+    payload = _read_cache(cache_path)
+    if payload is not None:
+        stamps = _file_stamps(folder_path)
+        if payload.get("stamps") == stamps:
+            return payload["files"]
+
+        content_hash = compute_content_hash(folder_path)
+        if payload.get("hash") == content_hash:
+            # Same content with new mtimes (e.g. freshly copied build): refresh stamps only
+            payload["stamps"] = stamps
+            _write_cache(cache_path, payload)
+            return payload["files"]
+        return build_module_cache(folder_path, content_hash)
+
+    return build_module_cache(folder_path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Prebuild module.cache files for every module folder.")
+    parser.add_argument("modules_folder", nargs="?", default="modules", help="Folder containing the module folders (default: modules)")
+    parser.add_argument("--force", action="store_true", help="Rebuild caches even if they are up to date")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.modules_folder):
+        print(f"[ModuleCache] Modules folder not found: {args.modules_folder}")
+        return 1
+
+    failed = 0
+    for folder in sorted(os.listdir(args.modules_folder)):
+        folder_path = os.path.join(args.modules_folder, folder)
+        if not os.path.isfile(os.path.join(folder_path, "module.json")):
+            continue
+        if args.force:
+            files = build_module_cache(folder_path)
+        else:
+            files = load_module_cache(folder_path)
+        if files is None:
+            failed += 1
+            print(f"[ModuleCache] {folder}: failed (invalid JSON)")
+        else:
+            size = os.path.getsize(os.path.join(folder_path, CACHE_FILENAME))
+            print(f"[ModuleCache] {folder}: {len(files)} files, {size // 1024} KB")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Cache of shapes derived from a sprite's alpha mask.
+
+Selection outlines in the main game and the contour/sector effects of the
+evolution scene all start with pygame.mask.from_surface(frame). Sprite frames
+are shared and never drawn on (see sprite_cache), so the result only depends
+on the surface, and is kept per surface:
+
+    outline_cache.overlay(frame, color, thickness)   # Pre-rendered outline, blit at (x - pad, y - pad)
+    outline_cache.points(frame)                      # mask.outline() points
+    outline_cache.contour(frame)                     # Edge pixels (4-neighbour), x-major order
+    outline_cache.sectors(frame, step, limit)        # step x step blocks with a visible pixel
+
+Entries are held in a WeakKeyDictionary, so they go away with the surface.
+Nothing is dropped when one pet reloads its sprites: other pets of the same
+species share the frames, and their outlines.
+"""
+import weakref
+
+import pygame
+
+
+class OutlineCache:
+    """Mask-derived data per sprite surface."""
+
+    def __init__(self) -> None:
+        self._entries = weakref.WeakKeyDictionary()  # surface -> {key: value}
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, surface: pygame.Surface, key, build):
+        entry = self._entries.get(surface)
+        if entry is None:
+            entry = self._entries[surface] = {}
+        value = entry.get(key)
+        if value is None:
+            self.misses += 1
+            value = entry[key] = build()
+        else:
+            self.hits += 1
+        return value
+
+    def mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        return self._lookup(surface, "mask", lambda: pygame.mask.from_surface(surface))
+
+    def points(self, surface: pygame.Surface) -> list:
+        """Outline points relative to the surface's top-left corner. Shared, do not modify."""
+        return self._lookup(surface, "points", lambda: self.mask(surface).outline())
+
+    def overlay(self, surface: pygame.Surface, color, thickness: int = 2):
+        """
+        (overlay, pad): the outline drawn on a transparent surface pad pixels
+        larger than the sprite on every side, or (None, 0) for an empty sprite.
+        """
+        return self._lookup(surface, ("overlay", tuple(color), thickness), lambda: self._render_overlay(surface, color, thickness))
+
+    def _render_overlay(self, surface: pygame.Surface, color, thickness: int):
+        points = self.points(surface)
+        if not points:
+            return None, 0
+        pad = thickness
+        width, height = surface.get_size()
+        overlay = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        pygame.draw.lines(overlay, color, True, [(px + pad, py + pad) for px, py in points], thickness)
+        return overlay, pad
+
+    def contour(self, surface: pygame.Surface) -> list:
+        """Visible pixels with a transparent (or out of bounds) 4-neighbour, column by column."""
+        return self._lookup(surface, "contour", lambda: _contour(self.mask(surface)))
+
+    def sectors(self, surface: pygame.Surface, step: int = 5, limit: int = 100) -> list:
+        """Top-left corners of step x step blocks (within limit x limit) with a visible pixel. Returns a new list."""
+        return list(self._lookup(surface, ("sectors", step, limit), lambda: _sectors(self.mask(surface), step, limit)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"surfaces": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _contour(mask: pygame.mask.Mask) -> list:
+    # Interior pixels are set in the mask and in all four neighbours; the rest of the mask is the contour
+    interior = mask.copy()
+    for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+        interior = interior.overlap_mask(mask, (-dx, -dy))
+    edge = mask.copy()
+    edge.erase(interior, (0, 0))
+    width, height = edge.get_size()
+    return [(x, y) for x in range(width) for y in range(height) if edge.get_at((x, y))]
+
+
+def _sectors(mask: pygame.mask.Mask, step: int, limit: int) -> list:
+    block = pygame.mask.Mask((step, step), fill=True)
+    return [
+        (sx, sy)
+        for sx in range(0, limit, step)
+        for sy in range(0, limit, step)
+        if mask.overlap(block, (sx, sy)) is not None
+    ]
+
+
+# Shared by every scene that outlines or dissolves sprites
+outline_cache = OutlineCache()
@@ -1,5 +1,6 @@
 from core import game_globals, runtime_globals
 from core import constants
+from core.utils.outline_cache import outline_cache
 
 def get_selected_pets():
     """
@@ -67,13 +68,11 @@ def distribute_pets_evenly():
         pet.x = int(center_positions[i] - runtime_globals.PET_WIDTH / 2)
         pet.subpixel_x = float(pet.x)
 
-def draw_pet_outline(surface, frame, x, y, color=(255, 255, 0)):
+def draw_pet_outline(surface, frame, x, y, color=(255, 255, 0), thickness=2):
     """
     Draws an outline around a pet sprite frame.
+    The outline is rendered once per (frame, color, thickness) and blitted after that.
     """
-    import pygame
-    mask = pygame.mask.from_surface(frame)
-    outline = mask.outline()
-    if outline:
-        outline = [(x + px, y + py) for px, py in outline]
-        pygame.draw.lines(surface, color, True, outline, 2)
\ No newline at end of file
+    overlay, pad = outline_cache.overlay(frame, color, thickness)
+    if overlay:
+        surface.blit(overlay, (x - pad, y - pad))
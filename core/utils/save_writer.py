@@ -0,0 +1,110 @@
+"""
+Background writer for save files.
+
+The frame thread only takes a snapshot of the game state and hands it to
+submit(); pickling, the temp-file write, fsync, rename and backup rotation run
+on a single daemon thread. Snapshots are coalesced: if a newer one arrives
+while an older one is still waiting, the older one is never written, since the
+newer snapshot already contains everything it had.
+
+    save_writer.submit(snapshot, write_func)   # returns immediately
+    save_writer.flush()                        # blocks until written (e.g. on quit)
+"""
+import threading
+import time
+
+
+class SaveWriter:
+    """Single-slot, coalescing write queue served by one daemon thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Condition()
+        self._pending = None  # (snapshot, write_func) waiting for the thread
+        self._writing = False
+        self._thread = None
+
+        # Metrics (read with stats())
+        self.saves_written = 0
+        self.saves_coalesced = 0
+        self.saves_failed = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.total_duration = 0.0
+
+    def submit(self, snapshot, write_func) -> None:
+        """Queues write_func(snapshot) on the writer thread, replacing any snapshot still waiting."""
+        with self._lock:
+            if self._pending is not None:
+                self.saves_coalesced += 1
+            self._pending = (snapshot, write_func)
+            self._ensure_thread()
+            self._lock.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        """Blocks until every submitted snapshot is written. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._lock.wait(remaining)
+        return True
+
+    @property
+    def queue_depth(self) -> int:
+        """Snapshots waiting or being written (0-2)."""
+        with self._lock:
+            return int(self._pending is not None) + int(self._writing)
+
+    def stats(self) -> dict:
+        with self._lock:
+            average = self.total_duration / self.saves_written if self.saves_written else 0.0
+            return {
+                "queue_depth": int(self._pending is not None) + int(self._writing),
+                "written": self.saves_written,
+                "coalesced": self.saves_coalesced,
+                "failed": self.saves_failed,
+                "last_ms": self.last_duration * 1000,
+                "max_ms": self.max_duration * 1000,
+                "avg_ms": average * 1000,
+            }
+
+    def _ensure_thread(self) -> None:
+        """Starts the writer thread on first use. Caller holds the lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while self._pending is None:
+                    self._lock.wait()
+                snapshot, write_func = self._pending
+                self._pending = None
+                self._writing = True
+
+            start = time.perf_counter()
+            try:
+                write_func(snapshot)
+                failed = False
+            except Exception as e:
+                print(f"[Save] Failed to save game: {e}")
+                failed = True
+            duration = time.perf_counter() - start
+
+            with self._lock:
+                self._writing = False
+                if failed:
+                    self.saves_failed += 1
+                else:
+                    self.saves_written += 1
+                    self.last_duration = duration
+                    self.max_duration = max(self.max_duration, duration)
+                    self.total_duration += duration
+                self._lock.notify_all()
+
+
+# Shared by game_globals.save()
+save_writer = SaveWriter()
@@ -0,0 +1,233 @@
+"""
+Sprite atlas packer.
+
+Packs every pet sprite set of a sprite folder (``monsters`` or ``monsters_hidef``)
+into small PNG pages plus an index of frame rectangles, stored next to it:
+
+    modules/VB/monsters_hidef.atlas/index.json
+    modules/VB/monsters_hidef.atlas/page_0.png
+    ...
+
+At runtime ``sprite_utils.load_sprites_from_atlas`` slices frames out of the
+pages instead of opening a zip and decoding one PNG per frame. Pages are kept
+small and a sprite set never spans two pages, so loading one pet decodes about
+one page and the whole atlas never has to be resident in memory. Sprite sets
+that are missing from the atlas, or whose source zip/folder changed after
+packing, keep using the regular directory/zip loaders.
+
+Build the atlases at packaging time with:
+
+    python -m core.utils.sprite_atlas [--modules modules] [--assets assets] [--force]
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import zipfile
+
+ATLAS_VERSION = 1
+ATLAS_SUFFIX = ".atlas"
+ATLAS_INDEX_FILENAME = "index.json"
+ATLAS_PAGE_SIZE = 256  # One 256x256 page holds a full 15-frame set of 64x56 sprites
+SPRITE_FOLDERS = ("monsters", "monsters_hidef")
+
+
+def get_atlas_dir(sprite_folder_path: str) -> str:
+    """Returns the atlas directory for a sprite folder (e.g. modules/VB/monsters -> modules/VB/monsters.atlas)."""
+    return sprite_folder_path.rstrip("/\\") + ATLAS_SUFFIX
+
+
+def get_source_stamp(sprite_folder_path: str, sprite_name: str):
+    """
+    Cheap fingerprint of a sprite set's source, following the loader order
+    (directory before zip). Returns None if neither exists.
+    """
+    sprite_dir = os.path.join(sprite_folder_path, sprite_name)
+    if os.path.isdir(sprite_dir):
+        count = total = 0
+        for filename in os.listdir(sprite_dir):
+            if filename.lower().endswith(".png"):
+                count += 1
+                total += os.path.getsize(os.path.join(sprite_dir, filename))
+        if count:
+            return ["dir", count, total]
+    sprite_zip = os.path.join(sprite_folder_path, f"{sprite_name}.zip")
+    if os.path.isfile(sprite_zip):
+        return ["zip", os.path.getsize(sprite_zip)]
+    return None
+
+
+def _list_sprite_sets(sprite_folder_path: str) -> list:
+    names = set()
+    for entry in os.listdir(sprite_folder_path):
+        path = os.path.join(sprite_folder_path, entry)
+        if os.path.isdir(path):
+            names.add(entry)
+        elif entry.lower().endswith(".zip"):
+            names.add(entry[:-4])
+    return sorted(names)
+
+
+def _read_frames(sprite_folder_path: str, sprite_name: str) -> dict:
+    """Decodes the source PNGs of one sprite set into {frame name: Surface}."""
+    import pygame
+
+    frames = {}
+    sprite_dir = os.path.join(sprite_folder_path, sprite_name)
+    if os.path.isdir(sprite_dir):
+        for filename in os.listdir(sprite_dir):
+            if filename.lower().endswith(".png"):
+                frames[filename[:-4]] = pygame.image.load(os.path.join(sprite_dir, filename)).convert_alpha()
+        if frames:
+            return frames
+
+    sprite_zip = os.path.join(sprite_folder_path, f"{sprite_name}.zip")
+    if os.path.isfile(sprite_zip):
+        with zipfile.ZipFile(sprite_zip, "r") as zip_file:
+            for zip_entry in zip_file.namelist():
+                if zip_entry.lower().endswith(".png"):
+                    data = zip_file.read(zip_entry)
+                    frames[os.path.basename(zip_entry)[:-4]] = pygame.image.load(io.BytesIO(data)).convert_alpha()
+    return frames
+
+
+class _PagePacker:
+    """Simple shelf packer filling fixed-size pages left to right, top to bottom."""
+
+    def __init__(self, page_size: int) -> None:
+        import pygame
+
+        self.pygame = pygame
+        self.page_size = page_size
+        self.pages = []
+        self._new_page()
+
+    def _new_page(self) -> None:
+        self.pages.append(self.pygame.Surface((self.page_size, self.page_size), self.pygame.SRCALPHA))
+        self.x = self.y = self.shelf_height = 0
+
+    def _fits(self, sizes: list) -> bool:
+        """Returns True if frames of the given sizes fit on the current page."""
+        x, y, shelf_height = self.x, self.y, self.shelf_height
+        for w, h in sizes:
+            if x + w > self.page_size:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            if y + h > self.page_size:
+                return False
+            x += w
+            shelf_height = max(shelf_height, h)
+        return True
+
+    def add_set(self, frames: dict) -> dict:
+        """Places a whole sprite set, starting a new page if it would otherwise be split."""
+        sizes = [surface.get_size() for surface in frames.values()]
+        if (self.x or self.y) and not self._fits(sizes):
+            self._new_page()
+        return {frame: self.add(surface) for frame, surface in frames.items()}
+
+    def add(self, surface) -> list:
+        w, h = surface.get_size()
+        if w > self.page_size or h > self.page_size:
+            raise ValueError(f"Frame of {w}x{h} does not fit in a {self.page_size}px atlas page")
+        if self.x + w > self.page_size:
+            self.x = 0
+            self.y += self.shelf_height
+            self.shelf_height = 0
+        if self.y + h > self.page_size:
+            self._new_page()
+        page = len(self.pages) - 1
+        # BLEND_RGBA_MAX onto a zeroed page copies pixels and alpha exactly
+        self.pages[page].blit(surface, (self.x, self.y), special_flags=self.pygame.BLEND_RGBA_MAX)
+        rect = [page, self.x, self.y, w, h]
+        self.x += w
+        self.shelf_height = max(self.shelf_height, h)
+        return rect
+
+
+def pack_sprite_folder(sprite_folder_path: str, force: bool = False) -> int:
+    """
+    Packs all sprite sets of sprite_folder_path into its atlas directory.
+    Returns the number of packed sprite sets (0 if the atlas was already current).
+    """
+    import pygame
+
+    atlas_dir = get_atlas_dir(sprite_folder_path)
+    index_path = os.path.join(atlas_dir, ATLAS_INDEX_FILENAME)
+    names = _list_sprite_sets(sprite_folder_path)
+    stamps = {name: get_source_stamp(sprite_folder_path, name) for name in names}
+
+    if not force and os.path.isfile(index_path):
+        try:
+            with open(index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+            if index.get("version") == ATLAS_VERSION and {n: s["source"] for n, s in index.get("sprites", {}).items()} == stamps:
+                return 0
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    packer = _PagePacker(ATLAS_PAGE_SIZE)
+    sprites = {}
+    for name in names:
+        try:
+            frames = _read_frames(sprite_folder_path, name)
+        except (OSError, zipfile.BadZipFile, pygame.error) as e:
+            print(f"[SpriteAtlas] Skipping {name}: {e}")
+            continue
+        if not frames:
+            continue
+        if any(w > ATLAS_PAGE_SIZE or h > ATLAS_PAGE_SIZE for w, h in (f.get_size() for f in frames.values())):
+            # Oversized sets keep loading from their zip/folder
+            print(f"[SpriteAtlas] Skipping {name}: frame larger than {ATLAS_PAGE_SIZE}px page")
+            continue
+        sprites[name] = {
+            "source": stamps[name],
+            "frames": packer.add_set(frames),
+        }
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    for filename in os.listdir(atlas_dir):
+        if filename.startswith("page_") and filename.endswith(".png"):
+            os.remove(os.path.join(atlas_dir, filename))
+    for i, page in enumerate(packer.pages):
+        pygame.image.save(page, os.path.join(atlas_dir, f"page_{i}.png"))
+
+    index = {"version": ATLAS_VERSION, "pages": len(packer.pages), "sprites": sprites}
+    with open(index_path, "w", encoding="utf-8") as file:
+        json.dump(index, file, separators=(",", ":"))
+    return len(sprites)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Pack pet sprite folders into sprite atlases.")
+    parser.add_argument("--modules", default="modules", help="Folder containing the module folders (default: modules)")
+    parser.add_argument("--assets", default="assets", help="Shared assets folder (default: assets)")
+    parser.add_argument("--force", action="store_true", help="Repack even if the atlas is up to date")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    roots = [args.assets]
+    if os.path.isdir(args.modules):
+        roots += [os.path.join(args.modules, name) for name in sorted(os.listdir(args.modules))]
+
+    for root in roots:
+        for sprite_folder in SPRITE_FOLDERS:
+            sprite_folder_path = os.path.join(root, sprite_folder)
+            if not os.path.isdir(sprite_folder_path):
+                continue
+            packed = pack_sprite_folder(sprite_folder_path, args.force)
+            status = f"{packed} sprite sets packed" if packed else "up to date"
+            print(f"[SpriteAtlas] {sprite_folder_path}: {status}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
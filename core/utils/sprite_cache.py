@@ -0,0 +1,146 @@
+"""
+Process-wide LRU cache for decoded pet/enemy sprites and their derived variants.
+
+Sprite sets are keyed by everything that changes the decoded result (module
+path, sprite name, target size/scale and resolution preference), so reopening
+the Digidex or fighting an enemy that was already shown costs a dictionary
+lookup instead of opening zips and decoding PNGs again.
+
+Frame subsets (e.g. frame-0 thumbnails) are cached per sprite set, derived surfaces (flipped or
+rescaled frames) are keyed by the surface they were made from; everything
+shares the same LRU and byte budget. Cached surfaces are shared between callers and must not be drawn
+on or have their alpha changed in place - copy them first.
+"""
+from collections import OrderedDict
+
+import pygame
+
+import core.constants as constants
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Approximate memory used by a surface's pixel buffer."""
+    return surface.get_pitch() * surface.get_height()
+
+
+class SpriteCache:
+    """
+    Byte-budgeted LRU cache.
+
+    Values are either a single Surface or a dict of frame name -> Surface.
+    The budget defaults to constants.SPRITE_CACHE_BUDGET_MB (set from config.json)
+    and is read on every insert so a config change applies without a restart.
+    """
+
+    def __init__(self, budget_bytes: int = None) -> None:
+        self._entries = OrderedDict()  # key -> (value, size in bytes)
+        self._budget_bytes = budget_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def budget_bytes(self) -> int:
+        if self._budget_bytes is not None:
+            return self._budget_bytes
+        return int(getattr(constants, "SPRITE_CACHE_BUDGET_MB", 32) * 1024 * 1024)
+
+    def set_budget(self, budget_bytes: int) -> None:
+        """Overrides the configured budget (None goes back to the constant) and trims to fit."""
+        self._budget_bytes = budget_bytes
+        self._evict()
+
+    #-----------------------------------------------------------------
+    # Core LRU
+    #-----------------------------------------------------------------
+
+    def get(self, key):
+        """Returns the cached value for key (marking it recently used) or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def peek(self, key):
+        """Returns the cached value for key without touching LRU order or counters."""
+        entry = self._entries.get(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key, value):
+        """Stores value under key and evicts least recently used entries over budget."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[1]
+
+        if isinstance(value, dict):
+            size = sum(surface_bytes(s) for s in value.values())
+        else:
+            size = surface_bytes(value)
+
+        self._entries[key] = (value, size)
+        self.total_bytes += size
+        self._evict()
+        return value
+
+    def _evict(self) -> None:
+        budget = self.budget_bytes
+        # Always keep the newest entry, even if it alone is over budget
+        while self.total_bytes > budget and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drops every entry (counters are kept)."""
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "budget": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    #-----------------------------------------------------------------
+    # Derived variants
+    #-----------------------------------------------------------------
+
+    def get_flipped(self, surface: pygame.Surface, flip_x: bool = True, flip_y: bool = False) -> pygame.Surface:
+        """Returns a cached mirrored copy of surface."""
+        key = ("flip", surface, flip_x, flip_y)
+        flipped = self.get(key)
+        if flipped is None:
+            flipped = self.put(key, pygame.transform.flip(surface, flip_x, flip_y))
+        return flipped
+
+    def get_scaled(self, surface: pygame.Surface, size: tuple) -> pygame.Surface:
+        """Returns a cached copy of surface scaled to exactly size."""
+        size = (int(size[0]), int(size[1]))
+        if surface.get_size() == size:
+            return surface
+        key = ("scale", surface, size)
+        scaled = self.get(key)
+        if scaled is None:
+            scaled = self.put(key, pygame.transform.scale(surface, size))
+        return scaled
+
+
+# Shared by every sprite loader in the process
+sprite_cache = SpriteCache()
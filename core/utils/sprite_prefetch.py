@@ -0,0 +1,191 @@
+"""
+Background sprite prefetching for scrolling lists and grids.
+
+Lists ask for the sprites of their visible rows (and a margin around them)
+every time they scroll. Sprites that are already in the shared sprite cache
+are returned right away; the rest are queued for worker threads, which do the
+file/zip reads, PNG decoding and scaling. The main thread only turns the
+decoded pixels into converted Surfaces in poll(), a few per frame, so scrolling
+never blocks on disk. Until a sprite arrives the list draws a placeholder.
+
+    sprites = sprite_prefetcher.request(name, module_path, name_format, size=(48, 48),
+                                        priority=0, owner=self)
+    if sprites is None:
+        ...  # draw the placeholder; call sprite_prefetcher.poll() in update()
+"""
+import heapq
+import itertools
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+import pygame
+
+from core import runtime_globals
+from core.utils.sprite_utils import cache_decoded_frames, decode_pet_frames, get_cached_pet_frames, get_frames_cache_key, load_pet_frames
+
+PREFETCH_WORKERS = 2
+PREFETCH_QUEUE_LIMIT = 96  # Pending requests; the least urgent are dropped beyond this
+PREFETCH_RESULTS_PER_POLL = 6  # Surfaces created on the main thread per poll() call
+
+# Request priorities (lower loads first). Rows in the scroll margin use
+# PRIORITY_MARGIN + distance from the visible window.
+PRIORITY_VISIBLE = 0
+PRIORITY_MARGIN = 1
+
+
+class SpritePrefetcher:
+    """Bounded priority queue of sprite loads served by daemon worker threads."""
+
+    def __init__(self, workers: int = PREFETCH_WORKERS, max_pending: int = PREFETCH_QUEUE_LIMIT) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+
+        self._lock = threading.Condition()
+        self._heap = []  # (priority, seq, key); stale entries are skipped
+        self._pending = {}  # key -> [priority, seq, load args, owners]
+        self._in_flight = set()
+        self._results = deque()  # (key, load args, decoded frames or None if the worker failed)
+        self._seq = itertools.count()
+        self._threads = []
+
+        # Incremented whenever poll() delivers sprites, so views know to refresh
+        self.generation = 0
+        self.loaded = 0
+        self.dropped = 0
+
+    #-----------------------------------------------------------------
+    # Main thread API
+    #-----------------------------------------------------------------
+
+    def request(self, pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = ("0",), priority: int = PRIORITY_VISIBLE, owner=None) -> Optional[Dict[str, pygame.Surface]]:
+        """
+        Returns the requested frames (same as load_pet_frames) if they are cached,
+        otherwise queues them for the workers and returns None.
+        Requesting something already queued only raises its priority.
+        """
+        cached = get_cached_pet_frames(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+        if cached is not None:
+            return dict(cached)
+
+        key = get_frames_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+        with self._lock:
+            if key in self._in_flight:
+                return None
+
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[3].add(owner)
+                if priority < entry[0]:
+                    entry[0] = priority
+                    entry[1] = next(self._seq)
+                    heapq.heappush(self._heap, (entry[0], entry[1], key))
+                return None
+
+            if len(self._pending) >= self.max_pending:
+                worst_key = max(self._pending, key=lambda k: self._pending[k][:2])
+                if self._pending[worst_key][0] <= priority:
+                    self.dropped += 1
+                    return None
+                del self._pending[worst_key]
+                self.dropped += 1
+
+            seq = next(self._seq)
+            args = (pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+            self._pending[key] = [priority, seq, args, {owner}]
+            heapq.heappush(self._heap, (priority, seq, key))
+            self._ensure_workers()
+            self._lock.notify()
+        return None
+
+    def cancel(self, owner) -> None:
+        """Drops queued requests made by owner (e.g. rows that scrolled away). Loads already running still finish."""
+        with self._lock:
+            for key in list(self._pending):
+                owners = self._pending[key][3]
+                owners.discard(owner)
+                if not owners:
+                    del self._pending[key]
+
+    def poll(self, max_results: int = PREFETCH_RESULTS_PER_POLL) -> int:
+        """
+        Converts finished loads into Surfaces and stores them in the sprite cache.
+        Call from the main thread (e.g. in a component's update()). Returns the number delivered.
+        A load the worker failed is retried synchronously; if that fails too nothing is
+        cached, so the next request() queues it again.
+        """
+        delivered = 0
+        while delivered < max_results:
+            with self._lock:
+                if not self._results:
+                    break
+                key, args, decoded = self._results.popleft()
+            try:
+                if decoded is None:
+                    load_pet_frames(*args)
+                else:
+                    cache_decoded_frames(key, decoded)
+            except Exception as e:
+                runtime_globals.game_console.log(f"[SpritePrefetch] Failed to create surfaces for {key}: {e}")
+            with self._lock:
+                self._in_flight.discard(key)
+            delivered += 1
+
+        if delivered:
+            self.loaded += delivered
+            self.generation += 1
+        return delivered
+
+    def is_busy(self) -> bool:
+        """True while requests are queued, loading or waiting for poll()."""
+        with self._lock:
+            return bool(self._pending or self._in_flight)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "in_flight": len(self._in_flight),
+                "loaded": self.loaded,
+                "dropped": self.dropped,
+            }
+
+    #-----------------------------------------------------------------
+    # Workers
+    #-----------------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        """Starts the worker threads on first use. Caller holds the lock."""
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"SpritePrefetch-{len(self._threads)}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_request(self):
+        """Blocks until a request is queued and claims it. Caller holds the lock."""
+        while True:
+            while not self._heap:
+                self._lock.wait()
+            priority, seq, key = heapq.heappop(self._heap)
+            entry = self._pending.get(key)
+            if entry is None or entry[1] != seq:
+                continue  # Cancelled or re-prioritized
+            del self._pending[key]
+            self._in_flight.add(key)
+            return key, entry[2]
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                key, args = self._next_request()
+            try:
+                decoded = decode_pet_frames(*args)
+            except Exception as e:
+                runtime_globals.game_console.log(f"[SpritePrefetch] Failed to load {args[0]}: {e}")
+                decoded = None  # Never cache a failed decode; poll() retries on the main thread
+            with self._lock:
+                self._results.append((key, args, decoded))
+
+
+# Shared by every list and grid
+sprite_prefetcher = SpritePrefetcher()
@@ -2,12 +2,24 @@
 Sprite loading utilities for pets and enemies with fallback support and zip file compatibility.
 """
 import os
+import json
 import zipfile
 import pygame
 import io
+from collections import OrderedDict
 from typing import Dict, List
 from core import runtime_globals
-from core.utils.asset_utils import image_load, resolve_path
+from core.utils.asset_utils import image_load, open_json, resolve_path
+from core.utils.sprite_atlas import ATLAS_INDEX_FILENAME, ATLAS_VERSION, get_atlas_dir, get_source_stamp
+from core.utils.sprite_cache import sprite_cache
+
+# Decoded atlas pages kept around (256x256 RGBA = 256 KB each)
+ATLAS_PAGE_CACHE_LIMIT = 16
+_atlas_indexes = {}
+_atlas_pages = OrderedDict()
+
+# pygame.image.tobytes was added in 2.1.3; older releases (e.g. Debian bookworm's 2.1.2) only have tostring
+_image_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
 
 
 def get_sprite_name(pet_name: str, name_format: str = "$_dmc") -> str:
@@ -53,7 +65,7 @@ def scale_sprite_proportionally(sprite: pygame.Surface, target_size: tuple) -> p
     return pygame.transform.scale(sprite, (new_width, new_height))
 
 
-def load_sprites_from_directory(sprite_path: str, size: tuple = None, scale: float = 1.0) -> Dict[str, pygame.Surface]:
+def load_sprites_from_directory(sprite_path: str, size: tuple = None, scale: float = 1.0, frames: tuple = None, convert: bool = True) -> Dict[str, pygame.Surface]:
     """
     Load all PNG sprites from a directory.
     
@@ -61,6 +73,8 @@ def load_sprites_from_directory(sprite_path: str, size: tuple = None, scale: flo
         sprite_path: Path to directory containing sprites
         size: Target size tuple (width, height) for scaling
         scale: Scale factor if size is not provided
+        frames: Optional frame names (e.g. ("0",)) to load; other files are not decoded
+        convert: convert_alpha() the surfaces (needs the display; pass False off the main thread)
         
     Returns:
         Dictionary mapping filename (without .png) to pygame Surface
@@ -81,10 +95,14 @@ def load_sprites_from_directory(sprite_path: str, size: tuple = None, scale: flo
         runtime_globals.game_console.log(f"[Sprite] Found {len(files)} files in {resolved_path}")
         for filename in files:
             if filename.lower().endswith('.png'):
+                if frames is not None and filename[:-4] not in frames:
+                    continue
                 # Use original relative path for image_load (it handles Android paths internally)
                 file_path = os.path.join(sprite_path, filename)
                 try:
-                    sprite = image_load(file_path).convert_alpha()
+                    sprite = image_load(file_path)
+                    if convert:
+                        sprite = sprite.convert_alpha()
                     
                     # Apply scaling
                     if size:
@@ -105,7 +123,7 @@ def load_sprites_from_directory(sprite_path: str, size: tuple = None, scale: flo
     return sprites
 
 
-def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scale: float = 1.0) -> Dict[str, pygame.Surface]:
+def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scale: float = 1.0, frames: tuple = None, convert: bool = True) -> Dict[str, pygame.Surface]:
     """
     Load sprites from a zip file. Supports sprites in root or in a subfolder.
     
@@ -114,6 +132,8 @@ def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scal
         pet_name: Name of pet (used to check for subfolder)
         size: Target size tuple (width, height) for scaling
         scale: Scale factor if size is not provided
+        frames: Optional frame names (e.g. ("0",)); only those members are read from the zip
+        convert: convert_alpha() the surfaces (needs the display; pass False off the main thread)
         
     Returns:
         Dictionary mapping filename (without .png) to pygame Surface
@@ -130,6 +150,8 @@ def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scal
         with zipfile.ZipFile(resolved_zip_path, 'r') as zip_file:
             # Get list of PNG files in the zip
             png_files = [f for f in zip_file.namelist() if f.lower().endswith('.png')]
+            if frames is not None:
+                png_files = [f for f in png_files if os.path.basename(f)[:-4] in frames]
             
             for zip_entry in png_files:
                 try:
@@ -138,7 +160,9 @@ def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scal
                         sprite_data = sprite_file.read()
                     
                     # Create pygame surface from the data
-                    sprite = pygame.image.load(io.BytesIO(sprite_data)).convert_alpha()
+                    sprite = pygame.image.load(io.BytesIO(sprite_data))
+                    if convert:
+                        sprite = sprite.convert_alpha()
                     
                     # Apply scaling
                     if size:
@@ -165,10 +189,216 @@ def load_sprites_from_zip(zip_path: str, pet_name: str, size: tuple = None, scal
     return sprites
 
 
+def _get_atlas_index(atlas_dir: str):
+    """Returns the parsed atlas index for atlas_dir, or None if there is no usable atlas."""
+    if atlas_dir in _atlas_indexes:
+        return _atlas_indexes[atlas_dir]
+
+    index = None
+    index_path = os.path.join(atlas_dir, ATLAS_INDEX_FILENAME)
+    if os.path.isfile(resolve_path(index_path)):
+        try:
+            with open_json(index_path) as file:
+                index = json.load(file)
+            if index.get("version") != ATLAS_VERSION:
+                runtime_globals.game_console.log(f"[Sprite] Ignoring atlas {atlas_dir} with version {index.get('version')}")
+                index = None
+        except (OSError, ValueError) as e:
+            runtime_globals.game_console.log(f"[Sprite] Failed to read atlas index {index_path}: {e}")
+            index = None
+    _atlas_indexes[atlas_dir] = index
+    return index
+
+
+def _get_atlas_page(atlas_dir: str, page: int) -> pygame.Surface:
+    key = (atlas_dir, page)
+    surface = _atlas_pages.get(key)
+    if surface is not None:
+        _atlas_pages.move_to_end(key)
+        return surface
+
+    surface = image_load(os.path.join(atlas_dir, f"page_{page}.png")).convert_alpha()
+    _atlas_pages[key] = surface
+    while len(_atlas_pages) > ATLAS_PAGE_CACHE_LIMIT:
+        _atlas_pages.popitem(last=False)
+    return surface
+
+
+def load_sprites_from_atlas(sprite_folder_path: str, sprite_name: str, size: tuple = None, scale: float = 1.0, frames: tuple = None) -> Dict[str, pygame.Surface]:
+    """
+    Load a sprite set from the packed atlas of a sprite folder (see core.utils.sprite_atlas).
+    
+    Args:
+        sprite_folder_path: Sprite folder that was packed (e.g. 'modules/VB/monsters_hidef')
+        sprite_name: Name of the sprite set (zip/folder name without extension)
+        size: Target size tuple (width, height) for scaling
+        scale: Scale factor if size is not provided
+        frames: Optional frame names (e.g. ("0",)) to slice out
+        
+    Returns:
+        Dictionary mapping frame name to pygame Surface, empty if the set is not packed
+        or its source changed since packing
+    """
+    sprites = {}
+    atlas_dir = get_atlas_dir(sprite_folder_path)
+    index = _get_atlas_index(atlas_dir)
+    if not index:
+        return sprites
+    entry = index.get("sprites", {}).get(sprite_name)
+    if not entry:
+        return sprites
+
+    stamp = get_source_stamp(resolve_path(sprite_folder_path), sprite_name)
+    if stamp is not None and stamp != entry["source"]:
+        runtime_globals.game_console.log(f"[Sprite] Atlas entry for {sprite_name} in {atlas_dir} is stale, using source files")
+        return sprites
+
+    if frames is not None and stamp is not None:
+        # Decoding a whole page for one or two frames is slower than reading just
+        # those members from the source, unless the page is already in memory
+        pages = {rect[0] for frame_name, rect in entry["frames"].items() if frame_name in frames}
+        if any((atlas_dir, page) not in _atlas_pages for page in pages):
+            return sprites
+
+    try:
+        for frame_name, (page, x, y, w, h) in entry["frames"].items():
+            if frames is not None and frame_name not in frames:
+                continue
+            sprite = _get_atlas_page(atlas_dir, page).subsurface((x, y, w, h))
+            
+            # Apply scaling
+            if size:
+                # Use proportional scaling to maintain aspect ratio
+                sprite = scale_sprite_proportionally(sprite, size)
+            elif scale != 1.0:
+                base_size = sprite.get_size()
+                new_size = (int(base_size[0] * scale), int(base_size[1] * scale))
+                sprite = pygame.transform.scale(sprite, new_size)
+            else:
+                # Detach from the page so it can be released
+                sprite = sprite.copy()
+            
+            sprites[frame_name] = sprite
+    except (pygame.error, ValueError, OSError) as e:
+        runtime_globals.game_console.log(f"[Sprite] Failed to load {sprite_name} from atlas {atlas_dir}: {e}")
+        return {}
+
+    return sprites
+
+
+def _sprite_cache_key(pet_name: str, module_path: str, name_format: str, size: tuple, scale: float, module_high_definition_sprites: bool) -> tuple:
+    preference = getattr(runtime_globals, 'sprite_resolution_preference', 0)
+    return (
+        os.path.normpath(module_path),
+        get_sprite_name(pet_name, name_format),
+        tuple(size) if size else None,
+        scale,
+        preference,
+        bool(module_high_definition_sprites),
+    )
+
+
+def get_frames_cache_key(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = None) -> tuple:
+    """Sprite cache key used by load_pet_frames (frames=None: load_pet_sprites) for these arguments."""
+    base_key = _sprite_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites)
+    if frames is None:
+        return ("set",) + base_key
+    return ("frames", _normalize_frames(frames)) + base_key
+
+
+def _normalize_frames(frames) -> tuple:
+    return tuple(sorted(str(frame) for frame in frames))
+
+
 def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False) -> Dict[str, pygame.Surface]:
     """
     Load pet sprites with fallback support and zip file compatibility.
     
+    Results are kept in the shared sprite cache (core.utils.sprite_cache), so loading
+    the same sprite set again does no disk I/O. The returned dict is a fresh copy but
+    the surfaces in it are shared: copy a surface before modifying it.
+    
+    Args:
+        pet_name: Name of the pet
+        module_path: Path to the module folder
+        name_format: Format string for sprite naming (default: "$_dmc")
+        size: Target size tuple (width, height) for scaling
+        scale: Scale factor if size is not provided
+        module_high_definition_sprites: Whether module supports high definition sprites
+        
+    Returns:
+        Dictionary mapping sprite frame names to pygame Surfaces
+    """
+    key = get_frames_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites)
+    sprites = sprite_cache.get(key)
+    if sprites is None:
+        # Missing sprite sets are cached too (as {}) so lists don't probe the disk every time
+        sprites = sprite_cache.put(key, _load_pet_sprites_uncached(pet_name, module_path, name_format, size, scale, module_high_definition_sprites))
+    return dict(sprites)
+
+
+def load_pet_frames(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = None) -> Dict[str, pygame.Surface]:
+    """
+    Load only some frames of a pet's sprite set, e.g. frames=("0",) for list thumbnails.
+    
+    Only the requested PNG files / zip members / atlas rects are decoded and only
+    they are kept in the sprite cache, so browsing hundreds of Digidex entries
+    neither decodes nor caches whole animation sets. frames=None loads every frame,
+    same as load_pet_sprites.
+    
+    Returns:
+        Dictionary mapping the requested frame names that exist to pygame Surfaces
+    """
+    if frames is None:
+        return load_pet_sprites(pet_name, module_path, name_format, size, scale, module_high_definition_sprites)
+
+    sprites = get_cached_pet_frames(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+    if sprites is None:
+        key = get_frames_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+        sprites = sprite_cache.put(key, _load_pet_sprites_uncached(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, _normalize_frames(frames)))
+    return dict(sprites)
+
+
+def get_cached_pet_frames(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = None):
+    """
+    Returns the frames load_pet_frames would return if they are already in the sprite
+    cache (no disk I/O), or None if they would have to be loaded.
+    """
+    key = get_frames_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames)
+    sprites = sprite_cache.get(key)
+    if sprites is None and frames is not None:
+        # A subset can be taken from an already loaded full set
+        full_set = sprite_cache.peek(get_frames_cache_key(pet_name, module_path, name_format, size, scale, module_high_definition_sprites))
+        if full_set is not None:
+            sprites = sprite_cache.put(key, {frame: full_set[frame] for frame in key[1] if frame in full_set})
+    return sprites
+
+
+def decode_pet_frames(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = None) -> Dict[str, tuple]:
+    """
+    Reads, decodes and scales a pet's frames without touching the display, so it can
+    run on a worker thread. Atlases are skipped since their pages are shared surfaces.
+    
+    Returns:
+        Dictionary mapping frame name to (RGBA bytes, (width, height)); pass it to
+        cache_decoded_frames on the main thread
+    """
+    if frames is not None:
+        frames = _normalize_frames(frames)
+    sprites = _load_pet_sprites_uncached(pet_name, module_path, name_format, size, scale, module_high_definition_sprites, frames, convert=False)
+    return {frame: (_image_to_bytes(sprite, "RGBA"), sprite.get_size()) for frame, sprite in sprites.items()}
+
+
+def cache_decoded_frames(key: tuple, decoded: Dict[str, tuple]) -> Dict[str, pygame.Surface]:
+    """Turns decode_pet_frames output into converted surfaces and stores them in the sprite cache under key."""
+    sprites = {frame: pygame.image.frombuffer(data, frame_size, "RGBA").convert_alpha() for frame, (data, frame_size) in decoded.items()}
+    return sprite_cache.put(key, sprites)
+
+
+def _load_pet_sprites_uncached(pet_name: str, module_path: str, name_format: str = "$_dmc", size: tuple = None, scale: float = 1.0, module_high_definition_sprites: bool = False, frames: tuple = None, convert: bool = True) -> Dict[str, pygame.Surface]:
+    """
+    Load pet sprites from disk with fallback support and zip file compatibility.
+    
     Loading order depends on game_globals.sprite_resolution_preference and module settings:
     - 0 (auto): Use hidef if module supports it, otherwise regular
     - 1 (regular): Try regular first, then hidef if not found
@@ -181,6 +411,8 @@ def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc"
         size: Target size tuple (width, height) for scaling
         scale: Scale factor if size is not provided
         module_high_definition_sprites: Whether module supports high definition sprites
+        frames: Optional frame names to load (None loads every frame)
+        convert: False to return unconverted surfaces and skip atlases (worker threads)
         
     Returns:
         Dictionary mapping sprite frame names to pygame Surfaces
@@ -196,10 +428,16 @@ def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc"
     def try_load_sprites(sprite_folder: str, log_suffix: str) -> Dict[str, pygame.Surface]:
         """Helper to try loading sprites from both directory and zip."""
         runtime_globals.game_console.log(f"[Sprite] Trying to load {pet_name} ({sprite_name}) from {log_suffix}")
-        # Try directory first
+        # Try the packed module atlas first
+        sprites = load_sprites_from_atlas(os.path.join(module_path, sprite_folder), sprite_name, size, scale, frames) if convert else {}
+        if sprites:
+            runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from module {log_suffix} atlas")
+            return sprites
+
+        # Try directory
         module_sprite_dir = os.path.join(module_path, sprite_folder, sprite_name)
         runtime_globals.game_console.log(f"[Sprite] Attempting module directory: {module_sprite_dir}")
-        sprites = load_sprites_from_directory(module_sprite_dir, size, scale)
+        sprites = load_sprites_from_directory(module_sprite_dir, size, scale, frames, convert)
         if sprites:
             runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from module {log_suffix} directory")
             return sprites
@@ -207,15 +445,21 @@ def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc"
         # Try zip file
         module_sprite_zip = os.path.join(module_path, sprite_folder, f"{sprite_name}.zip")
         runtime_globals.game_console.log(f"[Sprite] Attempting module zip: {module_sprite_zip}")
-        sprites = load_sprites_from_zip(module_sprite_zip, sprite_name, size, scale)
+        sprites = load_sprites_from_zip(module_sprite_zip, sprite_name, size, scale, frames, convert)
         if sprites:
             runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from module {log_suffix} zip")
             return sprites
             
+        # Try assets atlas
+        sprites = load_sprites_from_atlas(os.path.join("assets", sprite_folder), sprite_name, size, scale, frames) if convert else {}
+        if sprites:
+            runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from assets {log_suffix} atlas")
+            return sprites
+
         # Try assets directory
         assets_sprite_dir = os.path.join("assets", sprite_folder, sprite_name)
         runtime_globals.game_console.log(f"[Sprite] Attempting assets directory: {assets_sprite_dir}")
-        sprites = load_sprites_from_directory(assets_sprite_dir, size, scale)
+        sprites = load_sprites_from_directory(assets_sprite_dir, size, scale, frames, convert)
         if sprites:
             runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from assets {log_suffix} directory")
             return sprites
@@ -223,7 +467,7 @@ def load_pet_sprites(pet_name: str, module_path: str, name_format: str = "$_dmc"
         # Try assets zip file
         assets_sprite_zip = os.path.join("assets", sprite_folder, f"{sprite_name}.zip")
         runtime_globals.game_console.log(f"[Sprite] Attempting assets zip: {assets_sprite_zip}")
-        sprites = load_sprites_from_zip(assets_sprite_zip, sprite_name, size, scale)
+        sprites = load_sprites_from_zip(assets_sprite_zip, sprite_name, size, scale, frames, convert)
         if sprites:
             runtime_globals.game_console.log(f"Loaded {len(sprites)} sprites for {pet_name} from assets {log_suffix} zip")
             return sprites
@@ -301,3 +545,54 @@ def convert_sprites_to_list(sprites_dict: Dict[str, pygame.Surface], max_frames:
         else:
             break  # Stop at first missing frame
     return sprite_list
+
+
+class FrameVariants:
+    """
+    Mirrored and resized copies of a frame list, made once when the sprites
+    are loaded so draw code only has to blit.
+
+    frames is the list the owner keeps (e.g. runtime_globals.pet_sprites[pet]).
+    Code that swaps a frame in place (the dead frame) is picked up on the next
+    get() for that index. Copies come from sprite_cache, so pets of the same
+    species share them.
+    """
+
+    def __init__(self, frames: List[pygame.Surface], sizes: tuple = ()) -> None:
+        self.frames = frames
+        self.sizes = tuple((int(w), int(h)) for w, h in sizes)
+        self._sources = []
+        self._variants = {}  # (mirrored, size) -> list of surfaces
+        for index in range(len(frames)):
+            self._build(index)
+
+    def _build(self, index: int) -> None:
+        frame = self.frames[index]
+        if index == len(self._sources):
+            self._sources.append(frame)
+        else:
+            self._sources[index] = frame
+        for size in (None,) + self.sizes:
+            sized = frame if frame is None or size is None else sprite_cache.get_scaled(frame, size)
+            for mirrored in (False, True):
+                surface = sprite_cache.get_flipped(sized) if mirrored and sized is not None else sized
+                variant = self._variants.setdefault((mirrored, size), [])
+                if index == len(variant):
+                    variant.append(surface)
+                else:
+                    variant[index] = surface
+
+    def get(self, index: int, mirrored: bool = False, size: tuple = None):
+        """The frame at index, mirrored and/or resized to one of the sizes given at construction."""
+        if not 0 <= index < len(self.frames):
+            return None
+        while len(self._sources) <= index:
+            self._build(len(self._sources))
+        if self._sources[index] is not self.frames[index]:
+            self._build(index)
+        variant = self._variants.get((mirrored, size))
+        if variant is None:
+            # Size that was not precomputed: fall back to the shared cache
+            frame = self.get(index, mirrored)
+            return sprite_cache.get_scaled(frame, size) if frame is not None else None
+        return variant[index]
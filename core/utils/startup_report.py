@@ -0,0 +1,109 @@
+"""
+Startup timing report (--startup-report).
+
+Tracks time-to-first-frame on slow targets (Pi, Android) without needing
+"python -X importtime", which is not available in frozen builds or the
+Android launcher. When enabled, every import statement that loads a new
+module is timed like -X importtime does (cumulative and self time) until the
+first frame is presented, then a summary is printed:
+
+    from core.utils import startup_report
+    if startup_report.requested():      # --startup-report or OMNIPET_STARTUP_REPORT=1
+        startup_report.enable()
+    ...
+    presenter.present()
+    startup_report.first_frame()        # Prints the report once, then stops timing imports
+
+mark() adds later events (e.g. scenes imported on first use) to the output.
+"""
+import builtins
+import os
+import sys
+import threading
+import time
+
+REPORT_TOP_IMPORTS = 20  # Slowest imports listed in the report
+
+_started = time.perf_counter()
+_active = False
+_first_frame_done = False
+_original_import = None
+_records = {}  # module -> [cumulative seconds, self seconds]
+_local = threading.local()  # Per thread stack of [module, seconds spent in nested imports]
+
+
+def requested(argv=None) -> bool:
+    """True if the report was asked for on the command line or in the environment."""
+    argv = sys.argv if argv is None else argv
+    return "--startup-report" in argv or os.environ.get("OMNIPET_STARTUP_REPORT") == "1"
+
+
+def is_active() -> bool:
+    return _active
+
+
+def enable() -> None:
+    """Starts timing imports. Call as early as possible."""
+    global _active, _original_import
+    if _active:
+        return
+    _active = True
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+def _resolve(name, globals, level) -> str:
+    if not level:
+        return name
+    package = (globals or {}).get("__package__") or ""
+    base = package.rsplit(".", level - 1)[0] if level > 1 else package
+    return f"{base}.{name}" if name else base
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    module = _resolve(name, globals, level)
+    if module in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append([module, 0.0])
+    started = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - started
+        _, nested = stack.pop()
+        if stack:
+            stack[-1][1] += elapsed
+        record = _records.setdefault(module, [0.0, 0.0])
+        record[0] += elapsed
+        record[1] += elapsed - nested
+
+
+def mark(label: str, seconds: float = None) -> None:
+    """Prints a timed event (since startup, plus its own duration if given) when the report is enabled."""
+    if not _active:
+        return
+    since_start = (time.perf_counter() - _started) * 1000
+    duration = f" ({seconds * 1000:.1f} ms)" if seconds is not None else ""
+    print(f"[Startup] {since_start:8.1f} ms  {label}{duration}")
+
+
+def first_frame() -> None:
+    """Prints the report the first time it is called and stops timing imports."""
+    global _first_frame_done
+    if _first_frame_done or not _active:
+        return
+    _first_frame_done = True
+    builtins.__import__ = _original_import
+
+    elapsed = (time.perf_counter() - _started) * 1000
+    # Self times add up to the total without counting nested imports twice
+    total = sum(self_time for _, self_time in _records.values())
+    print(f"[Startup] First frame after {elapsed:.1f} ms, {len(_records)} modules imported in {total * 1000:.1f} ms")
+    print(f"[Startup] {'cumulative':>10} | {'self':>8} | module")
+    slowest = sorted(_records.items(), key=lambda item: item[1][0], reverse=True)[:REPORT_TOP_IMPORTS]
+    for module, (cumulative, self_time) in slowest:
+        print(f"[Startup] {cumulative * 1000:8.1f}ms | {self_time * 1000:6.1f}ms | {module}")
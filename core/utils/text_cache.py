@@ -0,0 +1,39 @@
+"""
+Process-wide LRU cache of rendered text surfaces.
+
+Labels, lists, carousels and floating messages render the same short strings
+("MISS", item names, stat values) over and over. text_cache.render() keys the
+result by (font, text, color, antialias, background) and returns the surface
+rendered the first time:
+
+    surface = text_cache.render(font, "MISS", (255, 0, 0))
+
+Fonts come from asset_utils.font_load(), which shares one Font per (path,
+size), so the same string in the same style is only rendered once no matter
+which component asks. Like sprite_cache, returned surfaces are shared and must
+not be drawn on or have their alpha changed in place - copy them first.
+"""
+import core.constants as constants
+from core.utils.sprite_cache import SpriteCache
+
+
+class TextCache(SpriteCache):
+    """Byte-budgeted LRU of rendered text, budget from constants.TEXT_CACHE_BUDGET_MB."""
+
+    @property
+    def budget_bytes(self) -> int:
+        if self._budget_bytes is not None:
+            return self._budget_bytes
+        return int(getattr(constants, "TEXT_CACHE_BUDGET_MB", 4) * 1024 * 1024)
+
+    def render(self, font, text, color, antialias: bool = True, background=None):
+        """Same as font.render(text, antialias, color, background), cached."""
+        key = (font, text, tuple(color), antialias, tuple(background) if background is not None else None)
+        surface = self.get(key)
+        if surface is None:
+            surface = self.put(key, font.render(text, antialias, color, background))
+        return surface
+
+
+# Shared by every component that draws text
+text_cache = TextCache()
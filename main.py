@@ -4,6 +4,11 @@ Handles pygame initialization, video/audio setup, and display management.
 The game logic is handled by the VirtualPetGame class in game/vpet.py
 """
 
+# Time every import until the first frame when asked for (--startup-report)
+from core.utils import startup_report
+if startup_report.requested():
+    startup_report.enable()
+
 import platform
 import pygame
 import os
@@ -13,7 +18,10 @@ import json
 import sys, os
 
 from core import constants
+from core.boot_warmup import boot_warmup
 from core.utils.document_utils import build_module_documentation
+from core.utils.frame_pacer import frame_pacer
+from core.utils.frame_presenter import FramePresenter, set_scaled_mode
 # sys.stderr = open(os.devnull, 'w')  # Commented out to allow error stack traces
 
 # Add game directory to Python path
@@ -147,6 +155,13 @@ def apply_config_to_constants(config):
         max_pets = 1
     constants.MAX_PETS = max_pets
     
+    # Apply sprite cache budget
+    constants.SPRITE_CACHE_BUDGET_MB = max(1, config.get("SPRITE_CACHE_BUDGET_MB", 32))
+    constants.DIRTY_RECTS = config.get("DIRTY_RECTS", True)
+    constants.SCALED_DISPLAY = config.get("SCALED_DISPLAY", False)
+    low_power_fps = config.get("LOW_POWER_FPS", 4)
+    constants.LOW_POWER_FPS = 0 if low_power_fps <= 0 else max(constants.MIN_LOW_POWER_FPS, low_power_fps)
+    
     # Apply debug settings
     constants.DEBUG_MODE = config.get("DEBUG_MODE", config.get("DEBUG", False))
     constants.DEBUG_FILE_LOGGING = config.get("DEBUG_FILE_LOGGING", config.get("LOGGING", False))
@@ -221,13 +236,22 @@ def setup_display():
 
     bit_depth = 32 if IS_PYGAME2 else 16
 
-    # The final screen always uses native resolution if scaling is enabled
-    final_screen = pygame.display.set_mode(
-        (native_width if scale_to_screen else screen_width,
-         native_height if scale_to_screen else screen_height),
-        screen_mode,
-        bit_depth
-    )
+    # With SCALED_DISPLAY, SDL scales the game resolution to the screen where the driver can
+    final_screen = None
+    if scale_to_screen and constants.SCALED_DISPLAY:
+        final_screen = set_scaled_mode((screen_width, screen_height), screen_mode, bit_depth)
+        if final_screen is not None:
+            scale_to_screen = False
+            print(f"[Display] SDL scales {screen_width}x{screen_height} to the screen")
+
+    # Otherwise the final screen uses native resolution if scaling is enabled
+    if final_screen is None:
+        final_screen = pygame.display.set_mode(
+            (native_width if scale_to_screen else screen_width,
+             native_height if scale_to_screen else screen_height),
+            screen_mode,
+            bit_depth
+        )
 
     # Create the render surface if scaling
     render_surface = pygame.Surface((screen_width, screen_height)) if scale_to_screen else final_screen
@@ -259,19 +283,17 @@ def main():
     try:
         game = VirtualPetGame()
         
-        # Build module documentation
-        try:
-            project_root = os.path.dirname(__file__)
-            print("[Init] Building module documentation...")
-            build_module_documentation(project_root)
-        except Exception as e:
-            print(f"[Init] Failed to build module documentation: {e}")
+        # Build module documentation in the background while the boot splash shows
+        project_root = os.path.dirname(__file__)
+        print("[Init] Building module documentation...")
+        boot_warmup.add("Documentation", lambda: build_module_documentation(project_root), detached=True)
         
         print("[Init] Game initialized successfully")
         print("[Game] Starting main game loop...")
         
         running = True
         clock = pygame.time.Clock()
+        presenter = FramePresenter(screen, final_screen, scale_to_screen)
         
         while running:
             # Handle pygame events
@@ -282,20 +304,19 @@ def main():
                 else:
                     game.handle_event(event)
             
-            # Update game state
-            game.update()
+            # Update game state (several updates after a low-power frame, so timers keep pace)
+            for _ in range(frame_pacer.logic_ticks()):
+                game.update()
             
             # Draw game
             game.draw(screen, clock)
 
-            # If scaling, blit scaled render surface to fullscreen display
-            if scale_to_screen:
-                pygame.transform.scale(screen, (native_width, native_height), final_screen)
-
-            pygame.display.flip()
+            # Upload what changed (scaled to the fullscreen display if needed)
+            presenter.present(game.rotated)
+            startup_report.first_frame()
             
-            # Maintain framerate
-            clock.tick(constants.FRAME_RATE)
+            # Maintain framerate (fewer frames while the scene is idle)
+            frame_pacer.tick(clock, game.activity_level())
         
         print("[Game] Shutting down...")
         
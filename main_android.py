@@ -20,6 +20,11 @@ def main():
     pygame.display.set_caption("Omnipet")
     
     try:
+        # Time every import until the first frame when asked for (OMNIPET_STARTUP_REPORT=1)
+        from core.utils import startup_report
+        if startup_report.requested():
+            startup_report.enable()
+
         # Import and configure Android environment BEFORE any other game imports
         from core import runtime_globals
         runtime_globals.APP_ROOT = os.getcwd()
@@ -46,8 +51,15 @@ def main():
         
         # Now import game after environment is configured
         from vpet import VirtualPetGame
+        from core.utils.frame_pacer import frame_pacer
+        from core.utils.frame_presenter import FramePresenter
         game = VirtualPetGame()
         
+        # Upscale 2x using pixel-perfect integer scaling (no interpolation/blur), centered on screen
+        scaled_rect = pygame.Rect(0, 0, game_width * 2, game_height * 2)
+        scaled_rect.center = screen.get_rect().center
+        presenter = FramePresenter(offscreen, screen, scale=True, dest_rect=scaled_rect)
+
         # Main game loop
         clock = pygame.time.Clock()
         running = True
@@ -60,23 +72,17 @@ def main():
                 else:
                     game.handle_event(event)
             
-            game.update()
+            # Several updates after a low-power frame, so timers keep pace
+            for _ in range(frame_pacer.logic_ticks()):
+                game.update()
 
             # Render the game into the offscreen (half-res) surface
             game.draw(offscreen, clock)
 
-            # Upscale 2x using pixel-perfect integer scaling (no interpolation/blur)
-            
-            scaled = pygame.transform.scale(
-                offscreen,
-                (game_width * 2, game_height * 2)
-            )
-            scaled_rect = scaled.get_rect(center=screen.get_rect().center)
-            screen.blit(scaled, scaled_rect)
-            #screen.blit(offscreen, (0, 0))
-
-            pygame.display.flip()
-            clock.tick(30)
+            # Upload what changed, scaled 2x into the middle of the screen
+            presenter.present(game.rotated)
+            startup_report.first_frame()
+            frame_pacer.tick(clock, game.activity_level())
         
         game.save()
         
@@ -134,6 +134,13 @@ def apply_config_to_constants(config):
         max_pets = 1
     constants.MAX_PETS = max_pets
     
+    # Apply sprite cache budget
+    constants.SPRITE_CACHE_BUDGET_MB = max(1, config.get("SPRITE_CACHE_BUDGET_MB", 32))
+    constants.DIRTY_RECTS = config.get("DIRTY_RECTS", True)
+    constants.SCALED_DISPLAY = config.get("SCALED_DISPLAY", False)
+    low_power_fps = config.get("LOW_POWER_FPS", 4)
+    constants.LOW_POWER_FPS = 0 if low_power_fps <= 0 else max(constants.MIN_LOW_POWER_FPS, low_power_fps)
+    
     # Apply debug settings
     constants.DEBUG_MODE = config.get("DEBUG_MODE", config.get("DEBUG", False))
     constants.DEBUG_FILE_LOGGING = config.get("DEBUG_FILE_LOGGING", config.get("LOGGING", False))
@@ -197,6 +204,7 @@ def setup_display():
 
     # Import constants here after pygame is initialized
     from game.core import constants
+    from game.core.utils.frame_presenter import set_scaled_mode
     
     # Update game constants with base resolution
     constants.update_resolution_constants(width=screen_width, height=screen_height)
@@ -214,13 +222,22 @@ def setup_display():
 
     bit_depth = 32 if IS_PYGAME2 else 16
 
-    # The final screen always uses native resolution if scaling is enabled
-    final_screen = pygame.display.set_mode(
-        (native_width if scale_to_screen else screen_width,
-         native_height if scale_to_screen else screen_height),
-        screen_mode,
-        bit_depth
-    )
+    # With SCALED_DISPLAY, SDL scales the game resolution to the screen where the driver can
+    final_screen = None
+    if scale_to_screen and constants.SCALED_DISPLAY:
+        final_screen = set_scaled_mode((screen_width, screen_height), screen_mode, bit_depth)
+        if final_screen is not None:
+            scale_to_screen = False
+            logging.info(f"[Display] SDL scales {screen_width}x{screen_height} to the screen")
+
+    # Otherwise the final screen uses native resolution if scaling is enabled
+    if final_screen is None:
+        final_screen = pygame.display.set_mode(
+            (native_width if scale_to_screen else screen_width,
+             native_height if scale_to_screen else screen_height),
+            screen_mode,
+            bit_depth
+        )
 
     # Create the render surface if scaling
     render_surface = pygame.Surface((screen_width, screen_height)) if scale_to_screen else final_screen
@@ -242,6 +259,11 @@ def setup_display():
 
 def main():
     """Main function to initialize and run the game"""
+    # Time every import until the first frame when asked for (--startup-report)
+    from game.core.utils import startup_report
+    if startup_report.requested():
+        startup_report.enable()
+
     logging.info("[Init] Starting Omnipet Virtual Pet Game...")
     
     # Setup pygame and display
@@ -251,25 +273,26 @@ def main():
     # Import game modules after pygame setup
     from game.core import constants
     from game.vpet import VirtualPetGame
+    from game.core.utils.frame_pacer import frame_pacer
+    from game.core.utils.frame_presenter import FramePresenter
     
     # Initialize and run the game
     try:
         game = VirtualPetGame()
         
-        # Build module documentation
-        try:
-            from game.core.utils.document_utils import build_module_documentation
-            project_root = os.path.dirname(__file__)
-            logging.info("[Init] Building module documentation...")
-            build_module_documentation(project_root)
-        except Exception as e:
-            logging.warning(f"[Init] Failed to build module documentation: {e}")
+        # Build module documentation in the background while the boot splash shows
+        from game.core.boot_warmup import boot_warmup
+        from game.core.utils.document_utils import build_module_documentation
+        project_root = os.path.dirname(__file__)
+        logging.info("[Init] Building module documentation...")
+        boot_warmup.add("Documentation", lambda: build_module_documentation(project_root), detached=True)
         
         logging.info("[Init] Game initialized successfully")
         logging.info("[Game] Starting main game loop...")
         
         running = True
         clock = pygame.time.Clock()
+        presenter = FramePresenter(screen, final_screen, scale_to_screen)
         
         while running:
             # Handle pygame events
@@ -280,20 +303,19 @@ def main():
                 else:
                     game.handle_event(event)
             
-            # Update game state
-            game.update()
+            # Update game state (several updates after a low-power frame, so timers keep pace)
+            for _ in range(frame_pacer.logic_ticks()):
+                game.update()
             
             # Draw game
             game.draw(screen, clock)
 
-            # If scaling, blit scaled render surface to fullscreen display
-            if scale_to_screen:
-                pygame.transform.scale(screen, (native_width, native_height), final_screen)
-
-            pygame.display.flip()
+            # Upload what changed (scaled to the fullscreen display if needed)
+            presenter.present(game.rotated)
+            startup_report.first_frame()
             
-            # Maintain framerate
-            clock.tick(constants.FRAME_RATE)
+            # Maintain framerate (fewer frames while the scene is idle)
+            frame_pacer.tick(clock, game.activity_level())
         
         logging.info("[Game] Shutting down...")
         
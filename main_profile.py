@@ -20,6 +20,7 @@ import sys, os
 
 from core import constants
 from core.utils.document_utils import build_module_documentation
+from core.utils.frame_presenter import FramePresenter, set_scaled_mode
 # sys.stderr = open(os.devnull, 'w')  # Commented out to allow error stack traces
 
 # Add game directory to Python path
@@ -153,6 +154,13 @@ def apply_config_to_constants(config):
         max_pets = 1
     constants.MAX_PETS = max_pets
     
+    # Apply sprite cache budget
+    constants.SPRITE_CACHE_BUDGET_MB = max(1, config.get("SPRITE_CACHE_BUDGET_MB", 32))
+    constants.DIRTY_RECTS = config.get("DIRTY_RECTS", True)
+    constants.SCALED_DISPLAY = config.get("SCALED_DISPLAY", False)
+    low_power_fps = config.get("LOW_POWER_FPS", 4)
+    constants.LOW_POWER_FPS = 0 if low_power_fps <= 0 else max(constants.MIN_LOW_POWER_FPS, low_power_fps)
+    
     # Apply debug settings
     constants.DEBUG_MODE = config.get("DEBUG_MODE", config.get("DEBUG", False))
     constants.DEBUG_FILE_LOGGING = config.get("DEBUG_FILE_LOGGING", config.get("LOGGING", False))
@@ -227,13 +235,22 @@ def setup_display():
 
     bit_depth = 32 if IS_PYGAME2 else 16
 
-    # The final screen always uses native resolution if scaling is enabled
-    final_screen = pygame.display.set_mode(
-        (native_width if scale_to_screen else screen_width,
-         native_height if scale_to_screen else screen_height),
-        screen_mode,
-        bit_depth
-    )
+    # With SCALED_DISPLAY, SDL scales the game resolution to the screen where the driver can
+    final_screen = None
+    if scale_to_screen and constants.SCALED_DISPLAY:
+        final_screen = set_scaled_mode((screen_width, screen_height), screen_mode, bit_depth)
+        if final_screen is not None:
+            scale_to_screen = False
+            print(f"[Display] SDL scales {screen_width}x{screen_height} to the screen")
+
+    # Otherwise the final screen uses native resolution if scaling is enabled
+    if final_screen is None:
+        final_screen = pygame.display.set_mode(
+            (native_width if scale_to_screen else screen_width,
+             native_height if scale_to_screen else screen_height),
+            screen_mode,
+            bit_depth
+        )
 
     # Create the render surface if scaling
     render_surface = pygame.Surface((screen_width, screen_height)) if scale_to_screen else final_screen
@@ -273,6 +290,7 @@ def run_game_loop():
     
     running = True
     clock = pygame.time.Clock()
+    presenter = FramePresenter(screen, final_screen, scale_to_screen)
     frame_count = 0
     
     # Profile for limited time or frames (configurable)
@@ -294,11 +312,8 @@ def run_game_loop():
         # Draw game
         game.draw(screen, clock)
 
-        # If scaling, blit scaled render surface to fullscreen display
-        if scale_to_screen:
-            pygame.transform.scale(screen, (native_width, native_height), final_screen)
-
-        pygame.display.flip()
+        # Upload what changed (scaled to the fullscreen display if needed)
+        presenter.present(game.rotated)
         
         # Maintain framerate
         clock.tick(constants.FRAME_RATE)
@@ -2,42 +2,55 @@
 Scene Boot
 Initial boot scene responsible for setting up the game start.
 Transitions automatically to either Egg Selection or Main Game based on pet list.
+While the splash is showing, the next scene's assets are loaded by core.boot_warmup.
 """
 
 import platform
 import pygame
 import os
-import pickle
 
 from components.window_background import WindowBackground
 from core import game_globals, runtime_globals
+from core.boot_warmup import boot_warmup
+from core.game_freezer import has_frozen_pets
 import core.constants as constants
 from core.utils.module_utils import get_module
 from core.utils.pet_utils import distribute_pets_evenly
 from core.utils.pygame_utils import blit_with_cache, sprite_load_percent
 from core.utils.scene_utils import change_scene
+from core.utils.sprite_cache import sprite_cache
+from core.utils.sprite_utils import cache_decoded_frames, decode_pet_frames, get_frames_cache_key
 
 
 def has_freezer_pets() -> bool:
     """
     Check if there are any pets stored in the freezer save file.
-    Returns True if freezer.pkl exists and contains at least one pet.
+    Returns True if the freezer file exists and contains at least one pet.
     """
-    freezer_path = "save/freezer.pkl"
-    if not os.path.exists(freezer_path):
-        return False
-    
-    try:
-        with open(freezer_path, "rb") as f:
-            freezer_data = pickle.load(f)
-            # Check if any of the freezer pages have pets
-            for page in freezer_data:
-                if hasattr(page, 'pets') and page.pets and any(pet is not None for pet in page.pets):
-                    return True
-            return False
-    except Exception:
-        # If there's any error reading the file, assume no pets
-        return False
+    return has_frozen_pets()
+
+
+def load_pet_data():
+    """Monster data of every saved pet, in pet_list order (boot warmup)."""
+    pet_data = []
+    for pet in game_globals.pet_list:
+        pet_data.append(get_module(pet.module).get_monster(pet.name, pet.version))
+        yield
+    return pet_data
+
+
+def load_module_index():
+    """Indexes the monster.json of every module, so the first lookup doesn't parse it (boot warmup)."""
+    for module in list(runtime_globals.game_modules.values()):
+        module.data.load_monsters()
+        yield
+
+
+def pet_sprite_args(pet) -> tuple:
+    """load_pet_frames() arguments matching GamePet.load_sprite(), for the sprite cache key."""
+    module = get_module(pet.module)
+    size = (runtime_globals.PET_WIDTH, runtime_globals.PET_HEIGHT)
+    return (pet.name, module.folder_path, getattr(module, "name_format", "$_dmc"), size, 1.0, module.high_definition_sprites)
 
 
 #=====================================================================
@@ -84,15 +97,61 @@ class SceneBoot:
         else:
             self.controller_sprite = sprite_load_percent(image_path, percent=100, keep_proportion=True, base_on="width")
         self.boot_timer = int(150 * (constants.FRAME_RATE / 30)) 
+        self.skipped = False
+        self.add_warmup_stages()
         runtime_globals.game_console.log("[SceneBoot] Initialized")
 
+    def add_warmup_stages(self) -> None:
+        """
+        Queues the loading the next scene needs so it runs during the splash.
+        Only what the transition itself depends on is required; the rest is
+        dropped when the player skips and loads on first use instead.
+        """
+        self.decoded_pet_sprites = {}  # pet index -> (sprite cache key, decoded frames)
+        if game_globals.pet_list:
+            boot_warmup.add("Pet data", load_pet_data, required=True)
+            boot_warmup.add("Pet sprite decode", self.decode_pet_sprites)
+            boot_warmup.add("Pet sprites", self.attach_pet_sprites, required=True, main_thread=True)
+            boot_warmup.add("Background", WindowBackground, main_thread=True)
+        else:
+            boot_warmup.add("Freezer summary", has_freezer_pets, required=True)
+        boot_warmup.add("Module index", load_module_index)
+        boot_warmup.add("Sounds", runtime_globals.game_sound.load_sounds)
+
+    def decode_pet_sprites(self):
+        """Reads and decodes the saved pets' sprite sets (warmup worker thread)."""
+        for index, pet in enumerate(game_globals.pet_list):
+            args = pet_sprite_args(pet)
+            key = get_frames_cache_key(*args)
+            if key not in sprite_cache:
+                self.decoded_pet_sprites[index] = (key, decode_pet_frames(*args))
+            yield
+
+    def attach_pet_sprites(self):
+        """
+        Gives every saved pet its sprites, one pet per step (warmup main thread).
+        Sets decoded by the worker only need converting; the rest load as usual.
+        """
+        decode = boot_warmup.get("Pet sprite decode")
+        for index, pet in enumerate(game_globals.pet_list):
+            while index not in self.decoded_pet_sprites and not (decode.finished or boot_warmup.hurry):
+                yield
+            entry = self.decoded_pet_sprites.pop(index, None)
+            # An empty set can mean the sprites are only in an atlas, which the worker does not read
+            if entry is not None and entry[1] and entry[0] not in sprite_cache:
+                cache_decoded_frames(*entry)
+            pet.load_saved_sprite()
+            yield
+
     def update(self) -> None:
         """
         Updates the boot scene, transitioning to the appropriate next scene after the timer expires.
         """
         self.boot_timer -= 1
+        boot_warmup.step()
 
-        if self.boot_timer <= 0:
+        # Without a skip the splash stays up until the warmup is over
+        if self.boot_timer <= 0 and (self.skipped or boot_warmup.is_done()):
             self.transition_to_next_scene()
 
     def draw(self, surface: pygame.Surface) -> None:
@@ -119,18 +178,22 @@ class SceneBoot:
         if event_type in ["A", "B", "START", "LCLICK"]:
             runtime_globals.game_console.log("[SceneBoot] Skipped boot timer with ENTER")
             self.boot_timer = 0
+            self.skipped = True
 
     def transition_to_next_scene(self) -> None:
         """
         Decides whether to transition to Main Game or Egg Selection based on saved pets.
         """
+        boot_warmup.finish(skip=self.skipped)
+
         if game_globals.pet_list:
             change_scene("game")
             runtime_globals.game_console.log("[SceneBoot] Transitioning to MainGame (pets found)")
-            for pet in game_globals.pet_list:
+            pet_data_list = boot_warmup.result("Pet data") or [None] * len(game_globals.pet_list)
+            for pet, pet_data in zip(game_globals.pet_list, pet_data_list):
                 # Refresh evolution data from module
-                module = get_module(pet.module)
-                pet_data = module.get_monster(pet.name, pet.version)
+                if pet_data is None:
+                    pet_data = get_module(pet.module).get_monster(pet.name, pet.version)
                 if pet_data:
                     pet.evolve = pet_data.get("evolve", [])
                 pet.begin_position()
@@ -140,7 +203,7 @@ class SceneBoot:
             distribute_pets_evenly()
         else:
             # No active pets, check if there are pets in the freezer
-            if has_freezer_pets():
+            if boot_warmup.result("Freezer summary", False):
                 change_scene("freezer")
                 runtime_globals.game_console.log("[SceneBoot] Transitioning to Freezer (pets found in freezer)")
             else:
@@ -9,6 +9,7 @@ import random
 from components.ui.ui_manager import UIManager
 from components.ui.background import Background
 from components.ui.button import Button
+from components.ui.label import Label
 from components.ui.title_scene import TitleScene
 from components.ui.pet_selector import PetSelector
 from components.ui.ui_constants import BASE_RESOLUTION
@@ -19,6 +20,8 @@ from core.utils.scene_utils import change_scene
 from core.utils.pet_utils import get_selected_pets
 from core.utils.module_utils import get_module
 from core.utils.quest_event_utils import force_complete_quest, generate_daily_quests, get_hourly_random_event
+from core.utils.sprite_cache import sprite_cache
+from core.utils.text_cache import text_cache
 
 
 #=====================================================================
@@ -96,6 +99,9 @@ class SceneDebug:
         self.left_button = None
         self.exit_button = None
         self.right_button = None
+        self.cache_hits_label = None
+        self.cache_size_label = None
+        self.save_stats_label = None
         
         self._setup_ui()
         
@@ -115,6 +121,18 @@ class SceneDebug:
         self.title_scene = TitleScene(0, 5, title_text)
         self.ui_manager.add_component(self.title_scene)
         
+        # Sprite cache counters (right of the title)
+        stats_font_size = int(self.ui_manager.scale_value(12))
+        self.cache_hits_label = Label(128, 4, "", custom_size=stats_font_size)
+        self.ui_manager.add_component(self.cache_hits_label)
+        self.cache_size_label = Label(128, 16, "", custom_size=stats_font_size)
+        self.ui_manager.add_component(self.cache_size_label)
+        self.text_cache_label = Label(128, 28, "", custom_size=stats_font_size)
+        self.ui_manager.add_component(self.text_cache_label)
+        self.save_stats_label = Label(128, 40, "", custom_size=stats_font_size)
+        self.ui_manager.add_component(self.save_stats_label)
+        self._update_cache_stats()
+        
         # Grid layout for 2x3 option buttons
         button_width = 110
         button_height = 28
@@ -220,6 +238,18 @@ class SceneDebug:
             self.title_scene.set_title(f"DEBUG{page_info}")
             self.title_scene.needs_redraw = True  # Force title redraw
 
+    def _update_cache_stats(self):
+        """Refresh the sprite cache hit/miss/eviction, text cache and save writer labels."""
+        stats = sprite_cache.stats()
+        self.cache_hits_label.set_text(f"Spr H{stats['hits']} M{stats['misses']} E{stats['evictions']}")
+        self.cache_size_label.set_text(f"{stats['entries']} items {stats['bytes'] / 1048576:.1f}/{stats['budget'] // 1048576}MB")
+        text_stats = text_cache.stats()
+        lookups = text_stats['hits'] + text_stats['misses']
+        hit_rate = text_stats['hits'] * 100 // lookups if lookups else 0
+        self.text_cache_label.set_text(f"Txt {hit_rate}% {text_stats['entries']} {text_stats['bytes'] / 1048576:.1f}MB")
+        save_stats = game_globals.get_save_metrics()
+        self.save_stats_label.set_text(f"Save {save_stats['last_ms']:.0f}ms Q{save_stats['queue_depth']}")
+
     def _on_option_selected(self, button_index):
         """Handle option button press."""
         option_index = self.current_page * self.options_per_page + button_index
@@ -263,6 +293,7 @@ class SceneDebug:
             current_pets = get_selected_pets()
             self.pet_selector.set_pets(current_pets)
         
+        self._update_cache_stats()
         self.ui_manager.update()
 
     def draw(self, surface: pygame.Surface) -> None:
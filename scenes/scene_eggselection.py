@@ -25,7 +25,6 @@ from core.utils.utils_unlocks import unlock_item
 from components.ui.ui_constants import BASE_RESOLUTION, BLUE, GRAY, GREEN, PURPLE, YELLOW, RED
 from core.game_digidex import is_pet_unlocked
 from core.utils.utils_unlocks import get_unlocked_backgrounds, is_unlocked
-from core.utils.sprite_utils import load_pet_sprites
 from core.utils.asset_utils import image_load
 
 #=====================================================================
@@ -608,6 +607,7 @@ class SceneEggSelection:
         for egg in available_eggs:
             try:
                 sprite = None
+                sprite_request = None
                 
                 # First, check for device-specific sprite in devices folder
                 devices_folder = os.path.join(module.folder_path, "devices")
@@ -624,23 +624,22 @@ class SceneEggSelection:
                 
                 # If no device sprite found or failed to load, fall back to regular pet sprites
                 if sprite is None:
-                    sprites_dict = load_pet_sprites(
-                        egg["name"], 
-                        module.folder_path, 
-                        module.name_format,
-                        module_high_definition_sprites=module.high_definition_sprites
-                    )
-                    
-                    # Get the first frame (0.png)
-                    if "0" in sprites_dict:
-                        sprite = sprites_dict["0"]
+                    # Only the first frame (0.png) is shown; the grid loads it in the background
+                    sprite_request = {
+                        "pet_name": egg["name"],
+                        "module_path": module.folder_path,
+                        "name_format": module.name_format,
+                        "module_high_definition_sprites": module.high_definition_sprites,
+                        "frames": ("0",),
+                    }
                 
                 # Create grid item with sprite and egg name
                 from components.ui.grid import GridItem
                 grid_item = GridItem(
                     sprite=sprite,
                     text=egg["name"],
-                    data=egg  # Store the full egg data
+                    data=egg,  # Store the full egg data
+                    sprite_request=sprite_request
                 )
                 grid_items.append(grid_item)
                 
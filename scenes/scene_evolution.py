@@ -6,6 +6,7 @@ import core.constants as constants
 from core.utils.pygame_utils import get_font, get_font_alt, sprite_load_percent
 from core.utils.scene_utils import change_scene
 from core.utils.asset_utils import image_load
+from core.utils.outline_cache import outline_cache
 
 # Constants
 FONT_COLOR_DEFAULT = constants.FONT_COLOR_DEFAULT
@@ -151,16 +152,7 @@ class SceneEvolution:
 
     def get_non_transparent_sectors(self, sprite):
         """Splits the sprite into 5x5 sectors, ignoring fully transparent sections."""
-        mask = pygame.mask.from_surface(sprite)
-        sectors = []
-        
-        for sx in range(0, 100, 5):
-            for sy in range(0, 100, 5):
-                # 🔹 Check if sector has at least one visible pixel
-                if any(mask.get_at((sx + dx, sy + dy)) for dx in range(5) for dy in range(5)):
-                    sectors.append((sx, sy))
-        
-        return sectors
+        return outline_cache.sectors(sprite, 5, 100)
     
     def generate_explosion_particles(self, sector_x, sector_y, color=(0, 255, 0)):
         """Creates explosion particles for mega transformation, spreading outward."""
@@ -242,23 +234,8 @@ class SceneEvolution:
             self.switch_phase("mega_orb")
 
     def get_sprite_contour(self, sprite):
-        """Extracts contour pixels from a sprite using edge detection, preventing out-of-bounds errors."""
-        mask = pygame.mask.from_surface(sprite)  # 🔥 Generate sprite mask
-        width, height = sprite.get_width(), sprite.get_height()
-        contour = []
-
-        for x in range(width):
-            for y in range(height):
-                if mask.get_at((x, y)):  # 🔹 Pixel is part of the sprite
-                    # 🔥 Ensure neighboring pixels are within bounds
-                    neighbors = [(1,0), (-1,0), (0,1), (0,-1)]
-                    if not all(
-                        0 <= x + dx < width and 0 <= y + dy < height and mask.get_at((x + dx, y + dy)) 
-                        for dx, dy in neighbors
-                    ):
-                        contour.append((x, y))  # 🔥 Store edge pixel safely
-
-        return contour
+        """Extracts contour pixels from a sprite (pixels with a transparent or out-of-bounds neighbour)."""
+        return list(outline_cache.contour(sprite))
 
     def update_phase_rain(self):
         """Creates and updates falling rain particles."""
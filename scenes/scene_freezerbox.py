@@ -1,5 +1,3 @@
-import os
-import pickle
 
 from components.ui.ui_manager import UIManager
 from components.ui.background import Background
@@ -14,7 +12,7 @@ from components.ui.ui_constants import BASE_RESOLUTION
 from components.window_background import WindowBackground
 from core import game_globals, runtime_globals
 import core.constants as constants
-from core.game_freezer import GameFreezer
+from core.game_freezer import FreezerStore
 from core.utils.scene_utils import change_scene
 from core.utils.pygame_utils import sprite_load
 
@@ -32,7 +30,8 @@ class SceneFreezerBox:
         # Mode tracking
         self.mode = "party"  # "party" or "freezer"
         
-        # Freezer data
+        # Freezer data (FrozenPet summaries; full pets stay on disk until moved to the party)
+        self.freezer_store = FreezerStore()
         self.freezer_pets = self.load_freezer_data()
         self.current_freezer_page = 0
         
@@ -55,7 +54,6 @@ class SceneFreezerBox:
         self.stats_panel = None
         
         self._setup_ui()
-        self.load_current_freezer_sprites()
         
         runtime_globals.game_console.log("[SceneFreezerBox] Freezer scene initialized with UI system (CYAN theme).")
     
@@ -183,7 +181,6 @@ class SceneFreezerBox:
             self.box_page_label.visible = True
             self.box_page_label.set_text(f"Box {self.current_freezer_page + 1}/10")
             #self.ui_manager.set_focused_component(self.freezer_grid)
-            self.load_current_freezer_sprites()
             runtime_globals.game_console.log("[SceneFreezerBox] Switched to box view")
     
     def _on_party_select(self, item):
@@ -237,7 +234,6 @@ class SceneFreezerBox:
         # Refresh freezer grid if visible
         if self.freezer_grid and self.freezer_grid.visible:
             self.freezer_grid.refresh_from_freezer_page(self.freezer_pets[self.current_freezer_page])
-            self.load_current_freezer_sprites()
     
     def _on_exit(self):
         """Handle EXIT button press."""
@@ -280,7 +276,8 @@ class SceneFreezerBox:
                     # Store to freezer
                     if selected_pet in game_globals.pet_list:
                         game_globals.pet_list.remove(selected_pet)
-                        self.freezer_pets[self.current_freezer_page].pets.append(selected_pet)
+                        self.freezer_store.store_pet(self.current_freezer_page, selected_pet)
+                        runtime_globals.pet_sprites.pop(selected_pet, None)
                         runtime_globals.game_console.log(f"Stored {selected_pet.name}.")
                     else:
                         runtime_globals.game_console.log(f"[SceneFreezerBox] Pet {selected_pet.name} not in party list!")
@@ -288,8 +285,7 @@ class SceneFreezerBox:
                 # In freezer mode
                 if getattr(selected_pet, "state", None) == "dead":
                     # Clear (delete) the pet
-                    if selected_pet in self.freezer_pets[self.current_freezer_page].pets:
-                        self.freezer_pets[self.current_freezer_page].pets.remove(selected_pet)
+                    if self.freezer_store.remove_pet(selected_pet):
                         runtime_globals.game_console.log(f"Cleared {selected_pet.name} from freezer.")
                     else:
                         runtime_globals.game_console.log(f"[SceneFreezerBox] Pet {selected_pet.name} not in freezer!")
@@ -298,13 +294,14 @@ class SceneFreezerBox:
                 else:
                     # Move from freezer to party
                     if len(game_globals.pet_list) < constants.MAX_PETS:
-                        if selected_pet in self.freezer_pets[self.current_freezer_page].pets:
-                            self.freezer_pets[self.current_freezer_page].pets.remove(selected_pet)
-                            selected_pet.patch()
+                        # Only now is the full GamePet read from the page file
+                        pet = self.freezer_store.take_pet(selected_pet)
+                        if pet:
+                            pet.patch()
                             # Reset position to fix Y coordinate after resolution changes
-                            selected_pet.begin_position()
-                            game_globals.pet_list.append(selected_pet)
-                            runtime_globals.game_console.log(f"Moved {selected_pet.name} to party.")
+                            pet.begin_position()
+                            game_globals.pet_list.append(pet)
+                            runtime_globals.game_console.log(f"Moved {pet.name} to party.")
                             runtime_globals.game_sound.play("menu")
                         else:
                             runtime_globals.game_console.log(f"[SceneFreezerBox] Pet {selected_pet.name} not in freezer!")
@@ -315,7 +312,7 @@ class SceneFreezerBox:
             # Save updated freezer state, rebuild, and update sprites
             self.save_freezer_data()
             self.freezer_pets[self.current_freezer_page].rebuild()
-            self.load_current_freezer_sprites()
+            self.load_party_sprites()
             
             # Refresh grids AFTER rebuild to ensure correct state
             if self.mode == "party":
@@ -352,62 +349,19 @@ class SceneFreezerBox:
                 runtime_globals.pet_sprites[pet][0] = dead_sprite
                 runtime_globals.pet_sprites[pet][1] = dead_sprite
 
-    def load_current_freezer_sprites(self):
-        # Load sprites for pets on the current freezer page
-        current_page = self.freezer_pets[self.current_freezer_page]
-        for pet in current_page.pets:
+    def load_party_sprites(self):
+        # Party pets need their full animation; freezer thumbnails are loaded by the grid in the background
+        for pet in game_globals.pet_list:
             if pet not in runtime_globals.pet_sprites:
-                pet.load_sprite()
+                pet.load_saved_sprite()
 
 
 
     def load_freezer_data(self):
-        # Use Android-compatible path if running on Android
-        if runtime_globals.IS_ANDROID:
-            try:
-                from android.storage import app_storage_path # type: ignore
-                save_dir = os.path.join(app_storage_path(), "save")
-                os.makedirs(save_dir, exist_ok=True)
-                file_path = os.path.join(save_dir, "freezer.pkl")
-            except Exception as e:
-                print(f"[Freezer] Failed to get Android storage path: {e}")
-                file_path = "save/freezer.pkl"
-        else:
-            file_path = "save/freezer.pkl"
-        
-        if os.path.exists(file_path):
-            with open(file_path, "rb") as f:
-                pets = pickle.load(f)
-                for page in pets:
-                    page.rebuild()
-                return pets
-        else:
-            pets = [GameFreezer([], i, "default_bg", "default_module") for i in range(10)]
-            self.save_freezer_data(pets)
-            return pets
+        return self.freezer_store.pages
 
-    def save_freezer_data(self, pets=None):
-        pets = pets or self.freezer_pets
-        
-        # Use Android-compatible path if running on Android
-        if runtime_globals.IS_ANDROID:
-            try:
-                from android.storage import app_storage_path # type: ignore
-                save_dir = os.path.join(app_storage_path(), "save")
-                os.makedirs(save_dir, exist_ok=True)
-                file_path = os.path.join(save_dir, "freezer.pkl")
-            except Exception as e:
-                print(f"[Freezer] Failed to get Android storage path: {e}")
-                save_dir = "save"
-                file_path = "save/freezer.pkl"
-                os.makedirs(save_dir, exist_ok=True)
-        else:
-            save_dir = "save"
-            file_path = "save/freezer.pkl"
-            os.makedirs(save_dir, exist_ok=True)
-        
-        with open(file_path, "wb") as f:
-            pickle.dump(pets, f)
+    def save_freezer_data(self):
+        self.freezer_store.save()
 
     def update(self):
         self.ui_manager.update()
@@ -16,7 +16,9 @@ from components.window_mainmenu import WindowMenu
 from core import game_globals, runtime_globals
 import core.constants as constants
 from core.game_evolution_entity import GameEvolutionEntity
+from core.pet_scheduler import pet_scheduler
 from core.utils.pet_utils import all_pets_hatched, distribute_pets_evenly, draw_pet_outline, get_selected_pets
+from core.utils.frame_pacer import ACTIVE, IDLE
 from core.utils.pygame_utils import blit_with_cache, get_font
 from core.utils.scene_utils import change_scene
 from core.utils.inventory_utils import add_to_inventory, get_item_by_name
@@ -78,6 +80,7 @@ class SceneMainGame:
         self.cached_static_surface = None
         self._screensaver_cache = None
         self._screensaver_cache_last_frame = 0
+        self._screensaver_active = False  # Set by draw(), read by activity_level()
         # Screensaver rendering caches (create fonts/sprites once)
         from core.utils.asset_utils import font_load
         try:
@@ -139,7 +142,8 @@ class SceneMainGame:
         if not hasattr(runtime_globals, 'last_input_frame'):
             runtime_globals.last_input_frame = self.frame_counter
 
-        # Update pets and poops only if necessary
+        # Run the pet events that are due, then per-frame movement and animation
+        pet_scheduler.advance(game_globals.pet_list)
         for pet in game_globals.pet_list:
             pet.update()
 
@@ -526,7 +530,9 @@ class SceneMainGame:
 
             from core.utils.pygame_utils import blit_with_cache
             blit_with_cache(surface, self._screensaver_cache, (0, 0))
+            self._screensaver_active = True
             return
+        self._screensaver_active = False
 
         # Update the cached static surface if needed
         self.update_static_surface()
@@ -567,6 +573,19 @@ class SceneMainGame:
         # Draw game messages last
         runtime_globals.game_message.draw(surface)
 
+    def activity_level(self) -> str:
+        """
+        IDLE (drawn at constants.LOW_POWER_FPS) while the screensaver shows, or while
+        every pet naps with the menu faded out and no cleaning or event running.
+        """
+        if self._screensaver_active:
+            return IDLE
+        if (game_globals.pet_list and all(pet.state == "nap" for pet in game_globals.pet_list)
+                and self.fade_out_timer <= 0 and not self.cleaning and self.event_stage == 0
+                and not self.lock_inputs and not runtime_globals.evolution_pet):
+            return IDLE
+        return ACTIVE
+
     def draw_pet(self, surface: pygame.Surface, pet, index: int, selected_pets: set, show_hearts: bool) -> None:
         """
         Draws a single pet with selection/outline indicators.
@@ -574,10 +593,7 @@ class SceneMainGame:
         pet.draw(surface)
 
         frame_enum = pet.animation_frames[pet.frame_index]
-        frame = runtime_globals.pet_sprites[pet][frame_enum.value]
-
-        if pet.direction == 1:
-            frame = pygame.transform.flip(frame, True, False)
+        frame = pet.get_sprite(frame_enum.value, mirrored=pet.direction == 1)
 
         if pet in selected_pets:
             draw_pet_outline(surface, frame, pet.x, pet.y, color=constants.FONT_COLOR_BLUE)  # blue outline
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Headless check of the offline catch-up (core/pet_catchup.py).
+
+Builds a random party from a module and runs the same stretch of time twice
+with the same random seed:
+
+    brute force   every tick, the way the pet scheduler drives GamePet
+    catch-up      core.pet_catchup.catch_up()
+
+then prints every pet field that differs, and both run times. Both runs
+include evolution and death (with alert=False: no sounds or sprites); a dead
+pet's removal is left to the game in both.
+
+    python utilities/catchup_harness.py --module DMC --hours 24 --pets 4 --seed 1
+    python utilities/catchup_harness.py --module DMC --hours 6 --evolving --start 2025-01-01T09:00
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from core import game_globals, runtime_globals
+import core.constants as constants
+from core.game_pet import GamePet
+from core.pet_catchup import catch_up
+from core.save_format import pet_from_record, pet_to_record
+from core.utils.module_utils import load_modules
+
+COMPARED_FIELDS = (
+    "name", "stage", "version", "state", "timer", "age_timer", "age", "hunger", "strength", "starvation_counter", "overfeed_timer",
+    "care_food_mistake_timer", "care_strength_mistake_timer", "care_sick_mistake_timer", "care_sleep_mistake_timer",
+    "mistakes", "condition_hearts", "gcell_points", "sick", "injuries", "poop_count_flag", "weight",
+    "vital_values", "dp", "back_to_sleep", "death_save_immunity", "dying",
+)
+
+
+def build_party(module_name: str, count: int, rng: random.Random, evolving: bool = False) -> list:
+    """
+    Random pets of stage 1 and up, with random needs, timers and sleep state.
+    evolving: fed, healthy, awake pets within an hour of their evolution time instead.
+    """
+    module = runtime_globals.game_modules[module_name]
+    monsters = [m for m in module.get_all_monsters() if m.get("stage", 0) >= 1]
+    party = []
+    for _ in range(count):
+        data = dict(rng.choice(monsters))
+        data["module"] = module.name
+        pet = GamePet(data)
+        pet.hunger = rng.randint(0, pet.stomach or 4)
+        pet.strength = rng.randint(0, 4)
+        pet.timer = rng.randint(0, 120) * 60 * constants.FRAME_RATE + rng.randint(0, 60 * constants.FRAME_RATE - 1)
+        pet.age_timer = pet.timer + rng.randint(0, 72 * 60 * 60 * constants.FRAME_RATE)
+        pet.sick = rng.choice((0, 0, 0, pet.heal_doses))
+        pet.mistakes = rng.randint(0, 6)
+        pet.effort = rng.randint(0, 16)
+        if evolving:
+            pet.hunger = pet.stomach or 4
+            pet.strength = 4
+            pet.sick = 0
+            pet.timer = max(0, pet.time - rng.randint(0, 60)) * 60 * constants.FRAME_RATE + rng.randint(0, 60 * constants.FRAME_RATE - 1)
+        elif rng.random() < 0.3:
+            pet.set_state("nap")
+        # A detached copy without sprites, the way pets come out of a save
+        party.append(pet_from_record(pet_to_record(pet)))
+    return party
+
+
+def brute_force(pets: list, start: datetime.datetime, seconds: float) -> None:
+    minute = constants.FRAME_RATE * 60
+    hour = minute * 60
+    day = constants.FRAME_RATE * 86400
+    for tick in range(1, int(seconds * constants.FRAME_RATE) + 1):
+        now = start + datetime.timedelta(seconds=tick / constants.FRAME_RATE)
+        for pet in pets:
+            pet.timer += 1
+            pet.age_timer += 1
+            if pet.age_timer % day == 0:
+                pet.age += 1
+            if pet.state == "nap":
+                pet.sleep_timer += 1
+                pet.check_wake_up(now)
+            if pet.stage <= 0 or pet.state == "dead":
+                continue
+
+            # The scheduler's hour event is due when the timer reaches an hour, before the minute runs
+            hourly = pet.timer % hour == 0
+            if pet.timer % minute == 0:
+                # GamePet.update_minute(), without sounds, sprites or the removal of dead pets
+                if pet.state not in ("nap", "dead"):
+                    pet.update_evolution(now, alert=False)
+                    pet.update_care_rules(now, alert=False)
+                    if pet.state == "pooping":
+                        pet.drop_poop()
+                        pet.set_state("idle")
+                if pet.state != "nap":
+                    pet.update_death_save_counters(alert=False)
+                    pet.update_death_check(alert=False)
+                pet.update_countdowns(now)
+            if hourly and pet.timer % hour == 0 and pet.state not in ("nap", "dead"):
+                pet.update_vital_values_gain()
+
+    for pet in pets:
+        if pet.state not in ("idle", "moving", "nap", "dead"):
+            pet.set_state("idle")
+
+
+def run(party: list, seed: int, simulate) -> tuple:
+    pets = [pet_from_record(pet_to_record(pet)) for pet in party]
+    game_globals.pet_list = pets
+    game_globals.poop_list = []
+    game_globals.unlocks = {}  # Evolutions may unlock special targets
+    game_globals.quests = []
+    random.seed(seed)
+    started = time.perf_counter()
+    simulate(pets)
+    duration = time.perf_counter() - started
+    poops = [poop.jumbo for poop in game_globals.poop_list]
+    return pets, poops, duration
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="DMC")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--pets", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--start", default="2025-01-01T18:00", help="Local time the game was closed")
+    parser.add_argument("--evolving", action="store_true", help="Fed, healthy pets close to their evolution time")
+    args = parser.parse_args()
+
+    runtime_globals.game_console.log = lambda *a, **k: None
+    load_modules()
+    if args.module not in runtime_globals.game_modules:
+        parser.error(f"unknown module {args.module!r}, available: {', '.join(sorted(runtime_globals.game_modules))}")
+    party = build_party(args.module, args.pets, random.Random(args.seed), args.evolving)
+    start = datetime.datetime.fromisoformat(args.start)
+    seconds = args.hours * 3600
+
+    brute, brute_poops, brute_time = run(party, args.seed, lambda pets: brute_force(pets, start, seconds))
+    fast, fast_poops, fast_time = run(party, args.seed, lambda pets: catch_up(pets, start.timestamp(), start.timestamp() + seconds))
+
+    print(f"Brute force: {brute_time * 1000:.1f} ms, catch-up: {fast_time * 1000:.1f} ms")
+    evolved = sum(1 for before, after in zip(party, brute) if (before.name, before.version) != (after.name, after.version))
+    died = sum(1 for pet in brute if pet.state == "dead")
+    print(f"{evolved} of {len(party)} pets evolved, {died} died")
+    mismatches = 0
+    for index, (a, b) in enumerate(zip(brute, fast)):
+        for field in COMPARED_FIELDS:
+            if getattr(a, field, None) != getattr(b, field, None):
+                mismatches += 1
+                print(f"  pet {index} ({a.name}) {field}: brute force {getattr(a, field, None)!r}, catch-up {getattr(b, field, None)!r}")
+    if brute_poops != fast_poops:
+        mismatches += 1
+        print(f"  poops: brute force {len(brute_poops)}, catch-up {len(fast_poops)}")
+
+    print("OK" if mismatches == 0 else f"{mismatches} mismatches")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
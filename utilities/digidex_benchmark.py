@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the in-memory digidex (core/game_digidex.py).
+
+Writes a digidex file with a random share of every bundled module's monsters
+to a temporary directory and times SceneDigidex.build_pet_list() with two ways
+of answering is_pet_unlocked():
+
+    legacy     the old per-call read and JSON parse of the file (kept here for reference)
+    set        the digidex loaded once, a set lookup per call
+
+Every entry of both lists is compared and any difference is printed. The real
+save/digidex.json is never read or written.
+
+    python utilities/digidex_benchmark.py --known 0.17 --rounds 3 --seed 1
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from types import SimpleNamespace
+
+from core import game_globals, runtime_globals
+import core.game_digidex as game_digidex
+from core.utils.asset_utils import open_json, resolve_path
+from core.utils.module_utils import load_modules
+import scenes.scene_digidex as scene_digidex
+
+
+def legacy_is_pet_unlocked(name: str, module: str, version: int) -> bool:
+    """is_pet_unlocked() before the digidex was kept in memory: reads the whole file every call."""
+    resolved = resolve_path(game_digidex.DIGIDEX_PATH)
+    if not os.path.exists(resolved):
+        data = []
+    else:
+        try:
+            with open_json(game_digidex.DIGIDEX_PATH) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            data = []
+    return any(
+        p["name"] == name and p["module"] == module and p["version"] == version
+        for p in data
+    )
+
+
+def timed_build(scene, lookup, rounds: int):
+    """Returns (ms per build_pet_list call, entries of the last call)."""
+    scene_digidex.is_pet_unlocked = lookup  # The scene imported the function by name
+    total = 0.0
+    for _ in range(rounds):
+        game_globals.unlocks = {}  # build_pet_list may unlock digidex rewards
+        started = time.perf_counter()
+        entries = scene_digidex.SceneDigidex.build_pet_list(scene)
+        total += time.perf_counter() - started
+    return total * 1000 / rounds, entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--known", type=float, default=0.17, help="Share of monsters in the digidex")
+    parser.add_argument("--rounds", type=int, default=3, help="build_pet_list calls timed per lookup")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    runtime_globals.game_console.log = lambda *a, **k: None
+    load_modules()
+    rng = random.Random(args.seed)
+
+    monsters = 0
+    entries = []
+    for module in runtime_globals.game_modules.values():
+        for monster in module.get_all_monsters():
+            monsters += 1
+            if rng.random() < args.known:
+                entries.append({"name": monster["name"], "module": module.name, "version": monster["version"]})
+
+    original_lookup = scene_digidex.is_pet_unlocked
+    with tempfile.TemporaryDirectory() as directory:
+        game_digidex.DIGIDEX_PATH = os.path.join(directory, "digidex.json")
+        with open(game_digidex.DIGIDEX_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+        game_digidex._entries = None  # Load the temporary file on first use
+
+        scene = SimpleNamespace(unknown_sprite=None)  # All build_pet_list() reads from the scene
+        legacy_ms, expected = timed_build(scene, legacy_is_pet_unlocked, args.rounds)
+        started = time.perf_counter()
+        game_digidex.is_pet_unlocked("", "", 0)
+        load_ms = (time.perf_counter() - started) * 1000
+        set_ms, got = timed_build(scene, original_lookup, args.rounds)
+    scene_digidex.is_pet_unlocked = original_lookup
+
+    print(f"{monsters} monsters, {len(entries)} known, {args.rounds} rounds")
+    print(f"  legacy {legacy_ms:9.1f} ms per build_pet_list")
+    print(f"  set    {set_ms:9.1f} ms per build_pet_list (after a one-time load of {load_ms:.1f} ms)")
+
+    mismatches = 0
+    for a, b in zip(expected, got):
+        if (a.name, a.module, a.version, a.known) != (b.name, b.module, b.version, b.known):
+            mismatches += 1
+            print(f"  {a.module} v{a.version}: legacy {a.name!r} known={a.known}, set {b.name!r} known={b.known}")
+    if len(expected) != len(got):
+        mismatches += 1
+        print(f"  entries: legacy {len(expected)}, set {len(got)}")
+    print("OK" if mismatches == 0 else f"{mismatches} mismatches")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
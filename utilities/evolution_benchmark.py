@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the compiled evolution rules (core/evolution_rules.py).
+
+For every monster of every bundled module, builds a pet with random stats and
+times three ways of picking its evolution:
+
+    legacy     the old per-call chain of "key in evo" tests (kept here for reference)
+    cold       compiled rules, first check after the pet's stats changed
+    warm       compiled rules, stats unchanged since the last check (the usual minute)
+
+Every choice is compared with the legacy one and any difference is printed.
+
+    python utilities/evolution_benchmark.py --rounds 20 --seed 1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from core import game_globals, runtime_globals
+from core.game_pet import GamePet
+from core.utils.module_utils import load_modules
+
+
+def legacy_find(pet, is_locked):
+    """The evolve list scan GamePet.update_evolution() used before the rules were compiled."""
+    for evo in pet.evolve:
+        def in_range(val, r): return r[0] <= val <= r[1]
+        def in_time_range(time_range):
+            try:
+                now_time = datetime.now().time()
+                start_time = datetime.strptime(time_range[0].strip(), "%H:%M").time()
+                end_time = datetime.strptime(time_range[1].strip(), "%H:%M").time()
+                if start_time < end_time:
+                    return start_time <= now_time <= end_time
+                return now_time >= start_time or now_time <= end_time
+            except Exception:
+                return False
+
+        if (
+            ("jogress" in evo) or ("item" in evo) or
+            ("mistakes" in evo and not in_range(pet.mistakes, evo["mistakes"])) or
+            ("condition_hearts" in evo and not in_range(pet.condition_hearts, evo["condition_hearts"])) or
+            ("training" in evo and not in_range(pet.effort, evo["training"])) or
+            ("overfeed" in evo and not in_range(pet.overfeed, evo["overfeed"])) or
+            ("special_encounter" in evo and not pet.special_encounter) or
+            ("level" in evo and not in_range(pet.level, evo["level"])) or
+            ("quests_completed" in evo and not in_range(pet.quests_completed, evo["quests_completed"])) or
+            ("weight" in evo and not in_range(pet.weight, evo["weight"])) or
+            ("trophies" in evo and not in_range(pet.trophies, evo["trophies"])) or
+            ("vital_values" in evo and not in_range(pet.vital_values, evo["vital_values"])) or
+            ("blue_gcells" in evo and not in_range(pet.get_blue_gcells(), evo["blue_gcells"])) or
+            ("yellow_gcells" in evo and not in_range(pet.get_yellow_gcells(), evo["yellow_gcells"])) or
+            ("red_gcells" in evo and not in_range(pet.get_red_gcells(), evo["red_gcells"])) or
+            ("gcell_level" in evo and not in_range(pet.get_gcell_level(), evo["gcell_level"])) or
+            ("gcell_hatch" in evo and not pet.gcell_fragment) or
+            ("stage-5" in evo and not in_range(pet.enemy_kills[5], evo["stage-5"])) or
+            ("stage-6" in evo and not in_range(pet.enemy_kills[6], evo["stage-6"])) or
+            ("stage-7" in evo and not in_range(pet.enemy_kills[7], evo["stage-7"])) or
+            ("stage-8" in evo and not in_range(pet.enemy_kills[8], evo["stage-8"])) or
+            ("stage-9" in evo and not in_range(pet.enemy_kills[9], evo["stage-9"])) or
+            ("pvp" in evo and not in_range(pet.pvp_wins, evo["pvp"])) or
+            ("sleep_disturbances" in evo and not in_range(pet.sleep_disturbances, evo["sleep_disturbances"])) or
+            ("battles" in evo and not in_range(pet.battles, evo["battles"])) or
+            ("win_count" in evo and not in_range(pet.win, evo["win_count"])) or
+            ("win_ratio" in evo and pet.battles and not in_range((pet.win * 100) // pet.battles, evo["win_ratio"])) or
+            ("time_range" in evo and not in_time_range(evo["time_range"]))
+        ):
+            continue
+
+        if pet.stage > 0:
+            pet_data = runtime_globals.game_modules[pet.module].get_monster(evo["to"], pet.version)
+            if pet_data and pet_data.get("special", False):
+                special_key = pet_data.get("special_key")
+                if special_key and is_locked(special_key):
+                    continue
+        return evo
+    return None
+
+
+def randomize(pet, rng: random.Random) -> None:
+    """Random values for every stat an evolve rule can ask for."""
+    pet.mistakes = rng.randint(0, 6)
+    pet.effort = rng.randint(0, 40)
+    pet.overfeed = rng.randint(0, 6)
+    pet.level = rng.randint(1, 10)
+    pet.quests_completed = rng.randint(0, 5)
+    pet.weight = rng.randint(5, 60)
+    pet.trophies = rng.randint(0, 5)
+    pet.vital_values = rng.randint(0, 9999)
+    pet.gcell_points = rng.randint(0, 472)
+    pet.gcell_fragment = rng.random() < 0.5
+    pet.special_encounter = rng.random() < 0.3
+    pet.enemy_kills = [rng.randint(0, 5) for _ in range(11)]
+    pet.pvp_wins = rng.randint(0, 10)
+    pet.sleep_disturbances = rng.randint(0, 6)
+    pet.battles = rng.randint(0, 40)
+    pet.win = rng.randint(0, pet.battles)
+    if hasattr(pet, "condition_hearts"):
+        pet.condition_hearts = rng.randint(0, pet.condition_hearts_max)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20, help="Random stat sets per monster")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    runtime_globals.game_console.log = lambda *a, **k: None
+    load_modules()
+    game_globals.unlocks = {}
+    rng = random.Random(args.seed)
+
+    totals = {"legacy": 0.0, "cold": 0.0, "warm": 0.0}
+    checks = mismatches = 0
+    for name, module in sorted(runtime_globals.game_modules.items()):
+        started = time.perf_counter()
+        module.get_evolutions(None, None)  # Compiles the module
+        compile_ms = (time.perf_counter() - started) * 1000
+
+        pets = []
+        for monster in module.get_all_monsters():
+            data = dict(monster)
+            data["module"] = module.name
+            pets.append(GamePet(data))
+
+        for pet in pets:
+            is_locked = lambda key, pet=pet: key not in game_globals.unlocks.get(pet.module, ())
+            index = pet.evolution_index()
+            for _ in range(args.rounds):
+                randomize(pet, rng)
+
+                started = time.perf_counter()
+                expected = legacy_find(pet, is_locked)
+                totals["legacy"] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                rule = index.find(pet, is_locked)
+                totals["cold"] += time.perf_counter() - started
+
+                started = time.perf_counter()
+                again = index.find(pet, is_locked)
+                totals["warm"] += time.perf_counter() - started
+
+                checks += 1
+                wanted = expected["to"] if expected else None
+                for got in (rule, again):
+                    if (got.to if got else None) != wanted:
+                        mismatches += 1
+                        print(f"  {name} {pet.name} v{pet.version}: legacy {wanted!r}, compiled {got.to if got else None!r}")
+        print(f"{name:6} {len(pets):4} monsters, compiled in {compile_ms:.1f} ms")
+
+    print(f"{checks} checks")
+    for label, seconds in totals.items():
+        print(f"  {label:6} {seconds * 1000:8.1f} ms total, {seconds * 1e6 / max(1, checks):6.2f} us per check")
+    print("OK" if mismatches == 0 else f"{mismatches} mismatches")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
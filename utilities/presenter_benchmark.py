@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for FramePresenter (core/utils/frame_presenter.py).
+
+For every presenter path (1x blit, integer and fractional scaling, unscaled
+surfaces that are the display, narrow enough for the column walk or presented
+in whole bands) draws a patterned frame and times present() for:
+
+    still      nothing changed since the last frame (skipped)
+    sprite     one 32x32 sprite changed colour
+    moving     one 32x32 sprite moved 4 pixels
+    full       the whole frame changed
+
+next to the full present it replaces (transform.scale + display.flip, or a
+plain flip), with and without upside-down rotation. After every present the
+display is compared with what the full present would have shown and any
+difference is printed (a skipped present leaves the screen as it was, so
+then the frame is compared with the last one presented).
+
+The dummy video driver makes display.update()/flip() almost free, so the
+numbers are the compare, copy and scale work the presenter adds or saves.
+
+    python utilities/presenter_benchmark.py --frames 60
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pygame
+
+pygame.init()
+
+from core.utils.frame_presenter import FramePresenter
+
+# (label, render size, display size or None when the render surface is the display)
+SETUPS = [
+    ("240 1x blit", (240, 240), (240, 240)),
+    ("240 -> 480 (2x)", (240, 240), (480, 480)),
+    ("240 -> 320 (4/3)", (240, 240), (320, 320)),
+    ("480 -> 960 (2x)", (480, 480), (960, 960)),
+    ("480 -> 800 (5/3)", (480, 480), (800, 800)),
+    ("480 unscaled", (480, 480), None),
+    ("1280x720 unscaled", (1280, 720), None),
+    ("1920x1080 unscaled", (1920, 1080), None),
+]
+SCENARIOS = ("still", "sprite", "moving", "full")
+
+
+def draw(surface: pygame.Surface, scenario: str, frame: int) -> None:
+    """Draws frame number frame of a scenario: a tiled background and one sprite."""
+    width, height = surface.get_size()
+    shade = (frame * 37) % 200 if scenario == "full" else 0
+    surface.fill((20 + shade, 40, 60))
+    for x in range(0, width, 24):
+        pygame.draw.line(surface, (60, 90 + shade // 2, 120), (x, 0), (x, height))
+    for y in range(0, height, 24):
+        pygame.draw.line(surface, (90, 60, 120), (0, y), (width, y))
+    if scenario == "sprite":
+        surface.fill((250, (frame * 50) % 256, 0), (width // 2, height // 2, 32, 32))
+    elif scenario == "moving":
+        surface.fill((250, 200, 0), (width // 4 + (frame % 8) * 4, height // 2, 32, 32))
+    else:
+        surface.fill((250, 200, 0), (width // 2, height // 2, 32, 32))
+
+
+def expected_frame(frame_copy: pygame.Surface, size: tuple, rotated: bool) -> pygame.Surface:
+    """What a full present shows for a rendered frame."""
+    if rotated:
+        frame_copy = pygame.transform.flip(frame_copy, True, True)
+    if frame_copy.get_size() != size:
+        frame_copy = pygame.transform.scale(frame_copy, size)
+    return frame_copy
+
+
+def run(render_size: tuple, display_size: tuple, scenario: str, rotated: bool, frames: int):
+    """Returns (presenter ms per frame, full present ms per frame, mismatching frames)."""
+    scale = display_size is not None
+    display = pygame.display.set_mode(display_size if scale else render_size)
+    render = pygame.Surface(render_size).convert() if scale else display
+    reference = pygame.Surface(render_size).convert()
+    presenter = FramePresenter(render, display, scale)
+
+    # Full present, as before the presenter
+    full = 0.0
+    for frame in range(frames):
+        draw(render, scenario, frame)
+        started = time.perf_counter()
+        if scale:
+            source = pygame.transform.flip(render, True, True) if rotated else render
+            pygame.transform.scale(source, display.get_size(), display)
+        elif rotated:
+            render.blit(pygame.transform.flip(render, True, True), (0, 0))
+        pygame.display.flip()
+        full += time.perf_counter() - started
+
+    partial = 0.0
+    mismatches = 0
+    shown = None
+    for frame in range(frames + 1):
+        draw(render, scenario, frame)
+        reference.blit(render, (0, 0))
+        skipped = presenter.frames_skipped
+        started = time.perf_counter()
+        presenter.present(rotated)
+        if frame > 0:  # The first present is always a full one
+            partial += time.perf_counter() - started
+        wanted = pygame.image.tobytes(expected_frame(reference, display.get_size(), rotated), "RGB")
+        if presenter.frames_skipped == skipped:
+            shown = pygame.image.tobytes(display, "RGB")
+        if wanted != shown:
+            mismatches += 1
+    return partial * 1000 / frames, full * 1000 / frames, mismatches, presenter.stats()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=60, help="Frames timed per scenario")
+    args = parser.parse_args()
+
+    mismatches = 0
+    for label, render_size, display_size in SETUPS:
+        for rotated in (False, True):
+            print(f"{label}{' rotated' if rotated else ''}")
+            for scenario in SCENARIOS:
+                partial, full, bad, stats = run(render_size, display_size, scenario, rotated, args.frames)
+                mismatches += bad
+                print(f"  {scenario:7} presenter {partial:7.3f} ms   full present {full:7.3f} ms   "
+                      f"(full {stats['full']}, partial {stats['partial']}, skipped {stats['skipped']})"
+                      f"{f'   {bad} MISMATCHES' if bad else ''}")
+
+    print("OK" if mismatches == 0 else f"{mismatches} mismatching frames")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
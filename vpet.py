@@ -7,29 +7,16 @@ Display and audio initialization is handled by main.py
 import pygame
 import time
 
-# Scenes
 from core import game_globals, runtime_globals
 from core.game_input.system_stats import get_system_stats
 from core.utils.module_utils import load_modules
 from core.utils.pygame_utils import blit_with_cache, load_misc_sprites
 from core import constants
 from core.utils.asset_utils import image_load
-from scenes.scene_battle import SceneBattle
-from scenes.scene_battle_pvp import SceneBattlePvP
-from scenes.scene_boot import SceneBoot
-from scenes.scene_connect import SceneConnect
-from scenes.scene_digidex import SceneDigidex
-from scenes.scene_eggselection import SceneEggSelection
-from scenes.scene_evolution import SceneEvolution
-from scenes.scene_freezerbox import SceneFreezerBox
-from scenes.scene_library import SceneLibrary
-from scenes.scene_settingsmenu import SceneSettingsMenu
-from scenes.scene_sleep import SceneSleep
-from scenes.scene_status import SceneStatus
-from scenes.scene_maingame import SceneMainGame
-from scenes.scene_inventory import SceneInventory
-from scenes.scene_training import SceneTraining
-from scenes.scene_debug import SceneDebug
+from core.utils.frame_pacer import ACTIVE, frame_pacer
+from components.ui.ui_manager import UIManager
+# Scenes are imported on first use (see core/scene_registry.py)
+from core.scene_registry import scene_registry
 
 # Game Version
 runtime_globals.VERSION = "0.9.9"
@@ -48,10 +35,11 @@ class VirtualPetGame:
     def __init__(self) -> None:
         runtime_globals.misc_sprites = load_misc_sprites()
         load_modules()
-        game_globals.load()
-        self.scene = SceneBoot()
+        game_globals.load(load_sprites=False)  # Pet sprites load during the boot splash
+        self.scene = scene_registry.get("boot")()
+        scene_registry.warm("boot")
         print("[Init] Omnibot initialized with SceneBoot")
-        self.rotated = False
+        self.rotated = False  # Upside-down display, passed to FramePresenter.present()
         from core.utils.asset_utils import font_load
         from components.ui.ui_constants import TEXT_FONT
         self.stat_font = font_load(TEXT_FONT, 16)
@@ -112,10 +100,12 @@ class VirtualPetGame:
         if runtime_globals.IS_ANDROID:
             shake_action = runtime_globals.game_input.poll_accelerometer()
             if shake_action:
+                frame_pacer.wake()
                 from core.game_input.input_event import create_simple_event
                 self.scene.handle_event(create_simple_event(shake_action))
         else:
             if runtime_globals.shake_detector.check_for_shake():
+                frame_pacer.wake()
                 from core.game_input.input_event import create_simple_event
                 self.scene.handle_event(create_simple_event("SHAKE"))
             
@@ -151,9 +141,7 @@ class VirtualPetGame:
                 #pointer_y = max(0, min(pointer_y, runtime_globals.SCREEN_HEIGHT - self.mouse_pointer.get_height()))
                 blit_with_cache(surface, self.mouse_pointer, (pointer_x, pointer_y))
 
-        if self.rotated:
-            rotated_surface = pygame.transform.rotate(surface, 180)  # Rotate only the surface
-            surface.blit(rotated_surface, (0, 0))
+        # self.rotated is applied when the frame is presented (FramePresenter.present)
 
     def handle_event(self, event: pygame.event.Event) -> None:
         """
@@ -163,6 +151,7 @@ class VirtualPetGame:
 
         # Pass the input event tuple to the scene if we got one
         if input_event:
+            frame_pacer.wake()
             if self.scene.handle_event(input_event):
                 return
         
@@ -171,6 +160,7 @@ class VirtualPetGame:
             for action in runtime_globals.game_input.get_just_pressed_joystick():
                 # Convert analog actions to directional events
                 if action in ("ANALOG_UP", "ANALOG_DOWN", "ANALOG_LEFT", "ANALOG_RIGHT"):
+                    frame_pacer.wake()
                     from core.game_input.input_event import create_simple_event
                     directional = action.replace("ANALOG_", "")
                     self.scene.handle_event(create_simple_event(directional))
@@ -178,8 +168,14 @@ class VirtualPetGame:
     def poll_gpio_inputs(self):
         from core.game_input.input_event import create_simple_event
         for action in runtime_globals.game_input.get_gpio_just_pressed():
+            frame_pacer.wake()
             self.scene.handle_event(create_simple_event(action))
 
+    def activity_level(self) -> str:
+        """How often the current scene needs drawing (core.utils.frame_pacer); scenes that don't say are ACTIVE."""
+        activity_level = getattr(self.scene, "activity_level", None)
+        return activity_level() if activity_level else ACTIVE
+
     def change_scene(self) -> None:
         """
         Handles changing the current scene based on runtime_globals.game_state.
@@ -187,34 +183,20 @@ class VirtualPetGame:
         runtime_globals.game_state_update = False
         state = runtime_globals.game_state
 
-        scene_mapping = {
-            "egg": SceneEggSelection,
-            "game": SceneMainGame,
-            "settings": SceneSettingsMenu,
-            "status": SceneStatus,
-            "feeding": SceneInventory,
-            "training": SceneTraining,
-            "sleepmenu": SceneSleep,
-            "battle": SceneBattle,
-            "battle_pvp": SceneBattlePvP,
-            "connect": SceneConnect,
-            "digidex": SceneDigidex,
-            "evolution": SceneEvolution,
-            "freezer": SceneFreezerBox,
-            "library": SceneLibrary,
-            "debug": SceneDebug,
-        }
-
-        scene_class = scene_mapping.get(state)
+        if state == "boot":
+            return  # Only shown at startup
+
+        scene_class = scene_registry.get(state)
         if scene_class and type(self.scene) is not scene_class:  # Prevent redundant scene switches
             print(f"[Scene] Switching to {scene_class.__name__}")
             self.scene = scene_class()
+            scene_registry.warm(state)
 
     def save(self) -> None:
         """
-        Saves the current game state.
+        Saves the current game state and waits for the write to finish (used on quit).
         """
-        game_globals.save()
+        game_globals.save(wait=True)
         runtime_globals.game_console.log("[VirtualPetGame] Game state saved.")
 
 
@@ -242,11 +224,12 @@ def draw_system_stats(clock, surface, stats, font):
 
     temp, cpu_usage, memory_usage = stats
     fps = int(clock.get_fps())
-    stats_tuple = (fps, temp, cpu_usage, memory_usage, show_system_stats, show_fps_only)
+    ui_repaints = UIManager.last_components_repainted
+    stats_tuple = (fps, temp, cpu_usage, memory_usage, ui_repaints, show_system_stats, show_fps_only)
 
     # Only update cached surface if stats changed or display mode changed
     if cached_stats_surface is None or stats_tuple != last_stats_values:
-        surface_height = 60 if show_system_stats else 20
+        surface_height = 76 if show_system_stats else 20
         cached_stats_surface = pygame.Surface((140, surface_height), pygame.SRCALPHA)
         y = 0
         
@@ -265,6 +248,8 @@ def draw_system_stats(clock, surface, stats, font):
                 y += 16
             if memory_usage is not None:
                 cached_stats_surface.blit(font.render(f"RAM: {memory_usage:.1f}%", True, (255, 255, 255)), (0, y))
+                y += 16
+            cached_stats_surface.blit(font.render(f"UI repaints: {ui_repaints}", True, (255, 255, 255)), (0, y))
         last_stats_values = stats_tuple
 
     # Blit the cached stats surface